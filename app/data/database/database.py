@@ -17,7 +17,7 @@ from app.data.database import (ai, constants, difficulty_modes, equations,
 from app.data.serialization import disk_loader
 from app.events import event_prefab
 from app.utilities.data_order import parse_order_keys_file
-from app.utilities.serialization import load_json, save_json
+from app.utilities.serialization import load_json, remove_other_files, save_json_if_changed
 from app.utilities.typing import NID
 
 CATEGORY_SUFFIX = '.category'
@@ -120,15 +120,15 @@ class Database(object):
         start = time.perf_counter() * 1000
 
         to_save = self.save()
-        # This section is what takes so long!
+        # Only files whose contents actually changed are written
+        num_files, num_written = 0, 0
         try:
             for key, value in to_save.items():
                 # divide save data into chunks based on key value
                 if key in self.save_as_chunks and main_settings.get_should_save_as_chunks():
                     save_dir = os.path.join(data_dir, key)
-                    if os.path.exists(save_dir):
-                        shutil.rmtree(save_dir)
-                    os.mkdir(save_dir)
+                    if not os.path.isdir(save_dir):
+                        os.mkdir(save_dir)
                     orderkeys: List[str] = []
                     for idx, subvalue in enumerate(value):
                         # ordering
@@ -138,8 +138,11 @@ class Database(object):
                         orderkeys.append(name)
                         save_loc = Path(save_dir, name + '.json')
                         # logging.info("Serializing %s to %s" % ('%s/%s.json' % (key, name), save_loc))
-                        save_json(save_loc, [subvalue])
-                    save_json(Path(save_dir, '.orderkeys'), orderkeys)
+                        num_written += save_json_if_changed(save_loc, [subvalue])
+                    num_written += save_json_if_changed(Path(save_dir, '.orderkeys'), orderkeys)
+                    num_files += len(orderkeys) + 1
+                    # Delete whatever was removed since the last save
+                    remove_other_files(save_dir, [name + '.json' for name in orderkeys] + ['.orderkeys'])
                 else:  # Save as a single file
                     # Which means deleting the old directory
                     save_dir = Path(data_dir, key)
@@ -147,7 +150,8 @@ class Database(object):
                         shutil.rmtree(save_dir)
                     save_loc = Path(data_dir, key + '.json')
                     # logging.info("Serializing %s to %s" % (key, save_loc))
-                    save_json(save_loc, value)
+                    num_written += save_json_if_changed(save_loc, value)
+                    num_files += 1
 
         except OSError as e:  # In case we ran out of memory
             logging.error("Editor was unable to save your project. Free up memory in your hard drive or try saving somewhere else, otherwise progress will be lost when the editor is closed.")
@@ -155,6 +159,7 @@ class Database(object):
             return False
 
         end = time.perf_counter() * 1000
+        logging.info("Wrote %d of %d files" % (num_written, num_files))
         logging.info("Total Time Taken for Database: %s ms" % (end - start))
         logging.info("Done serializing!")
         return True
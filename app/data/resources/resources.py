@@ -27,9 +27,15 @@ from app.data.resources.combat_anims import CombatCatalog, CombatEffectCatalog
 
 import logging
 
-from app.utilities.serialization import save_json
+from app.utilities.serialization import load_json, remove_other_files, save_json, save_json_if_changed
+
 from app.utilities.typing import NestedPrimitiveDict
 
+# Remembers the size and modification time of each resource file
+# as of when it was last copied into the autosave
+AUTOSAVE_MANIFEST = '.autosave_manifest'
+AUTOSAVE_COPY_WORKERS = 8
+
 class Resources():
     save_data_types = ("icons16", "icons32", "icons80", "portraits", "animations", "panoramas", "fonts",
                        "map_icons", "map_sprites", "combat_palettes", "combat_anims", "combat_effects", "music", "sfx",
@@ -180,15 +186,12 @@ class Resources():
             try:
                 for key, value in to_save.items():
                     save_dir = Path(resource_dir, key)
-                    # if chunks, delete the old directory
                     actual_save_dir = save_dir
                     if key in self.save_as_chunks:
                         if key == 'tilemaps':
                             actual_save_dir = Path(save_dir, 'tilemap_data')
                         elif key == 'combat_palettes':
                             actual_save_dir = Path(save_dir, 'palette_data')
-                        if os.path.exists(actual_save_dir):
-                            shutil.rmtree(actual_save_dir)
                     # divide save data into chunks based on key value
                     if not os.path.exists(actual_save_dir):
                         os.makedirs(actual_save_dir)
@@ -205,12 +208,17 @@ class Resources():
                             orderkeys.append(name)
                             save_loc = Path(actual_save_dir, name + '.json')
                             # logging.info("Serializing %s to %s" % ('%s/%s.json' % (key, name), save_loc))
-                            save_json(save_loc, [subvalue])
-                        save_json(Path(actual_save_dir, '.orderkeys'), orderkeys)
+                            save_json_if_changed(save_loc, [subvalue])
+                        save_json_if_changed(Path(actual_save_dir, '.orderkeys'), orderkeys)
+                        saved_files = [name + '.json' for name in orderkeys] + ['.orderkeys']
                     else:  # Save as a single file
                         save_loc = Path(actual_save_dir, key + '.json')
                         # logging.info("Serializing %s to %s" % (key, save_loc))
-                        save_json(save_loc, value)
+                        save_json_if_changed(save_loc, value)
+                        saved_files = [key + '.json']
+                    # if chunks, delete whatever was removed since the last save
+                    if key in self.save_as_chunks:
+                        remove_other_files(actual_save_dir, saved_files)
             except OSError as e:  # In case we ran out of memory
                 logging.error("Editor was unable to save your project. Free up memory in your hard drive or try saving somewhere else, otherwise progress will be lost when the editor is closed.")
                 logging.exception(e)
@@ -263,27 +271,42 @@ class Resources():
         if not os.path.exists(autosave_resource_dir):
             os.mkdir(autosave_resource_dir)
         proj_resource_dir = os.path.join(proj_dir, 'resources')
-        # from distutils.dir_util import copy_tree
-        import filecmp
-        all_files = list(os.walk(proj_resource_dir))
-        num_files = sum(len(_[2]) for _ in all_files)
-        idx = 0
-        for (root, d, files) in all_files:
+        manifest_path = Path(autosave_resource_dir, AUTOSAVE_MANIFEST)
+        try:
+            manifest: Dict[str, List[int]] = load_json(manifest_path)
+        except Exception:
+            manifest = {}
+
+        # Only copy the files that changed since they were last copied
+        new_manifest: Dict[str, List[int]] = {}
+        to_copy = []
+        for (root, d, files) in os.walk(proj_resource_dir):
             new_root = root.replace(proj_resource_dir, autosave_resource_dir)
             for f in files:
-                idx += 1
                 old_path = os.path.join(root, f)
                 new_path = os.path.join(new_root, f)
-                if os.path.exists(new_path) and filecmp.cmp(old_path, new_path, shallow=False):
-                    pass
-                else:
-                    os.makedirs(os.path.dirname(new_path), exist_ok=True)
-                    shutil.copy(old_path, new_path)
-                if progress and idx % 100 == 0:
-                    perc = int((idx / num_files) * 74) + 1
+                stat = os.stat(old_path)
+                rel_path = os.path.relpath(old_path, proj_resource_dir)
+                new_manifest[rel_path] = [stat.st_size, stat.st_mtime_ns]
+                if manifest.get(rel_path) != new_manifest[rel_path] or not os.path.exists(new_path):
+                    to_copy.append((old_path, new_path))
+
+        def copy(old_path, new_path):
+            os.makedirs(os.path.dirname(new_path), exist_ok=True)
+            shutil.copy(old_path, new_path)
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        with ThreadPoolExecutor(AUTOSAVE_COPY_WORKERS) as executor:
+            futures = [executor.submit(copy, old_path, new_path) for old_path, new_path in to_copy]
+            for idx, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if progress and (idx % 100 == 0 or idx == len(futures)):
+                    perc = int((idx / len(futures)) * 74) + 1
                     progress.setValue(perc)
+        save_json(manifest_path, new_manifest)
 
         end = time.time_ns()/1e6
+        logging.info("Copied %d of %d files" % (len(to_copy), len(new_manifest)))
         logging.info("Total Time Taken for Resources: %s ms" % (end - start))
         logging.info('Done Resource Serializing!')
 
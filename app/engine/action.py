@@ -334,6 +334,7 @@ class QuickLeave(Action):
         game.leave(self.unit, self.test)
         if self.keep_position:
             self.unit.position = self.old_pos
+            game.invalidate_unit_index()
 
     def reverse(self):
         game.arrive(self.unit, self.old_pos, self.test)
@@ -1542,12 +1543,14 @@ class AddItemComponent(Action):
         component.item = self.item
         if component.defines('init'):
             component.init(self.item)
+        self.item._hook_index.clear()
         self._did_add = True
 
     def reverse(self):
         if self._did_add:
             self.item.components.remove_key(self.component_nid)
             del self.item.__dict__[self.component_nid]
+            self.item._hook_index.clear()
             self._did_add = False
 
 class ModifyItemComponent(Action):
@@ -1600,6 +1603,7 @@ class RemoveItemComponent(Action):
             self.component_value = component.value
             self.item.components.remove_key(self.component_nid)
             del self.item.__dict__[self.component_nid]
+            self.item._hook_index.clear()
             self._did_remove = True
         else:
             logging.warning("remove_item_component: component with nid %s not found for item %s", self.component_nid, self.item)
@@ -1612,6 +1616,7 @@ class RemoveItemComponent(Action):
             self.item.__dict__[self.component_nid] = component
             # Assign parent to component
             component.item = self.item
+            self.item._hook_index.clear()
             self._did_remove = False
 
 class AddSkillComponent(Action):
@@ -1634,12 +1639,14 @@ class AddSkillComponent(Action):
         component.skill = self.skill
         if component.defines('init'):
             component.init(self.skill)
+        skill_system.reset_hook_index()
         self._did_add = True
 
     def reverse(self):
         if self._did_add:
             self.skill.components.remove_key(self.component_nid)
             del self.skill.__dict__[self.component_nid]
+            skill_system.reset_hook_index()
             self._did_add = False
 
 class ModifySkillComponent(Action):
@@ -1691,6 +1698,7 @@ class RemoveSkillComponent(Action):
             self.component_value = component.value
             self.skill.components.remove_key(self.component_nid)
             del self.skill.__dict__[self.component_nid]
+            skill_system.reset_hook_index()
             self._did_remove = True
         else:
             logging.warning("remove_skill_component: component with nid %s not found for skill %s", self.component_nid, self.skill)
@@ -1703,6 +1711,7 @@ class RemoveSkillComponent(Action):
             self.skill.__dict__[self.component_nid] = component
             # Assign parent to component
             component.skill = self.skill
+            skill_system.reset_hook_index()
             self._did_remove = False
 
 class SetObjData(Action):
@@ -2522,6 +2531,23 @@ class IncrementSupportPoints(Action):
         pair.ranks_gained_this_chapter = int(self.saved_data['ranks_gained_this_chapter'])
 
 
+class IncrementMultipleSupportPoints(Action):
+    """
+    Gives the same number of points to many support pairs at once,
+    such as at the end of a turn
+    """
+    def __init__(self, nids, points):
+        self.actions = [IncrementSupportPoints(nid, points) for nid in nids]
+
+    def do(self):
+        for action in self.actions:
+            action.do()
+
+    def reverse(self):
+        for action in reversed(self.actions):
+            action.reverse()
+
+
 class UnlockSupportRank(Action):
     def __init__(self, nid, rank):
         self.nid = nid
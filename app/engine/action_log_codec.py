@@ -0,0 +1,316 @@
+"""
+Compact binary encoding for the serialized turnwheel action log.
+
+`Action.save()` produces nested tuples and dicts like
+    ('Move', {'unit': ('unit', 'Eirika'), 'path': ('list', [('generic', (3, 4)), ...]), ...})
+which are very repetitive when pickled: every action repeats its class name,
+every attribute name, and every unit nid. This module packs that same structure into
+a single bytes object, with an interned table of action types and an interned
+table of strings, varint-packed integers and positions, and delta-encoded lists
+of integers and positions.
+
+`encode_actions` and `decode_actions` round-trip exactly, so the turnwheel
+can restore the decoded structure exactly as it would restore the old format.
+"""
+
+from __future__ import annotations
+
+import pickle
+import struct
+from typing import Any, Dict, List, Tuple
+
+SerializedAction = Tuple[str, Dict[str, Any]]
+
+VERSION = 1
+
+# Kinds of values produced by Action.save_obj
+KIND_UNIT = 0
+KIND_ITEM = 1
+KIND_SKILL = 2
+KIND_REGION = 3
+KIND_LIST = 4
+KIND_ACTION = 5
+KIND_GENERIC = 6
+KIND_POS_LIST = 7  # A list of ('generic', position) values, delta-encoded
+
+SAVED_KINDS = {'unit': KIND_UNIT, 'item': KIND_ITEM, 'skill': KIND_SKILL,
+               'region': KIND_REGION}
+SAVED_KIND_NAMES = {v: k for k, v in SAVED_KINDS.items()}
+
+# Tags for generic values
+TAG_NONE = 0
+TAG_TRUE = 1
+TAG_FALSE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_POS = 6
+TAG_TUPLE = 7
+TAG_LIST = 8
+TAG_DICT = 9
+TAG_INT_LIST = 10  # delta-encoded
+TAG_POS_LIST = 11  # delta-encoded
+TAG_PICKLE = 12
+
+_double = struct.Struct('<d')
+
+def _is_pos(value) -> bool:
+    return type(value) is tuple and len(value) == 2 and \
+        type(value[0]) is int and type(value[1]) is int
+
+def _is_saved_pos(value) -> bool:
+    return type(value) is tuple and len(value) == 2 and \
+        value[0] == 'generic' and _is_pos(value[1])
+
+class Encoder():
+    def __init__(self):
+        self.types: List[str] = []
+        self.strings: List[str] = []
+        self._type_lookup: Dict[str, int] = {}
+        self._string_lookup: Dict[str, int] = {}
+        self.buf = bytearray()
+
+    def write_uint(self, value: int):
+        buf = self.buf
+        while value > 0x7f:
+            buf.append((value & 0x7f) | 0x80)
+            value >>= 7
+        buf.append(value)
+
+    def write_int(self, value: int):
+        # zigzag, so small negative numbers stay small
+        self.write_uint(value * 2 if value >= 0 else -value * 2 - 1)
+
+    def write_str(self, value: str):
+        idx = self._string_lookup.get(value)
+        if idx is None:
+            idx = len(self.strings)
+            self._string_lookup[value] = idx
+            self.strings.append(value)
+        self.write_uint(idx)
+
+    def write_type(self, name: str):
+        idx = self._type_lookup.get(name)
+        if idx is None:
+            idx = len(self.types)
+            self._type_lookup[name] = idx
+            self.types.append(name)
+        self.write_uint(idx)
+
+    def write_action(self, action: SerializedAction):
+        name, ser_dict = action
+        self.write_type(name)
+        self.write_uint(len(ser_dict))
+        for attr, value in ser_dict.items():
+            self.write_str(attr)
+            self.write_saved(value)
+
+    def write_saved(self, value: Tuple[str, Any]):
+        kind, payload = value
+        if kind in SAVED_KINDS:
+            self.buf.append(SAVED_KINDS[kind])
+            self.write_value(payload)
+        elif kind == 'list':
+            if len(payload) > 1 and all(_is_saved_pos(v) for v in payload):
+                self.buf.append(KIND_POS_LIST)
+                self._write_pos_deltas([v[1] for v in payload])
+            else:
+                self.buf.append(KIND_LIST)
+                self.write_uint(len(payload))
+                for v in payload:
+                    self.write_saved(v)
+        elif kind == 'action':
+            self.buf.append(KIND_ACTION)
+            self.write_action(payload)
+        else:
+            self.buf.append(KIND_GENERIC)
+            self.write_value(payload)
+
+    def _write_pos_deltas(self, positions: List[Tuple[int, int]]):
+        self.write_uint(len(positions))
+        last_x, last_y = 0, 0
+        for x, y in positions:
+            self.write_int(x - last_x)
+            self.write_int(y - last_y)
+            last_x, last_y = x, y
+
+    def write_value(self, value: Any):
+        buf = self.buf
+        t = type(value)
+        if value is None:
+            buf.append(TAG_NONE)
+        elif value is True:
+            buf.append(TAG_TRUE)
+        elif value is False:
+            buf.append(TAG_FALSE)
+        elif t is int:
+            buf.append(TAG_INT)
+            self.write_int(value)
+        elif t is float:
+            buf.append(TAG_FLOAT)
+            buf += _double.pack(value)
+        elif t is str:
+            buf.append(TAG_STR)
+            self.write_str(value)
+        elif t is tuple:
+            if _is_pos(value):
+                buf.append(TAG_POS)
+                self.write_int(value[0])
+                self.write_int(value[1])
+            else:
+                buf.append(TAG_TUPLE)
+                self.write_uint(len(value))
+                for v in value:
+                    self.write_value(v)
+        elif t is list:
+            if len(value) > 1 and all(type(v) is int for v in value):
+                buf.append(TAG_INT_LIST)
+                self.write_uint(len(value))
+                last = 0
+                for v in value:
+                    self.write_int(v - last)
+                    last = v
+            elif len(value) > 1 and all(_is_pos(v) for v in value):
+                buf.append(TAG_POS_LIST)
+                self._write_pos_deltas(value)
+            else:
+                buf.append(TAG_LIST)
+                self.write_uint(len(value))
+                for v in value:
+                    self.write_value(v)
+        elif t is dict:
+            buf.append(TAG_DICT)
+            self.write_uint(len(value))
+            for k, v in value.items():
+                self.write_value(k)
+                self.write_value(v)
+        else:
+            # Sets, enums, and anything else unusual
+            data = pickle.dumps(value)
+            buf.append(TAG_PICKLE)
+            self.write_uint(len(data))
+            buf += data
+
+class Decoder():
+    def __init__(self, types: List[str], strings: List[str], data: bytes):
+        self.types = types
+        self.strings = strings
+        self.data = data
+        self.idx = 0
+
+    def read_byte(self) -> int:
+        b = self.data[self.idx]
+        self.idx += 1
+        return b
+
+    def read_uint(self) -> int:
+        data = self.data
+        result = 0
+        shift = 0
+        while True:
+            b = data[self.idx]
+            self.idx += 1
+            result |= (b & 0x7f) << shift
+            if b < 0x80:
+                return result
+            shift += 7
+
+    def read_int(self) -> int:
+        value = self.read_uint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def read_str(self) -> str:
+        return self.strings[self.read_uint()]
+
+    def read_action(self) -> SerializedAction:
+        name = self.types[self.read_uint()]
+        num_attrs = self.read_uint()
+        ser_dict = {}
+        for _ in range(num_attrs):
+            attr = self.read_str()
+            ser_dict[attr] = self.read_saved()
+        return (name, ser_dict)
+
+    def read_saved(self) -> Tuple[str, Any]:
+        kind = self.read_byte()
+        if kind in SAVED_KIND_NAMES:
+            return (SAVED_KIND_NAMES[kind], self.read_value())
+        elif kind == KIND_LIST:
+            return ('list', [self.read_saved() for _ in range(self.read_uint())])
+        elif kind == KIND_POS_LIST:
+            return ('list', [('generic', pos) for pos in self._read_pos_deltas()])
+        elif kind == KIND_ACTION:
+            return ('action', self.read_action())
+        elif kind == KIND_GENERIC:
+            return ('generic', self.read_value())
+        raise ValueError("Unknown action log value kind %d" % kind)
+
+    def _read_pos_deltas(self) -> List[Tuple[int, int]]:
+        positions = []
+        x, y = 0, 0
+        for _ in range(self.read_uint()):
+            x += self.read_int()
+            y += self.read_int()
+            positions.append((x, y))
+        return positions
+
+    def read_value(self) -> Any:
+        tag = self.read_byte()
+        if tag == TAG_NONE:
+            return None
+        elif tag == TAG_TRUE:
+            return True
+        elif tag == TAG_FALSE:
+            return False
+        elif tag == TAG_INT:
+            return self.read_int()
+        elif tag == TAG_FLOAT:
+            value = _double.unpack_from(self.data, self.idx)[0]
+            self.idx += _double.size
+            return value
+        elif tag == TAG_STR:
+            return self.read_str()
+        elif tag == TAG_POS:
+            x = self.read_int()
+            return (x, self.read_int())
+        elif tag == TAG_TUPLE:
+            return tuple(self.read_value() for _ in range(self.read_uint()))
+        elif tag == TAG_LIST:
+            return [self.read_value() for _ in range(self.read_uint())]
+        elif tag == TAG_DICT:
+            value = {}
+            for _ in range(self.read_uint()):
+                k = self.read_value()
+                value[k] = self.read_value()
+            return value
+        elif tag == TAG_INT_LIST:
+            value = []
+            last = 0
+            for _ in range(self.read_uint()):
+                last += self.read_int()
+                value.append(last)
+            return value
+        elif tag == TAG_POS_LIST:
+            return self._read_pos_deltas()
+        elif tag == TAG_PICKLE:
+            length = self.read_uint()
+            value = pickle.loads(self.data[self.idx:self.idx + length])
+            self.idx += length
+            return value
+        raise ValueError("Unknown action log value tag %d" % tag)
+
+def encode_actions(actions: List[SerializedAction]) -> Dict[str, Any]:
+    encoder = Encoder()
+    encoder.write_uint(len(actions))
+    for action in actions:
+        encoder.write_action(action)
+    return {'version': VERSION,
+            'types': encoder.types,
+            'strings': encoder.strings,
+            'data': bytes(encoder.buf)}
+
+def decode_actions(encoded: Dict[str, Any]) -> List[SerializedAction]:
+    if encoded['version'] != VERSION:
+        raise ValueError("Unsupported action log encoding version %s" % encoded['version'])
+    decoder = Decoder(encoded['types'], encoded['strings'], encoded['data'])
+    return [decoder.read_action() for _ in range(decoder.read_uint())]
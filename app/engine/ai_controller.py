@@ -6,7 +6,7 @@ from typing import Collection, List
 from app.constants import FRAMERATE
 from app.data.database.database import DB
 from app.engine import (action, combat_calcs, engine, equations, evaluate,
-                        item_funcs, item_system, line_of_sight,
+                        frame_profiler, item_funcs, item_system, line_of_sight,
                         skill_system)
 from app.engine.objects.unit import UnitObject
 from app.engine.pathfinding import pathfinding
@@ -188,7 +188,7 @@ class AIController():
 
     def canto_retreat(self):
         valid_positions = self.get_true_valid_moves()
-        enemy_positions = {u.position for u in game.units if u.position and skill_system.check_enemy(self.unit, u)}
+        enemy_positions = {u.position for u in game.units_on_map if skill_system.check_enemy(self.unit, u)}
         self.goal_position = utils.farthest_away_pos(self.unit.position, valid_positions, enemy_positions)
 
     def smart_retreat(self) -> bool:
@@ -225,10 +225,11 @@ class AIController():
             return {self.unit.position}
         else:
             valid_moves = game.path_system.get_valid_moves(self.unit)
-            other_unit_positions = {unit.position for unit in game.units if unit.position and unit is not self.unit}
+            other_unit_positions = {unit.position for unit in game.units_on_map if unit is not self.unit}
             valid_moves -= other_unit_positions
             return valid_moves
 
+    @frame_profiler.timed('ai_think')
     def think(self):
         time = engine.get_time()
         success = False
@@ -335,8 +336,8 @@ class AIController():
 
     def ai_group_ping(self, ai_group):
         action.do(action.AIGroupPing(ai_group.nid))
-        for unit in game.units:
-            if unit.team == self.unit.team and unit.ai_group == ai_group.nid:
+        for unit in game.unit_index.by_team.get(self.unit.team, ()):
+            if unit.ai_group == ai_group.nid:
                 if not unit._has_moved and not unit._has_attacked:
                     unit.has_run_ai = False  # So it can be run through the AI state again
 
@@ -449,7 +450,7 @@ class PrimaryAI():
             # If too many legal targets, just try for the best move first
             # Otherwise it spends way too long trying every possible position to strike from
             if len(self.valid_targets) > 10:
-                enemy_positions = {u.position for u in game.units if u.position and skill_system.check_enemy(self.unit, u)}
+                enemy_positions = {u.position for u in game.units_on_map if skill_system.check_enemy(self.unit, u)}
                 move = utils.farthest_away_pos(self.orig_pos, self.possible_moves, enemy_positions)
                 if not move:
                     move = self.possible_moves[self.move_index]
@@ -656,11 +657,11 @@ def handle_unit_spec(all_targets, behaviour):
 def get_targets(unit, behaviour) -> List[Point]:
     all_targets = []
     if behaviour.target == 'Unit':
-        all_targets = [u.position for u in game.units if u.position]
+        all_targets = [u.position for u in game.units_on_map]
     elif behaviour.target == 'Enemy':
-        all_targets = [u.position for u in game.units if u.position and skill_system.check_enemy(unit, u)]
+        all_targets = [u.position for u in game.units_on_map if skill_system.check_enemy(unit, u)]
     elif behaviour.target == 'Ally':
-        all_targets = [u.position for u in game.units if u.position and skill_system.check_ally(unit, u)]
+        all_targets = [u.position for u in game.units_on_map if skill_system.check_ally(unit, u)]
     elif behaviour.target == 'Event':
         target_spec = behaviour.target_spec
         for region in game.level.regions:
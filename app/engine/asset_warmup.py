@@ -0,0 +1,164 @@
+"""
+Warms up the images a level is about to need while its loading screen is up.
+
+Image files are decoded on worker threads and handed over to engine.image_load
+with engine.stage_image, so the main thread only converts them.
+Everything that touches the display (team colors, palette swaps) is then built
+on the main thread, a few milliseconds' worth each frame, so the loading screen
+keeps drawing.
+
+Music is preloaded separately by the loading state.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List
+
+import pygame
+
+from app.data.database.database import DB
+from app.data.resources.resources import RESOURCES
+from app.engine import engine, item_system, skill_system
+import app.engine.config as cf
+
+if TYPE_CHECKING:
+    from app.engine.objects.unit import UnitObject
+
+# Turn off to load everything lazily, the first time it is drawn
+enabled: bool = True
+
+MAX_WORKERS = 4
+# How long the main thread can spend warming up each frame, in ms
+FRAME_BUDGET = 8
+
+def _decode(path: str):
+    try:
+        engine.stage_image(path, pygame.image.load(path))
+    except Exception as e:
+        logging.warning("Could not decode %s ahead of time: %s", path, e)
+
+def map_sprite_paths(unit: UnitObject) -> List[str]:
+    klass = DB.classes.get(unit.klass)
+    if not klass:
+        return []
+    variant = skill_system.change_variant(unit)
+    res = RESOURCES.map_sprites.get(klass.map_sprite_nid + variant) if variant else None
+    if not res:
+        res = RESOURCES.map_sprites.get(klass.map_sprite_nid)
+    if not res:
+        return []
+    paths = []
+    if not res.standing_image:
+        paths.append(res.stand_full_path)
+    if not res.moving_image:
+        paths.append(res.move_full_path)
+    return paths
+
+def weapon_anim_paths(unit: UnitObject) -> List[str]:
+    """
+    The weapon animations of the unit's combat animation that
+    any of the unit's items could plausibly use
+    """
+    combat_anim_nid = skill_system.change_animation(unit)
+    if not combat_anim_nid:
+        klass = DB.classes.get(unit.klass)
+        combat_anim_nid = klass.combat_anim_nid if klass else None
+    if not combat_anim_nid:
+        return []
+    variant = skill_system.change_variant(unit)
+    res = RESOURCES.combat_anims.get(combat_anim_nid + variant) if variant else None
+    if not res:
+        res = RESOURCES.combat_anims.get(combat_anim_nid)
+    if not res:
+        return []
+
+    names = {'Unarmed', 'Neutral'}
+    for item in unit.items:
+        names.add(item.nid)
+        weapon_type = item_system.weapon_type(unit, item)
+        if weapon_type:
+            names.add(weapon_type)
+    paths = []
+    for weapon_anim in res.weapon_anims:
+        name = weapon_anim.nid
+        for prefix in ('Magic', 'Ranged'):
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+        if (name in names or weapon_anim.nid == 'MagicGeneric') and \
+                not weapon_anim.image and weapon_anim.frames and weapon_anim.full_path:
+            paths.append(weapon_anim.full_path)
+    return paths
+
+def warm_unit(unit: UnitObject):
+    """
+    Builds the unit's map sprite and the battle animation for
+    its current weapon, so that neither is built mid-frame later
+    """
+    unit.sprite
+    if cf.SETTINGS['animation'] != 'Never':
+        from app.engine import battle_animation
+        anim = battle_animation.get_battle_anim(unit, unit.get_weapon())
+        if anim:
+            # Don't let the registry hold onto the unit
+            anim.reset_unit()
+
+class AssetWarmup():
+    def __init__(self, units: List[UnitObject]):
+        self.units = list(units)
+        self.futures: List[Future] = []
+        self.jobs: Deque[Callable] = deque()
+        self.start_time: float = 0
+        self.decode_time: float = 0  # ms, until every image was decoded
+        self.total_time: float = 0  # ms, until everything was warmed up
+        self.done: bool = False
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        paths: Dict[str, None] = {}  # Ordered, without duplicates
+        for unit in self.units:
+            for path in map_sprite_paths(unit):
+                paths[path] = None
+            if cf.SETTINGS['animation'] != 'Never':
+                for path in weapon_anim_paths(unit):
+                    paths[path] = None
+        if paths:
+            executor = ThreadPoolExecutor(MAX_WORKERS, thread_name_prefix='asset_warmup')
+            self.futures = [executor.submit(_decode, path) for path in paths]
+            executor.shutdown(wait=False)
+        self.jobs.extend(functools.partial(warm_unit, unit) for unit in self.units)
+
+    def update(self, budget: float = FRAME_BUDGET) -> bool:
+        """
+        Does up to budget ms of main thread work.
+        Returns whether everything has been warmed up
+        """
+        if self.done:
+            return True
+        if self.futures:
+            if not all(future.done() for future in self.futures):
+                return False
+            self.futures.clear()
+            self.decode_time = (time.perf_counter() - self.start_time) * 1e3
+        end = time.perf_counter() + budget / 1e3
+        while self.jobs and time.perf_counter() < end:
+            self.jobs.popleft()()
+        if not self.jobs:
+            self.total_time = (time.perf_counter() - self.start_time) * 1e3
+            self.done = True
+            logging.info("Warmed up assets for %d units in %.1f ms (%.1f ms decoding)",
+                         len(self.units), self.total_time, self.decode_time)
+        return self.done
+
+    def finish(self):
+        """
+        Does all the remaining work right now
+        """
+        for future in self.futures:
+            future.result()
+        while not self.update(budget=float('inf')):
+            pass
@@ -5,7 +5,7 @@ from app.constants import TILEWIDTH, TILEHEIGHT
 
 from app.data.database.database import DB
 from app.engine.sprites import SPRITES
-from app.engine import engine, equations, image_mods, aura_funcs
+from app.engine import engine, equations, frame_profiler, image_mods, aura_funcs
 from app.engine.game_state import game
 
 from app.utilities import utils
@@ -40,6 +40,10 @@ class BoundaryInterface():
                              'spell': {},
                              'movement': {}}
 
+        # Units whose attack and spell ranges are out of date
+        # because of roaming units moving around, see roam_move
+        self._stale_units = set()
+
         self.draw_flag = False
         self.all_on_flag = False
 
@@ -142,12 +146,18 @@ class BoundaryInterface():
         self._set(valid_attacks, 'attack', unit.nid)
         self._set(valid_spells, 'spell', unit.nid)
 
+        self._set_movement_area(unit)
+
+        self.reset_surf()
+
+    def _set_movement_area(self, unit):
+        grid = self.grids['movement']
+        for (x, y) in self.dictionaries['movement'].get(unit.nid, ()):
+            grid[x * self.height + y].discard(unit.nid)
         area_of_influence = game.target_system.find_manhattan_spheres(set(range(1, equations.parser.movement(unit) + 1)), *unit.position)
         area_of_influence = {pos for pos in area_of_influence if game.board.check_bounds(pos)}
         self._set(area_of_influence, 'movement', unit.nid)
 
-        self.reset_surf()
-
     def _remove_unit(self, unit):
         for mode, grid in self.grids.items():
             if unit.nid in self.dictionaries[mode]:
@@ -156,6 +166,7 @@ class BoundaryInterface():
                 # del self.dictionaries[mode][unit.nid]
         self.reset_surf()
 
+    @frame_profiler.timed('boundary')
     def recalculate_unit(self, unit: UnitObject):
         if unit.team in self.enemy_teams:
             self._remove_unit(unit)
@@ -175,14 +186,43 @@ class BoundaryInterface():
             # Set unit's position to non-existent for a brief momement
             game.board.remove_unit(unit.position, unit)
             unit.position = None
+            game.invalidate_unit_index()
             for other_unit in other_units:
                 self._remove_unit(other_unit)
             for other_unit in other_units:
                 if other_unit.position:
                     self._add_unit(other_unit)
             unit.position = (x, y)  # Reset it back for future
+            game.invalidate_unit_index()
             game.board.set_unit(unit.position, unit)
 
+    def roam_move(self, unit, old_position):
+        """
+        Same as leave from old_position followed by arrive, except the
+        affected units' ranges are only recalculated once they are next drawn
+        """
+        if unit.team in self.enemy_teams:
+            # Kept up to date right away, since it decides who is affected by whom
+            self._set_movement_area(unit)
+            self._stale_units.add(unit.nid)
+        for x, y in (old_position, unit.position):
+            for nid in self.grids['movement'][x * self.height + y]:
+                other_unit = game.get_unit(nid)
+                if other_unit and unit.team not in DB.teams.get_allies(other_unit.team):
+                    self._stale_units.add(nid)
+        self.reset_surf()
+
+    def _recalculate_stale_units(self):
+        stale_units, self._stale_units = self._stale_units, set()
+        for nid in stale_units:
+            unit = game.get_unit(nid)
+            if unit:
+                self._remove_unit(unit)
+        for nid in stale_units:
+            unit = game.get_unit(nid)
+            if unit and unit.position and unit.team in self.enemy_teams:
+                self._add_unit(unit)
+
     def arrive(self, unit):
         if unit.position:
             if unit.team in self.enemy_teams:
@@ -201,8 +241,10 @@ class BoundaryInterface():
                     self._add_unit(other_unit)
 
     # Called when map changes
+    @frame_profiler.timed('boundary')
     def reset(self):
         self.clear()
+        self._stale_units.clear()
         for unit in game.units:
             if unit.position and unit.team in self.enemy_teams:
                 self._add_unit(unit)
@@ -243,6 +285,8 @@ class BoundaryInterface():
         if not self.draw_flag:
             return surf
 
+        if self._stale_units:
+            self._recalculate_stale_units()
         if self.should_reset_surf and not self.frozen:
             self.surf = None
             self.should_reset_surf = False
@@ -352,6 +396,7 @@ class BoundaryInterface():
         return surf
 
     def print_grid(self, mode):
+        self._recalculate_stale_units()
         for y in range(self.height):
             print("%02d|" % y, end="")
             for x in range(self.width):
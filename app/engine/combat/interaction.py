@@ -37,6 +37,17 @@ def has_animation(attacker: UnitObject, item: ItemObject, main_target: tuple, fo
 
     return False
 
+def combat_is_visible(attacker: UnitObject, item: ItemObject, target: tuple) -> bool:
+    """
+    Whether the player can see any of the units involved in this combat
+    """
+    if not game.board or not attacker.position:
+        return True
+    if game.board.in_vision(attacker.position):
+        return True
+    main_target, splash = item_system.splash(attacker, item, target)
+    return any(game.board.in_vision(pos) for pos in [main_target] + list(splash) if pos)
+
 def engage(attacker: UnitObject, positions: list, main_item: ItemObject, skip: bool = False, script: list = None,
            total_rounds: int = 1, force_animation: bool = False, force_no_animation: bool = False, arena_combat: bool = False):
     """
@@ -120,6 +131,10 @@ def start_combat(unit: UnitObject, target: tuple, item: ItemObject, skip: bool =
     # initialization of combat, that will happen before combat really
     # starts
     game.state.change('combat')
+    # Nothing to show the player, so resolve the whole combat right away
+    if ai_combat and not skip and not item.sequence_item and \
+            not combat_is_visible(unit, item, target):
+        skip = True
     combat = engage(
         unit, targets, item, skip=skip, script=script, total_rounds=total_rounds,
         arena_combat=arena, force_animation=force_animation, force_no_animation=force_no_animation)
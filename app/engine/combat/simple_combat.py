@@ -76,11 +76,11 @@ class SimpleCombat():
 
         self.start_combat()
         self.start_event()
-        while self.state_machine.get_state():
-            self.actions, self.playback = self.state_machine.do()
-            self.full_playback += self.playback
-            self._apply_actions()
-            self.state_machine.setup_next_state()
+        self.full_playback = self.state_machine.resolve(self._apply_phase)
+
+    def _apply_phase(self, actions, playback):
+        self.actions, self.playback = actions, playback
+        self._apply_actions()
 
     def get_from_playback(self, s):
         return [brush for brush in self.playback if brush.nid == s]
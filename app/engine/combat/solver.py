@@ -374,6 +374,24 @@ class CombatPhaseSolver():
         self.state.process(self, actions, playback)
         return actions, playback
 
+    def resolve(self, apply_phase: Callable[[list, List[PlaybackBrush]], None]) -> List[PlaybackBrush]:
+        """
+        Runs every remaining phase of the combat in one call, for combats
+        that are not displayed. Each phase's actions are handed to `apply_phase`
+        before the next phase is solved, since later strikes depend on the
+        results of earlier ones, so the rolls consumed and the outcome are
+        the same as stepping through the combat one phase at a time.
+
+        Returns the full playback
+        """
+        full_playback = []
+        while self.state:
+            actions, playback = self.do()
+            full_playback += playback
+            apply_phase(actions, playback)
+            self.setup_next_state()
+        return full_playback
+
     def get_next_state(self) -> str:
         # This is just used to determine what the next state will be
         if self.state:
@@ -408,16 +426,16 @@ class CombatPhaseSolver():
         if rng_mode == RNGOption.CLASSIC:
             roll = static_random.get_combat()
         elif rng_mode == RNGOption.TRUE_HIT:
-            roll = (static_random.get_combat() + static_random.get_combat()) // 2
+            roll = sum(static_random.get_combats(2)) // 2
         elif rng_mode == RNGOption.TRUE_HIT_PLUS:
-            roll = (static_random.get_combat() + static_random.get_combat() + static_random.get_combat()) // 3
+            roll = sum(static_random.get_combats(3)) // 3
         elif rng_mode == RNGOption.FATES_HIT:
             roll = static_random.get_combat()
         elif rng_mode == RNGOption.GRANDMASTER:
             roll = 0
         else:  # Default to True Hit
             logging.error("Not a valid rng_mode: %s (defaulting to true hit)", game.rng_mode)
-            roll = (static_random.get_combat() + static_random.get_combat()) // 2
+            roll = sum(static_random.get_combats(2)) // 2
         return roll
 
     def generate_crit_roll(self):
@@ -5,8 +5,8 @@ from app.engine.component_system.utils import HookInfo, ARG_TYPE_MAP, ResolvePol
 
 ITEM_HOOKS: Dict[str, HookInfo] = {
     # default false, return false if any component returns false
-    'is_weapon':                                       HookInfo(['unit', 'item'], ResolvePolicy.ALL_DEFAULT_FALSE),
-    'is_spell':                                        HookInfo(['unit', 'item'], ResolvePolicy.ALL_DEFAULT_FALSE),
+    'is_weapon':                                       HookInfo(['unit', 'item'], ResolvePolicy.ALL_DEFAULT_FALSE, is_cached=True),
+    'is_spell':                                        HookInfo(['unit', 'item'], ResolvePolicy.ALL_DEFAULT_FALSE, is_cached=True),
     'is_accessory':                                    HookInfo(['unit', 'item'], ResolvePolicy.ALL_DEFAULT_FALSE),
     'equippable':                                      HookInfo(['unit', 'item'], ResolvePolicy.ALL_DEFAULT_FALSE),
     'can_counter':                                     HookInfo(['unit', 'item'], ResolvePolicy.ALL_DEFAULT_FALSE),
@@ -60,9 +60,9 @@ ITEM_HOOKS: Dict[str, HookInfo] = {
     'sell_price':                                      HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True),
     'special_sort':                                    HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True),
     'num_targets':                                     HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True),
-    'minimum_range':                                   HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True),
-    'maximum_range':                                   HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True),
-    'weapon_type':                                     HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True),
+    'minimum_range':                                   HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True, is_cached=True),
+    'maximum_range':                                   HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True, is_cached=True),
+    'weapon_type':                                     HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True, is_cached=True),
     'weapon_triangle_override':                        HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True),
     'weapon_rank':                                     HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True),
     'damage':                                          HookInfo(['unit', 'item'], ResolvePolicy.UNIQUE, has_default_value=True),
@@ -118,26 +118,28 @@ def generate_item_hook_str(hook_name: str, hook_info: HookInfo):
 
     default_handling = "return result"
     inheritance_handling = ""
+    cache_handling = ""
     if hook_info.has_default_value:
         default_handling = "return result if values else Defaults.{hook_name}({args})".format(hook_name=hook_name, args=', '.join(args))
     if hook_info.inherits_parent:
         inheritance_handling = """
-            if item.parent_item:
-                orig_item = item
-                item = item.parent_item
-                for component in item.components:
-                    if component.defines('{hook_name}'):
-                        values.append(component.{hook_name}({args}))
-                item = orig_item
+        if item.parent_item:
+            orig_item = item
+            item = item.parent_item
+            for component in get_item_hook_components(item, '{hook_name}'):
+                values.append(component.{hook_name}({args}))
+            item = orig_item
 """.format(hook_name=hook_name, args=', '.join(args))
+    if hook_info.is_cached:
+        # Only for hooks whose result does not change until the game state does
+        cache_handling = """
+@ltcached"""
 
-    func_text = """
+    func_text = """{cache_handling}
 def {hook_name}({func_signature}):
-    all_components = get_all_components(unit, item)
     values = []
-    for component in all_components:
-        if component.defines('{hook_name}'):
-            values.append(component.{hook_name}({args}))
+    for component in get_hook_components(unit, item, '{hook_name}'):
+        values.append(component.{hook_name}({args}))
 {inheritance_handling}
     result = utils.{policy_resolution}(values)
     {default_handling}
@@ -146,7 +148,8 @@ def {hook_name}({func_signature}):
            args=', '.join(args),
            policy_resolution=hook_info.policy.value,
            default_handling=default_handling,
-           inheritance_handling=inheritance_handling)
+           inheritance_handling=inheritance_handling,
+           cache_handling=cache_handling)
     return func_text
 
 def compile_item_system():
@@ -147,7 +147,12 @@ SKILL_HOOKS: Dict[str, HookInfo] = {
     'target_icon':                          HookInfo(['unit', 'icon_unit'], ResolvePolicy.UNION),
 }
 
-def generate_skill_hook_str(hook_name: str, hook_info: HookInfo):
+def generate_skill_hook_str(hook_name: str, hook_info: HookInfo, use_hook_index: bool = True):
+    """
+    With use_hook_index, the hook only visits the components that define it,
+    using the unit's hook index (see get_hook_components).
+    Otherwise, it checks every component of every skill the unit has.
+    """
     args = hook_info.args
     if not 'unit' in args:
         raise ValueError("Expected 'unit' in args for hook %s" % hook_name)
@@ -168,7 +173,33 @@ def generate_skill_hook_str(hook_name: str, hook_info: HookInfo):
         cache_handling = """
 @ltcached"""
 
-    func_text = """{cache_handling}
+    if use_hook_index and hook_info.has_unconditional:
+        # The index also holds the components that only define the unconditional variant
+        unconditional_handling = unconditional_handling.replace('\n    ', '\n')
+        func_text = """{cache_handling}
+def {hook_name}({func_signature}):
+    values = []
+    for skill, component in get_hook_components(unit, '{hook_name}', unconditional=True):
+        if component.defines('{hook_name}'):
+            if component.ignore_conditional or {conditional_check}:
+                values.append(component.{hook_name}({args}))
+{unconditional_handling}
+    result = utils.{policy_resolution}(values)
+    {default_handling}
+"""
+    elif use_hook_index:
+        func_text = """{cache_handling}
+def {hook_name}({func_signature}):
+    values = []
+    for skill, component in get_hook_components(unit, '{hook_name}'):
+        if component.ignore_conditional or {conditional_check}:
+            values.append(component.{hook_name}({args}))
+
+    result = utils.{policy_resolution}(values)
+    {default_handling}
+"""
+    else:
+        func_text = """{cache_handling}
 def {hook_name}({func_signature}):
     values = []
     for skill in unit.skills[:]:
@@ -179,14 +210,15 @@ def {hook_name}({func_signature}):
 {unconditional_handling}
     result = utils.{policy_resolution}(values)
     {default_handling}
-""".format(hook_name=hook_name,
-           func_signature=', '.join(func_signature),
-           conditional_check=conditional_check,
-           args=', '.join(args),
-           policy_resolution=hook_info.policy.value,
-           default_handling=default_handling,
-           unconditional_handling=unconditional_handling,
-           cache_handling=cache_handling)
+"""
+    func_text = func_text.format(hook_name=hook_name,
+                                 func_signature=', '.join(func_signature),
+                                 conditional_check=conditional_check,
+                                 args=', '.join(args),
+                                 policy_resolution=hook_info.policy.value,
+                                 default_handling=default_handling,
+                                 unconditional_handling=unconditional_handling,
+                                 cache_handling=cache_handling)
 
     return func_text
 
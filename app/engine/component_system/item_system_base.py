@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, List, Set, Tuple, Any
 import app.engine.combat.playback as pb
 
 from app.engine.component_system import utils
+from app.engine.utils.ltcache import ltcached
 
 if TYPE_CHECKING:
     from app.engine.objects.item import ItemObject
@@ -91,6 +92,33 @@ def get_all_components(unit: UnitObject, item: ItemObject) -> list:
     all_components = [c for c in item.components] + override_components
     return all_components
 
+def get_item_hook_components(item: ItemObject, hook_name: str) -> list:
+    """
+    Returns the item's own components that define the hook, in order.
+    Built lazily per hook and thrown away whenever the item gains or loses a component.
+    """
+    index = item._hook_index
+    components = index.get(hook_name)
+    if components is None:
+        components = [component for component in item.components if component.defines(hook_name)]
+        index[hook_name] = components
+    return components
+
+def get_hook_components(unit: UnitObject, item: ItemObject, hook_name: str) -> list:
+    """
+    As get_all_components, but only the components that define the hook
+    """
+    from app.engine import skill_system
+    override_components = skill_system.item_override(unit, item)
+    if override_components:
+        override_components = [component for component in override_components if component.defines(hook_name)]
+    if not item:
+        return override_components
+    components = get_item_hook_components(item, hook_name)
+    if override_components:
+        return components + override_components
+    return components
+
 def available(unit: UnitObject, item: ItemObject) -> bool:
     """
     If any hook reports false, then it is false
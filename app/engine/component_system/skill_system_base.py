@@ -162,6 +162,32 @@ class Defaults():
     def thracia_critical_multiplier_formula(unit) -> str:
         return 'THRACIA_CRIT'
 
+# Bumped whenever a skill gains or loses a component,
+# so every unit's hook index is rebuilt
+_hook_index_version = 0
+
+def reset_hook_index():
+    global _hook_index_version
+    _hook_index_version += 1
+
+def get_hook_components(unit: UnitObject, hook_name: str, unconditional: bool = False) -> list:
+    """
+    Returns (skill, component) for each component of the unit's skills
+    that defines the hook, in the order the hook should run them.
+    Built lazily per hook and thrown away whenever the unit's skills change.
+    """
+    index = unit._skill_hook_index
+    if unit._skill_hook_version != _hook_index_version:
+        index.clear()
+        unit._skill_hook_version = _hook_index_version
+    components = index.get(hook_name)
+    if components is None:
+        unconditional_name = hook_name + '_unconditional'
+        components = [(skill, component) for skill in unit.skills for component in skill.components
+                      if component.defines(hook_name) or (unconditional and component.defines(unconditional_name))]
+        index[hook_name] = components
+    return components
+
 @ltcached
 def condition(skill, unit: UnitObject, item=None) -> bool:
     # print('Checking condition for', skill, unit, item)
@@ -181,30 +207,26 @@ def hidden(skill, unit) -> bool:
 
 def stat_change(unit, stat_nid) -> int:
     bonus = 0
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('stat_change'):
-                d = component.stat_change(unit)
-                d_bonus = d.get(stat_nid, 0)
-                if d_bonus == 0:
-                    continue
-                # Why did we write the component condition check after the evaluation of the bonus?
-                # Was there a good reason?
-                if component.ignore_conditional or condition(skill, unit):
-                    bonus += d_bonus
+    for skill, component in get_hook_components(unit, 'stat_change'):
+        d = component.stat_change(unit)
+        d_bonus = d.get(stat_nid, 0)
+        if d_bonus == 0:
+            continue
+        # Why did we write the component condition check after the evaluation of the bonus?
+        # Was there a good reason?
+        if component.ignore_conditional or condition(skill, unit):
+            bonus += d_bonus
     return bonus
 
 def subtle_stat_change(unit, stat_nid) -> int:
     bonus = 0
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('subtle_stat_change'):
-                d = component.subtle_stat_change(unit)
-                d_bonus = d.get(stat_nid, 0)
-                if d_bonus == 0:
-                    continue
-                if component.ignore_conditional or condition(skill, unit):
-                    bonus += d_bonus
+    for skill, component in get_hook_components(unit, 'subtle_stat_change'):
+        d = component.subtle_stat_change(unit)
+        d_bonus = d.get(stat_nid, 0)
+        if d_bonus == 0:
+            continue
+        if component.ignore_conditional or condition(skill, unit):
+            bonus += d_bonus
     return bonus
 
 def stat_change_contribution(unit, stat_nid) -> dict:
@@ -224,12 +246,10 @@ def stat_change_contribution(unit, stat_nid) -> dict:
 
 def growth_change(unit, stat_nid) -> int:
     bonus = 0
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('growth_change'):
-                if component.ignore_conditional or condition(skill, unit):
-                    d = component.growth_change(unit)
-                    bonus += d.get(stat_nid, 0)
+    for skill, component in get_hook_components(unit, 'growth_change'):
+        if component.ignore_conditional or condition(skill, unit):
+            d = component.growth_change(unit)
+            bonus += d.get(stat_nid, 0)
     return bonus
 
 def unit_sprite_flicker_tint(unit) -> list:
@@ -14,6 +14,7 @@ def base_config() -> OrderedDict:
                         ('sound_buffer_size', 2),
                         ('animation', 'Always'),
                         ('display_fps', 0),
+                        ('frame_profiler', 0),
                         ('battle_bg', 0),
                         ('unit_speed', 120),
                         ('text_speed', 32),
@@ -8,10 +8,12 @@ class DeathManager():
 
     def should_die(self, unit):
         unit.is_dying = True
+        game.invalidate_unit_index()
         self.dying_units[unit.nid] = 0
 
     def miracle(self, unit):
         unit.is_dying = False
+        game.invalidate_unit_index()
         if unit.nid in self.dying_units:
             del self.dying_units[unit.nid]
         unit.sprite.flicker.clear()
@@ -8,7 +8,7 @@ from app import lt_log
 from app.utilities import file_utils
 
 from app.constants import WINWIDTH, WINHEIGHT, VERSION, FPS
-from app.engine import engine
+from app.engine import engine, frame_profiler
 
 import app.engine.config as cf
 
@@ -78,6 +78,13 @@ def save_screenshot(raw_events: list, surf):
         current_time = str(datetime.now()).replace(' ', '_').replace(':', '.')
         engine.save_surface(surf, 'screenshots/LT_%s.bmp' % current_time)
 
+def check_profiler_keys(raw_events: list):
+    for e in raw_events:
+        if e.type == engine.KEYDOWN and e.key == engine.key_map['f10']:
+            frame_profiler.toggle_overlay()
+        elif e.type == engine.KEYDOWN and e.key == engine.key_map['f11']:
+            frame_profiler.export_chrome_trace()
+
 def draw_fps(surf, fps_records):
     from app.engine.fonts import FONT
     total_time = sum(fps_records)
@@ -116,6 +123,8 @@ def run(game):
     clock = engine.Clock()
     fps_records = collections.deque(maxlen=FPS)
     inp = get_input_manager()
+    if cf.SETTINGS['frame_profiler']:
+        frame_profiler.set_enabled(True)
 
     _error_mode = False
     _error_msg = ''
@@ -123,6 +132,7 @@ def run(game):
     SOFT_RESET_TIME = 3  # seconds
     while True:
         start = time.perf_counter_ns()
+        frame_profiler.begin_frame()
 
         engine.update_time()
         fps_records.append(engine.get_delta())
@@ -167,6 +177,7 @@ def run(game):
 
                 if cf.SETTINGS['display_fps']:
                     draw_fps(surf, fps_records)
+                frame_profiler.draw_overlay(surf)
                 if _soft_reset_start_time:
                     draw_soft_reset(surf, math.ceil(SOFT_RESET_TIME - (time.time() - _soft_reset_start_time)))
             except Exception as e:
@@ -178,13 +189,16 @@ def run(game):
                 if cf.SETTINGS['debug']:
                     raise e
 
-        get_sound_thread().update(raw_events)
+        with frame_profiler.scope('sound'):
+            get_sound_thread().update(raw_events)
 
         engine.push_display(surf, engine.get_screensize(), engine.DISPLAYSURF)
 
         save_screenshot(raw_events, surf)
+        check_profiler_keys(raw_events)
 
         engine.update_display()
+        frame_profiler.end_frame()
 
         end = time.perf_counter_ns()
         ms_elapsed = (end - start) / 1e6
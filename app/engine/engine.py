@@ -1,5 +1,5 @@
 import sys
-from typing import Tuple, TypeAlias
+from typing import Dict, Tuple, TypeAlias
 from enum import Enum
 
 import pygame
@@ -169,8 +169,24 @@ def subsurface(surf: Surface, rect: Tuple[int, int, int, int]) -> Surface:
         return empty_surf()
     return surf.subsurface(rect)
 
+# File path -> image decoded ahead of time, see asset_warmup
+# Only ever used once, by the next image_load of that path
+_staged_images: Dict[str, pygame.Surface] = {}
+
+def stage_image(fn, image: pygame.Surface):
+    """
+    Hands an image that was decoded off the main thread to the next image_load of fn.
+    Safe to call from any thread
+    """
+    _staged_images[fn] = image
+
+def clear_staged_images():
+    _staged_images.clear()
+
 def image_load(fn, convert=False, convert_alpha=False):
-    image = pygame.image.load(fn)
+    image = _staged_images.pop(fn, None)
+    if image is None:
+        image = pygame.image.load(fn)
     if convert:
         image = image.convert()
     elif convert_alpha:
@@ -245,6 +261,8 @@ key_map = {"enter": pygame.K_RETURN,
            "tab": pygame.K_TAB,
            "backspace": pygame.K_BACKSPACE,
            "pageup": pygame.K_PAGEUP,
+           "f10": pygame.K_F10,
+           "f11": pygame.K_F11,
            "f12": pygame.K_F12,
            "`": pygame.K_BACKQUOTE,
            "1": pygame.K_1,
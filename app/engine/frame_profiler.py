@@ -0,0 +1,224 @@
+"""
+Lightweight frame-time instrumentation.
+
+Named timing scopes wrap the hot paths of the engine (state update and draw,
+AI thinking, pathfinding, boundary rebuilds, event processing, sound update).
+When the profiler is enabled (the `frame_profiler` config option or the
+`LT_FRAME_PROFILE` environment variable), each scope records its duration into
+a ring buffer. Systems can also report counters, such as how much work they
+did or put off this frame. The driver can then draw an overlay with percentile
+statistics per scope and the latest counters, and export the recent history as
+a Chrome trace (chrome://tracing or https://ui.perfetto.dev) to track down
+frame hitches.
+
+When disabled, scopes cost a single boolean check.
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+# Number of frames of history to keep
+HISTORY = 300
+# Number of trace events to keep for export
+MAX_TRACE_EVENTS = 20000
+
+_enabled: bool = "LT_FRAME_PROFILE" in os.environ
+_show_overlay: bool = _enabled
+
+# (name, start ns, duration ns, depth)
+TraceEvent = Tuple[str, int, int, int]
+# (name, time ns, values)
+CounterEvent = Tuple[str, int, Dict[str, float]]
+
+class FrameProfiler():
+    def __init__(self):
+        self.scope_times: Dict[str, Deque[float]] = {}
+        self.frame_times: Deque[float] = collections.deque(maxlen=HISTORY)
+        self.trace_events: Deque[TraceEvent] = collections.deque(maxlen=MAX_TRACE_EVENTS)
+        self.counter_events: Deque[CounterEvent] = collections.deque(maxlen=MAX_TRACE_EVENTS)
+        # Latest values of each counter
+        self.counters: Dict[str, Dict[str, float]] = {}
+        # Time spent in each scope during the current frame
+        self._current: Dict[str, int] = collections.defaultdict(int)
+        self._depth: int = 0
+        self._frame_start: int = time.perf_counter_ns()
+
+    def record(self, name: str, start: int, duration: int):
+        self._current[name] += duration
+        self.trace_events.append((name, start, duration, self._depth))
+
+    def count(self, name: str, values: Dict[str, float]):
+        self.counters[name] = values
+        self.counter_events.append((name, time.perf_counter_ns(), values))
+
+    def begin_frame(self):
+        self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self):
+        end = time.perf_counter_ns()
+        duration = end - self._frame_start
+        self.trace_events.append(('frame', self._frame_start, duration, -1))
+        self.frame_times.append(duration / 1e6)
+        # Every known scope gets an entry every frame, so percentiles
+        # are over frames, not calls
+        for name in self.scope_times.keys() | self._current.keys():
+            if name not in self.scope_times:
+                self.scope_times[name] = collections.deque(maxlen=HISTORY)
+            self.scope_times[name].append(self._current.get(name, 0) / 1e6)
+        self._current.clear()
+
+    def get_stats(self) -> List[Tuple[str, float, float, float]]:
+        """
+        Returns (name, p50, p95, max) in milliseconds per frame for each scope,
+        with the whole frame first
+        """
+        stats = [('frame',) + _percentiles(self.frame_times)]
+        for name in sorted(self.scope_times):
+            stats.append((name,) + _percentiles(self.scope_times[name]))
+        return stats
+
+    def get_counters(self) -> List[Tuple[str, Dict[str, float]]]:
+        return sorted(self.counters.items())
+
+    def export_chrome_trace(self, fn: str):
+        events = []
+        for name, start, duration, depth in self.trace_events:
+            events.append({'name': name, 'cat': 'frame' if depth < 0 else 'scope',
+                           'ph': 'X', 'ts': start / 1e3, 'dur': duration / 1e3,
+                           'pid': 0, 'tid': 0})
+        for name, timestamp, values in self.counter_events:
+            events.append({'name': name, 'cat': 'counter', 'ph': 'C',
+                           'ts': timestamp / 1e3, 'pid': 0, 'args': values})
+        with open(fn, 'w') as fp:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, fp)
+        logging.info("Exported %d trace events to %s", len(events), fn)
+
+    def clear(self):
+        self.scope_times.clear()
+        self.frame_times.clear()
+        self.trace_events.clear()
+        self.counter_events.clear()
+        self.counters.clear()
+        self._current.clear()
+
+def _percentiles(values) -> Tuple[float, float, float]:
+    if not values:
+        return (0., 0., 0.)
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return (ordered[last // 2], ordered[(last * 95) // 100], ordered[last])
+
+PROFILER = FrameProfiler()
+
+class _Scope():
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        PROFILER._depth += 1
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = time.perf_counter_ns() - self.start
+        PROFILER._depth -= 1
+        PROFILER.record(self.name, self.start, duration)
+        return False
+
+class _NullScope():
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_null_scope = _NullScope()
+
+def scope(name: str):
+    """
+    with frame_profiler.scope('ai_think'):
+        ...
+    """
+    if _enabled:
+        return _Scope(name)
+    return _null_scope
+
+def timed(name: str):
+    """
+    Decorator version of scope
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Scope(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def count(name: str, **values: float):
+    """
+    frame_profiler.count('roam_ai far', updates=3, deferred=1)
+    """
+    if _enabled:
+        PROFILER.count(name, values)
+
+def is_enabled() -> bool:
+    return _enabled
+
+def set_enabled(enabled: bool):
+    global _enabled, _show_overlay
+    _enabled = enabled
+    _show_overlay = enabled
+    if not enabled:
+        PROFILER.clear()
+
+def begin_frame():
+    if _enabled:
+        PROFILER.begin_frame()
+
+def end_frame():
+    if _enabled:
+        PROFILER.end_frame()
+
+def toggle_overlay():
+    global _show_overlay
+    _show_overlay = not _show_overlay
+
+def export_chrome_trace() -> Optional[str]:
+    if not _enabled:
+        return None
+    if not os.path.isdir('profiles'):
+        os.mkdir('profiles')
+    current_time = str(datetime.now()).replace(' ', '_').replace(':', '.')
+    fn = 'profiles/LT_trace_%s.json' % current_time
+    PROFILER.export_chrome_trace(fn)
+    return fn
+
+def draw_overlay(surf):
+    if not _enabled or not _show_overlay:
+        return surf
+    from app.engine.fonts import FONT
+    font = FONT['small-white']
+    font.blit('scope  p50  p95  max', surf, (2, 0))
+    rows = [(name, '%.1f %.1f %.1f' % (p50, p95, worst)) for name, p50, p95, worst in PROFILER.get_stats()]
+    rows += [(name, ' '.join('%g' % round(value, 1) for value in values.values()))
+             for name, values in PROFILER.get_counters()]
+    for idx, (name, text) in enumerate(rows):
+        y = 10 + idx * 10
+        if y > surf.get_height() - 10:
+            break
+        font.blit(name[:14], surf, (2, y))
+        font.blit(text, surf, (64, y))
+    return surf
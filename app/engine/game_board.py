@@ -20,6 +20,8 @@ class GameBoard(object):
         self.height: int = tilemap.height
         self.bounds: Tuple[int, int, int, int] = (0, 0, self.width - 1, self.height - 1)
         self.mcost_grids: Dict[NID, Grid[Node]] = {}
+        # Goes up whenever the movement grids change
+        self.movement_grid_version: int = 0
 
         self.reset_tile_grids(tilemap)
 
@@ -33,6 +35,8 @@ class GameBoard(object):
         for team in DB.teams:
             self.fog_of_war_grids[team.nid] = self.init_set_grid()
         self.fow_vantage_point = {}  # Unit: Position where the unit is that's looking
+        # Unit: (Team, Positions the unit added itself to in that team's fog of war grid)
+        self._fow_positions: Dict[NID, Tuple[NID, Set[Pos]]] = {}
         self.fog_regions = self.init_set_grid()
         self.fog_region_set: Set[NID] = set()  # Set of Fog region nids so we can tell how many fog regions exist at all times
         self.vision_regions = self.init_set_grid()
@@ -70,6 +74,7 @@ class GameBoard(object):
                 mtype_grid.append(terrain.mtype)
         for mode in DB.mcost.unit_types:
             self.mcost_grids[mode] = self.init_movement_grid(mode, tilemap, mtype_grid)
+        self.movement_grid_version += 1
         self.opacity_grid = self.init_opacity_grid(tilemap)
 
     def reset_pos(self, tilemap, pos: Pos):
@@ -87,6 +92,7 @@ class GameBoard(object):
             else:
                 tile_cost = 1
             mcost_grid.insert(pos, Node(*pos, tile_cost < 99, tile_cost))
+        self.movement_grid_version += 1
 
         # Opacity reset
         if terrain:
@@ -175,8 +181,13 @@ class GameBoard(object):
         grid: Grid[List[UnitObject]] = self.fog_of_war_grids[unit.team]
         # Remove the old vision
         self.fow_vantage_point[unit.nid] = None
-        for cell in grid.cells():
-            cell.discard(unit.nid)
+        old_vision = self._fow_positions.pop(unit.nid, None)
+        if old_vision and old_vision[0] == unit.team:
+            for position in old_vision[1]:
+                grid.get(position).discard(unit.nid)
+        else:
+            for cell in grid.cells():
+                cell.discard(unit.nid)
         # Add new vision
         if pos:
             self.fow_vantage_point[unit.nid] = pos
@@ -184,6 +195,7 @@ class GameBoard(object):
             positions = {pos for pos in positions if 0 <= pos[0] < self.width and 0 <= pos[1] < self.height}
             for position in positions:
                 grid.get(position).add(unit.nid)
+            self._fow_positions[unit.nid] = (unit.team, positions)
             self._update_previously_visited(positions, unit.team)
 
     def change_sight_range(self, unit: UnitObject, new_sight_range: int):
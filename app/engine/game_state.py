@@ -35,6 +35,7 @@ if TYPE_CHECKING:
     from app.events.event_manager import EventManager
     from app.engine.target_system import TargetSystem
     from app.engine.pathfinding.path_system import PathSystem
+    from app.engine.unit_index import UnitIndex
     from app.utilities.typing import NID, UID, Pos
 
 from app.constants import VERSION
@@ -101,6 +102,7 @@ class GameState():
 
         # global registries
         self.unit_registry: Dict[NID, UnitObject] = {}
+        self._unit_index: Optional[UnitIndex] = None
         self.item_registry: Dict[UID, ItemObject] = {}
         self.skill_registry: Dict[UID, SkillObject] = {}
         self.terrain_status_registry: Dict[Tuple[int, int, NID], UID] = {}
@@ -158,6 +160,7 @@ class GameState():
 
     def on_alter_game_state(self):
         ltcache.alter_state()
+        self._unit_index = None
 
     def clear(self):
         self.game_vars = PrimitiveCounter()
@@ -190,6 +193,7 @@ class GameState():
         self.playtime = 0
 
         self.unit_registry = {}
+        self._unit_index = None
         self.item_registry = {}
         self.skill_registry = {}
         self.terrain_status_registry = {}
@@ -316,6 +320,7 @@ class GameState():
                 else:
                     logging.warning("Unit %s's position not on map. Removing...", unit.nid)
                     unit.position = None
+                    self.invalidate_unit_index()
 
         # Handle initiative
         if DB.constants.value('initiative'):
@@ -402,7 +407,7 @@ class GameState():
                   'parties': [party.save() for party in self.parties.values()],
                   'current_party': self.current_party,
                   'state': self.state.save(),
-                  'action_log': self.action_log.save(),
+                  'action_log': self.action_log.save(DB.constants.value('compact_turnwheel_saves')),
                   'events': self.events.save(),
                   'supports': self.supports.save(),
                   'records': self.records.save(),
@@ -470,6 +475,7 @@ class GameState():
         save.set_next_uids(self)
         self.terrain_status_registry = s_dict.get('terrain_status_registry', {})
         self.unit_registry = {unit['nid']: UnitObject.restore(unit, self) for unit in s_dict['units']}
+        self._unit_index = None
         self.region_registry = {region['nid']: RegionObject.restore(region) for region in s_dict.get('regions', [])}
 
         # Handle subitems
@@ -603,6 +609,7 @@ class GameState():
             unit.sprite.change_state('normal')
             unit.sprite.reset()
             unit.reset()
+        self.invalidate_unit_index()
 
         for item in list(self.item_registry.values()):
             unit = None
@@ -625,6 +632,7 @@ class GameState():
 
             # Remove all non-persistent units
             self.unit_registry = {k: v for (k, v) in self.unit_registry.items() if v.persistent}
+            self.invalidate_unit_index()
 
             # Remove any skill that's not on a unit and does not have a parent_skill
             for k, v in list(self.skill_registry.items()):
@@ -832,6 +840,37 @@ class GameState():
         """
         return list(self.unit_registry.values())
 
+    @property
+    def unit_index(self) -> UnitIndex:
+        """
+        Gets the registered units grouped by team, AI group and whether they are on the map.
+        Rebuilt only after the units have changed, so prefer this to filtering `units`.
+
+        Returns:
+            UnitIndex: The current unit index. Do not modify its groups.
+        """
+        if self._unit_index is None:
+            from app.engine.unit_index import UnitIndex
+            self._unit_index = UnitIndex(self.unit_registry.values())
+        return self._unit_index
+
+    def invalidate_unit_index(self):
+        """
+        Call after changing any unit's position, team, AI group, death state or tags
+        outside of an action. Actions already do this on their own.
+        """
+        self._unit_index = None
+
+    @property
+    def units_on_map(self) -> Tuple[UnitObject, ...]:
+        """
+        Gets all registered units that have a position.
+
+        Returns:
+            Tuple[UnitObject, ...]: The units on the map, in registry order.
+        """
+        return self.unit_index.on_map
+
     @property
     def regions(self) -> List[RegionObject]:
         """
@@ -845,10 +884,12 @@ class GameState():
     def register_unit(self, unit):
         logging.debug("Registering unit %s as %s", unit, unit.nid)
         self.unit_registry[unit.nid] = unit
+        self._unit_index = None
 
     def unregister_unit(self, unit):
         logging.debug("Unregistering unit %s as %s", unit, unit.nid)
         del self.unit_registry[unit.nid]
+        self._unit_index = None
 
     def register_item(self, item):
         logging.debug("Registering item %s as %s", item, item.uid)
@@ -1044,7 +1085,7 @@ class GameState():
         Returns:
             List[UnitObject]: A list of units belonging to the specified AI group.
         """
-        return [unit for unit in self.get_all_units() if unit.ai_group == ai_group_nid]
+        return list(self.unit_index.on_field_by_ai_group.get(ai_group_nid, ()))
 
     def get_all_units(self, only_on_field: bool = True) -> List[UnitObject]:
         """
@@ -1057,7 +1098,7 @@ class GameState():
             List[UnitObject]: A list of all units in the game.
         """
         if only_on_field:
-            return [unit for unit in self.units if unit.position and not unit.dead and not unit.is_dying and 'Tile' not in unit.tags]
+            return list(self.unit_index.on_field)
         else:
             return self.units
 
@@ -1071,7 +1112,7 @@ class GameState():
         Returns:
             List[UnitObject]: A list of all units belonging to the player's team.
         """
-        return [unit for unit in self.get_all_units(only_on_field) if unit.team == 'player']
+        return self.get_team_units('player', only_on_field)
 
     def get_enemy_units(self, only_on_field: bool = True) -> List[UnitObject]:
         """
@@ -1083,7 +1124,8 @@ class GameState():
         Returns:
             List[UnitObject]: A list of all units belonging to enemy teams.
         """
-        return [unit for unit in self.get_all_units(only_on_field) if unit.team in DB.teams.enemies]
+        units = self.unit_index.on_field if only_on_field else self.unit_registry.values()
+        return [unit for unit in units if unit.team in DB.teams.enemies]
 
     def get_enemy1_units(self, only_on_field: bool = True) -> List[UnitObject]:
         """
@@ -1095,7 +1137,7 @@ class GameState():
         Returns:
             List[UnitObject]: A list of all units belonging to the 'enemy' team.
         """
-        return [unit for unit in self.get_all_units(only_on_field) if unit.team == 'enemy']
+        return self.get_team_units('enemy', only_on_field)
 
     def get_enemy2_units(self, only_on_field: bool = True) -> List[UnitObject]:
         """
@@ -1107,7 +1149,7 @@ class GameState():
         Returns:
             List[UnitObject]: A list of all units belonging to the 'enemy2' team.
         """
-        return [unit for unit in self.get_all_units(only_on_field) if unit.team == 'enemy2']
+        return self.get_team_units('enemy2', only_on_field)
 
     def get_other_units(self, only_on_field: bool = True) -> List[UnitObject]:
         """
@@ -1119,7 +1161,7 @@ class GameState():
         Returns:
             List[UnitObject]: A list of all units belonging to the 'other' team.
         """
-        return [unit for unit in self.get_all_units(only_on_field) if unit.team == 'other']
+        return self.get_team_units('other', only_on_field)
 
     def get_team_units(self, team: str, only_on_field: bool = True) -> List[UnitObject]:
         """
@@ -1132,7 +1174,9 @@ class GameState():
         Returns:
             List[UnitObject]: A list of all units belonging to the specified team.
         """
-        return [unit for unit in self.get_all_units(only_on_field) if unit.team == team]
+        if only_on_field:
+            return list(self.unit_index.on_field_by_team.get(team, ()))
+        return list(self.unit_index.by_team.get(team, ()))
 
     def get_travelers(self) -> List[UnitObject]:
         """
@@ -1344,6 +1388,7 @@ class GameState():
         if not test:
             self.board.remove_unit(unit.position, unit)
         unit.position = None
+        self._unit_index = None
 
     def remove_terrain_skills(self, unit, test=False):
         from app.engine import action
@@ -1383,6 +1428,7 @@ class GameState():
 
         # Set position
         unit.position = position
+        self._unit_index = None
         if not test:
             self.board.set_unit(unit.position, unit)
 
@@ -1408,6 +1454,81 @@ class GameState():
         if not test:
             self.boundary.arrive(unit)
 
+    def roam_move(self, unit: UnitObject, position: Pos):
+        """
+        Moves a free roaming unit from its tile onto a neighboring one.
+        Ends up the same as leaving, arriving, and then updating fog of war,
+        but skips the work that would come out the same on both tiles,
+        and leaves the boundary ranges to be recalculated when next drawn.
+        None of this goes in the turnwheel's action log
+        """
+        from app.engine import action, aura_funcs, skill_system
+        old_position = unit.position
+        logging.debug("Roam %s from %s to %s", unit, old_position, position)
+        self.action_log.stop_recording()
+        try:
+            # Auras from other units
+            # An aura that covers both tiles stays put, unless it also needs line of sight
+            old_auras = set(self.board.get_auras(old_position))
+            new_auras = set(self.board.get_auras(position))
+            if not DB.constants.value('aura_los'):
+                old_auras, new_auras = old_auras - new_auras, new_auras - old_auras
+            for child_aura_uid, target in old_auras:
+                aura_funcs.remove_aura(unit, self.get_skill(child_aura_uid))
+            own_auras = [skill for skill in unit.all_skills if skill.aura]
+            for skill in own_auras:
+                aura_funcs.release_aura(unit, skill, self)
+
+            # Status regions -- a region that covers both tiles keeps its status
+            old_regions, new_regions = [], []
+            for region in self.level.regions:
+                if region.region_type == RegionType.STATUS:
+                    in_old, in_new = region.contains(old_position), region.contains(position)
+                    if in_old and not in_new:
+                        old_regions.append(region)
+                    elif in_new and not in_old:
+                        new_regions.append(region)
+            for region in old_regions:
+                skill_obj = self.get_skill(self._get_terrain_status((*region.position, region.sub_nid)))
+                if skill_obj and skill_obj in unit.all_skills:
+                    action.do(action.RemoveSkill(unit, skill_obj, source=region.nid, source_type=SourceType.REGION))
+            self.remove_terrain_skills(unit)
+
+            # Board
+            self.board.remove_unit(old_position, unit)
+            unit.position = position
+            self._unit_index = None
+            self.board.set_unit(position, unit)
+
+            if not skill_system.ignore_terrain(unit):
+                self.add_terrain_status(unit, False)
+            if not skill_system.ignore_region_status(unit):
+                for region in new_regions:
+                    self.add_region_status(unit, region, False)
+
+            for child_aura_uid, target in new_auras:
+                child_skill = self.get_skill(child_aura_uid)
+                owner = self.get_unit(child_skill.parent_skill.owner_nid)
+                if owner is not unit:
+                    aura_funcs.apply_aura(owner, unit, child_skill, target)
+            for skill in own_auras:
+                aura_funcs.propagate_aura(unit, skill, self)
+            if own_auras:
+                self.boundary.unregister_unit_auras(unit)
+                self.boundary.register_unit_auras(unit)
+
+            # Boundary
+            self.boundary.roam_move(unit, old_position)
+
+            # Fog of War
+            fog_of_war_radius = self.board.get_fog_of_war_radius(unit.team)
+            sight_range = skill_system.sight_range(unit) + fog_of_war_radius
+            self.board.update_fow(position, unit, sight_range)
+            self.boundary.reset_fog_of_war()
+        finally:
+            self.action_log.start_recording()
+        self.on_alter_game_state()
+
     def add_terrain_status(self, unit, test):
         from app.engine import action, item_funcs
 
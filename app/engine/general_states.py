@@ -20,7 +20,7 @@ from app.engine.game_state import game
 from app.engine import engine, action, menus, image_mods, \
     banner, save, phase, skill_system, item_system, \
     item_funcs, ui_view, base_surf, gui, background, dialog, \
-    text_funcs, equations, evaluate, supports
+    text_funcs, equations, evaluate, supports, asset_warmup
 from app.engine.combat import base_combat, interaction
 from app.engine.selection_helper import SelectionHelper
 from app.engine.abilities import ABILITIES, PRIMARY_ABILITIES, OTHER_ABILITIES, TradeAbility, SupplyAbility
@@ -42,6 +42,7 @@ class LoadingState(State):
         self.completed_time = None
         # magic number, adjust at will
         self.loading_threads: List[threading.Thread] = []
+        self.warmup: Optional[asset_warmup.AssetWarmup] = None
 
         # unload used assets
         # unload music
@@ -63,7 +64,14 @@ class LoadingState(State):
             loading_music_thread.start()
             self.loading_threads.append(loading_music_thread)
 
+            # decode the images the level's units will need, and build their sprites
+            if asset_warmup.enabled:
+                self.warmup = asset_warmup.AssetWarmup(game.get_all_units())
+                self.warmup.start()
+
     def update(self):
+        if self.warmup and self.warmup.update():
+            self.warmup = None
         if not self.completed_time and not any([thread.is_alive() for thread in self.loading_threads]):
             self.completed_time = engine.get_time()
         if self.completed_time:
@@ -76,7 +84,11 @@ class LoadingState(State):
         return surf
 
     def end(self):
-        pass
+        # whatever the warmup did not get to during the loading screen, do now
+        if self.warmup:
+            self.warmup.finish()
+            self.warmup = None
+        engine.clear_staged_images()
 
 class TurnChangeState(MapState):
     name = 'turn_change'
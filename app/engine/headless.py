@@ -0,0 +1,225 @@
+"""
+Headless simulation harness.
+
+Loads a project and level without opening a window (SDL dummy video and audio
+drivers), hands every team over to the AI, including the player, and runs the
+real state machine for a number of turns. `GameState`, `AIController`,
+`CombatPhaseSolver` and friends all run exactly as they would in game.
+
+Reports time spent per phase and per state, calls to `PathSystem` and
+`TargetSystem`, and optionally memory use. Used by
+utilities/benchmarks/run_benchmarks.py as a regression benchmark.
+
+    python -m app.engine.headless testing_proj 0 --turns 5
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+import logging
+import os
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from app.constants import FRAMERATE, WINHEIGHT, WINWIDTH
+
+# States that wait on the player, and the input that moves them along
+SKIP_INPUTS = {'event': 'START',
+               'dialog_log': 'BACK'}
+# States that mean the level is over
+END_STATES = ('title_start', 'game_over')
+
+@dataclass
+class SimulationReport():
+    project: str
+    level_nid: str
+    turns: int = 0
+    frames: int = 0
+    total_time: float = 0  # seconds
+    phase_time: Dict[str, float] = field(default_factory=dict)  # seconds per team phase
+    state_time: Dict[str, float] = field(default_factory=dict)  # seconds per state
+    calls: Dict[str, int] = field(default_factory=dict)  # calls per PathSystem/TargetSystem method
+    peak_memory: Optional[int] = None  # bytes, only if memory was tracked
+
+    def total_calls(self, prefix: str) -> int:
+        return sum(count for name, count in self.calls.items() if name.startswith(prefix))
+
+    def summary(self) -> str:
+        lines = ["%s level %s: %d turns in %d frames, %.2f s" %
+                 (self.project, self.level_nid, self.turns, self.frames, self.total_time)]
+        for phase, t in sorted(self.phase_time.items(), key=lambda x: -x[1]):
+            lines.append("  phase %-16s %8.3f s" % (phase, t))
+        for state, t in sorted(self.state_time.items(), key=lambda x: -x[1]):
+            lines.append("  state %-16s %8.3f s" % (state, t))
+        lines.append("  PathSystem calls:   %d" % self.total_calls('PathSystem.'))
+        lines.append("  TargetSystem calls: %d" % self.total_calls('TargetSystem.'))
+        for name, count in sorted(self.calls.items(), key=lambda x: -x[1]):
+            lines.append("    %-48s %8d" % (name, count))
+        if self.peak_memory is not None:
+            lines.append("  Peak memory: %.1f MB" % (self.peak_memory / 1e6))
+        return '\n'.join(lines)
+
+def count_calls(obj, counter: collections.Counter):
+    """
+    Replaces each public method of obj with a wrapper that counts its calls
+    """
+    cls_name = obj.__class__.__name__
+    for name in dir(obj.__class__):
+        if name.startswith('__'):
+            continue
+        method = getattr(obj, name)
+        if not callable(method):
+            continue
+
+        def make_wrapper(method, key):
+            @functools.wraps(method)
+            def wrapper(*args, **kwargs):
+                counter[key] += 1
+                return method(*args, **kwargs)
+            return wrapper
+        setattr(obj, name, make_wrapper(method, '%s.%s' % (cls_name, name)))
+
+_initialized_project: Optional[str] = None
+
+def init(project: str = 'testing_proj'):
+    """
+    Starts the engine with dummy video and audio drivers and loads the project
+    """
+    global _initialized_project
+    from app.sprites import SPRITES
+    # Loading resources again (even for the same project) throws away the loaded sprites
+    if _initialized_project == project and SPRITES.get('cursor'):
+        return
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    from app.data.database.database import DB
+    from app.data.resources.resources import RESOURCES
+    from app.data.serialization.versions import CURRENT_SERIALIZATION_VERSION
+    from app.engine import driver
+
+    if not os.path.exists(project + '.ltproj'):
+        raise ValueError("Could not locate LT project %s" % (project + '.ltproj'))
+    RESOURCES.load(project + '.ltproj', CURRENT_SERIALIZATION_VERSION)
+    DB.load(project + '.ltproj', CURRENT_SERIALIZATION_VERSION)
+    if _initialized_project:
+        from app.engine import sprites
+        sprites.load_images()
+    else:
+        driver.start('Headless', from_editor=True)
+    _initialized_project = project
+
+class HeadlessRunner():
+    def __init__(self, project: str = 'testing_proj', seed: int = 0, track_memory: bool = False):
+        self.project = project
+        self.seed = seed
+        self.track_memory = track_memory
+
+        self.surf = None
+
+    def _advance_clock(self):
+        # Fixed timestep, so the simulation does not depend on how fast the machine is
+        from app.engine import engine
+        engine.constants['last_time'] = engine.constants['current_time']
+        engine.constants['current_time'] += FRAMERATE
+        engine.constants['delta_t'] = FRAMERATE
+
+    def start_level(self, level_nid: str):
+        init(self.project)
+        from app.engine import config as cf
+        from app.engine import engine, game_state, save
+
+        save.DISK_SAVES_ENABLED = False
+        cf.SETTINGS['random_seed'] = self.seed
+        cf.SETTINGS['animation'] = 'Never'
+        cf.SETTINGS['unit_speed'] = 0
+        cf.SETTINGS['text_speed'] = 0
+        cf.SETTINGS['autocursor'] = 0
+        random.seed(self.seed)
+
+        self.surf = engine.create_surface((WINWIDTH, WINHEIGHT))
+        return game_state.start_level(level_nid)
+
+    def step(self, game) -> str:
+        """
+        Runs one frame of the state machine. Returns the name of the state that was run
+        """
+        state_name = game.state.current()
+        self._advance_clock()
+        self.surf, repeat = game.state.update(SKIP_INPUTS.get(state_name), self.surf)
+        while repeat:
+            self.surf, repeat = game.state.update([], self.surf)
+        return state_name
+
+    def run_until(self, game, state_name: str, max_frames: int = 10000) -> bool:
+        """
+        Runs frames until the state machine reaches `state_name`
+        """
+        for _ in range(max_frames):
+            if game.state.current() == state_name:
+                return True
+            self.step(game)
+        return False
+
+    def run_level(self, level_nid: str, num_turns: int = 3, max_frames: int = 100000) -> SimulationReport:
+        report = SimulationReport(self.project, level_nid)
+        phase_time = collections.Counter()
+        state_time = collections.Counter()
+        calls = collections.Counter()
+
+        if self.track_memory:
+            tracemalloc.start()
+        start_time = time.perf_counter()
+
+        game = self.start_level(level_nid)
+        count_calls(game.path_system, calls)
+        count_calls(game.target_system, calls)
+        start_turn = game.turncount
+
+        for frame in range(max_frames):
+            state_name = game.state.current()
+            if state_name in END_STATES or game.turncount - start_turn >= num_turns:
+                break
+            if state_name == 'free':
+                # Hand the player's units over to the AI
+                game.state.change('ai')
+
+            frame_start = time.perf_counter()
+            self.step(game)
+            elapsed = time.perf_counter() - frame_start
+
+            state_time[state_name] += elapsed
+            if game.phase:
+                phase_time[game.phase.get_current()] += elapsed
+            report.frames += 1
+
+        report.total_time = time.perf_counter() - start_time
+        if self.track_memory:
+            report.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        report.turns = game.turncount - start_turn
+        report.phase_time = dict(phase_time)
+        report.state_time = dict(state_time)
+        report.calls = dict(calls)
+        return report
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Run a level headlessly with AI on every team")
+    parser.add_argument('project', nargs='?', default='testing_proj')
+    parser.add_argument('level', nargs='?', default=None)
+    parser.add_argument('--turns', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--memory', action='store_true', help="Track peak memory (slows down the simulation)")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    init(args.project)
+    from app.data.database.database import DB
+    level_nid = args.level or DB.levels[0].nid
+    runner = HeadlessRunner(args.project, args.seed, args.memory)
+    print(runner.run_level(level_nid, args.turns).summary())
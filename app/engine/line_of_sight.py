@@ -39,7 +39,7 @@ def simple_check(dest_pos: Pos, team: NID, default_range: int, fow_vantage_point
     """
     Returns true if can see position with line of sight
     """
-    info = [(fow_vantage_point[unit.nid], skill_system.sight_range(unit)) for unit in game.units if unit.team == team and fow_vantage_point.get(unit.nid)]
+    info = [(fow_vantage_point[unit.nid], skill_system.sight_range(unit)) for unit in game.unit_index.by_team.get(team, ()) if fow_vantage_point.get(unit.nid)]
     for s_pos, extra_range in info:
         if s_pos == dest_pos:
             return True
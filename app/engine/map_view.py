@@ -15,6 +15,13 @@ class MapView():
         self._unit_surf = engine.create_surface((WINWIDTH, WINHEIGHT), transparent=True)
         self._line_surf = engine.copy_surface(self._unit_surf)
         self._line_surf.fill((0, 0, 0, 0))
+        # Reused every frame, rather than allocating new surfaces
+        self._frame_surf = None
+
+    def _get_frame_surf(self, size):
+        if not self._frame_surf or self._frame_surf.get_size() != size:
+            self._frame_surf = engine.create_surface(size, transparent=True)
+        return self._frame_surf
 
     def save_screenshot(self):
         import os
@@ -43,7 +50,8 @@ class MapView():
         engine.save_surface(surf, 'screenshots/LT_%s_map_view.png' % current_time)
 
     def draw_units(self, surf, cull_rect, subsurface_rect=None):
-        unit_surf = engine.copy_surface(self._unit_surf)
+        unit_surf = self._unit_surf
+        unit_surf.fill((0, 0, 0, 0))
         cull_rect_in_tiles = cull_rect[0] / TILEWIDTH, cull_rect[1] / TILEHEIGHT, cull_rect[2] / TILEWIDTH, cull_rect[3] / TILEHEIGHT
         cull_rect_center_in_tiles = tuple_add(cull_rect_in_tiles[:2], tmult(cull_rect_in_tiles[2:], 0.5))
 
@@ -122,16 +130,15 @@ class MapView():
                 bg_y = 0
 
             parallax_cull = (bg_x, bg_y, cull_rect[2], cull_rect[3])
-            base_image = game.bg_tilemap.get_full_image(parallax_cull)
-            map_image = game.tilemap.get_full_image(cull_rect)
-            surf = engine.copy_surface(base_image)
-            surf = surf.convert_alpha()
-            surf.blit(map_image, shake)
+            surf = self._get_frame_surf(cull_rect[2:])
+            # Wherever the background has no tiles stays transparent
+            surf.fill((0, 0, 0, 0))
+            game.bg_tilemap.blit_full_image(surf, parallax_cull)
+            game.tilemap.blit_full_image(surf, cull_rect, shake)
         else:
-            surf = engine.create_surface(cull_rect[2:])
-            map_image = game.tilemap.get_full_image(cull_rect)
-            surf.blit(map_image, shake)
-            surf = surf.convert_alpha()
+            surf = self._get_frame_surf(cull_rect[2:])
+            surf.fill((0, 0, 0))
+            game.tilemap.blit_full_image(surf, cull_rect, shake)
 
         surf = game.boundary.draw_auras(surf, full_size, cull_rect)
         surf = game.boundary.draw(surf, full_size, cull_rect)
@@ -160,8 +167,7 @@ class MapView():
             anim.draw(surf, offset=(-game.camera.get_x(), -game.camera.get_y()))
 
         if game.tilemap.foreground_layers():
-            foreground_image = game.tilemap.get_foreground_image(cull_rect)
-            surf.blit(foreground_image, (0, 0))
+            game.tilemap.blit_foreground_image(surf, cull_rect)
 
         # Handle time region text
         self.time_region_text(surf, cull_rect)
@@ -188,7 +194,8 @@ class MapView():
 
     def draw_grid(self, surf, cull_rect):
         # Draw board grid
-        line_surf = engine.copy_surface(self._line_surf)
+        line_surf = self._line_surf
+        line_surf.fill((0, 0, 0, 0))
 
         bounds = game.board.bounds
         
@@ -24,7 +24,8 @@ class Link():
 
 class CliffManager():
     def __init__(self, cliff_positions, size):
-        self.unexplored = set([Link(pos) for pos in cliff_positions])
+        # Key: Position, Value: Link that is not part of a chain yet
+        self.unexplored = {pos: Link(pos) for pos in cliff_positions}
         unexplored_length = len(self.unexplored)
         self.chains = []
         if self.unexplored:
@@ -42,7 +43,7 @@ class CliffManager():
     def gen_chains(self):
         current_chain = set()
         explored = []
-        explored.append(self.unexplored.pop())
+        explored.append(self.unexplored.popitem()[1])
         while explored:
             current_link = explored.pop()
             current_chain.add(current_link)
@@ -52,14 +53,14 @@ class CliffManager():
                 for a in adj:
                     self.make_adjacent(current_link, a)
                     explored.append(a)
-                self.unexplored -= adj
+                    del self.unexplored[a.position]
             elif explored:
                 continue
             else:
                 self.chains.append(current_chain)
                 if self.unexplored:
                     current_chain = set()
-                    current_link = self.unexplored.pop()
+                    current_link = self.unexplored.popitem()[1]
                     explored.append(current_link)
 
     def make_adjacent(self, a, b):
@@ -72,13 +73,14 @@ class CliffManager():
     def get_adjacent(self, current_link):
         adj = set()
         pos = current_link.position
-        for link in self.unexplored:
-            if self.is_adjacent(link.position, pos):
+        for other_pos in ((pos[0], pos[1] - 1), (pos[0] - 1, pos[1]), (pos[0] + 1, pos[1]), (pos[0], pos[1] + 1)):
+            link = self.unexplored.get(other_pos)
+            if link is not None:
                 adj.add(link)
-        for link in self.unexplored:
+        for other_pos in ((pos[0] - 1, pos[1] - 1), (pos[0] - 1, pos[1] + 1), (pos[0] + 1, pos[1] - 1), (pos[0] + 1, pos[1] + 1)):
+            link = self.unexplored.get(other_pos)
             # If you are at a diagonal and you are not adjacent to anything I am already adjacent to
-            if link.position in ((pos[0] - 1, pos[1] - 1), (pos[0] - 1, pos[1] + 1), (pos[0] + 1, pos[1] - 1), (pos[0] + 1, pos[1] + 1)) and \
-                    not any(self.is_adjacent(a.position, link.position) for a in adj):
+            if link is not None and not any(self.is_adjacent(a.position, other_pos) for a in adj):
                 adj.add(link)
         return adj
 
@@ -197,14 +199,17 @@ class MiniMap(object):
     cliffs = ('Cliff', 'Desert_Cliff', 'Snow_Cliff')
     complex_map = ('Wall', 'River', 'Sand', 'Sea', 'Lava')
     scale_factor = 4
+    # (tilemap, which of its layers are visible) -> terrain surf and cliff manager
+    # for the last tilemap shown, since the terrain never changes otherwise
+    _terrain_cache = None
 
     def __init__(self, tilemap, units):
         self.tilemap = tilemap
         self.width = self.tilemap.width
         self.height = self.tilemap.height
         self.colorkey = (0, 0, 0)
-        self.surf = engine.create_surface((self.width*self.scale_factor, self.height*self.scale_factor))
-        engine.set_colorkey(self.surf, self.colorkey, rleaccel=False)  # black is transparent
+        self._minimap_keys = {}
+        self.surf = self.build_terrain()
         self.pin_surf = engine.create_surface((self.width*self.scale_factor, self.height*self.scale_factor), transparent=True)
 
         # All the rest of this is used for occlusion generation
@@ -216,6 +221,28 @@ class MiniMap(object):
         engine.set_colorkey(self.base_mask, self.colorkey, rleaccel=False)
         engine.fill(self.base_mask, (255, 255, 255), None)
 
+        # Fog of War
+        if game.get_current_fog_info().is_active or game.board.fog_region_set:
+            self.draw_fog()
+            self.surf = self.surf.convert()
+
+        # Build units
+        self.build_units(units)
+
+    def build_terrain(self):
+        """
+        Returns a copy of the terrain surf for the tilemap, only building it
+        the first time the minimap is opened (or a layer is shown or hidden)
+        """
+        key = (self.tilemap, tuple(layer.visible for layer in self.tilemap.layers))
+        cached = MiniMap._terrain_cache
+        if cached and cached[0] == key:
+            self.cliff_manager = cached[2]
+            return engine.copy_surface(cached[1])
+
+        surf = engine.create_surface((self.width*self.scale_factor, self.height*self.scale_factor))
+        engine.set_colorkey(surf, self.colorkey, rleaccel=False)  # black is transparent
+
         # Handle cliffs
         cliff_positions = set()
         for x in range(self.width):
@@ -230,31 +257,44 @@ class MiniMap(object):
             for y in range(self.height):
                 minimap_nid = self.get_minimap_key((x, y))
                 sprite = self.handle_key(minimap_nid, (x, y))
-                self.surf.blit(sprite, (x*self.scale_factor, y*self.scale_factor))
-
-        # Fog of War
-        if game.get_current_fog_info().is_active or game.board.fog_region_set:
-            for (x, y) in utils.itergrid(self.width, self.height):
-                is_in_vision = game.board.in_vision((x, y))
-                if not is_in_vision:
-                    mask = (x * self.scale_factor, y * self.scale_factor, self.scale_factor, self.scale_factor)
-                    if game.board.terrain_known((x, y), is_in_vision):
+                surf.blit(sprite, (x*self.scale_factor, y*self.scale_factor))
+
+        MiniMap._terrain_cache = (key, surf, self.cliff_manager)
+        return engine.copy_surface(surf)
+
+    def draw_fog(self):
+        # Fill each run of fogged tiles along a row at once
+        for y in range(self.height):
+            run_start, run_color = 0, None
+            for x in range(self.width + 1):
+                color = None
+                if x < self.width:
+                    is_in_vision = game.board.in_vision((x, y))
+                    if not is_in_vision:
+                        color = 'known' if game.board.terrain_known((x, y), is_in_vision) else 'unknown'
+                if color == run_color:
+                    continue
+                if run_color:
+                    mask = (run_start * self.scale_factor, y * self.scale_factor,
+                            (x - run_start) * self.scale_factor, self.scale_factor)
+                    if run_color == 'known':
                         engine.fill(self.surf, (128, 128, 128), mask, engine.BLEND_RGB_MULT)
                     else:
                         engine.fill(self.surf, (12, 12, 12), mask)
-
-            self.surf = self.surf.convert()
-
-        # Build units
-        self.build_units(units)
+                run_start, run_color = x, color
 
     def get_minimap_key(self, pos):
+        # Some tiles look at their neighbors' keys several times
+        minimap_nid = self._minimap_keys.get(pos)
+        if minimap_nid is not None:
+            return minimap_nid
         terrain_nid = self.tilemap.get_terrain(pos)
         terrain = DB.terrain.get(terrain_nid)
         if terrain:
             minimap_nid = terrain.minimap
         else:
             minimap_nid = DB.minimap.single_map['Grass']
+        self._minimap_keys[pos] = minimap_nid
         return minimap_nid
 
     def handle_key(self, key, position):
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
-from app.engine import action
 from app.engine.game_state import game
 from app.engine.movement.roam_player_movement_component import RoamPlayerMovementComponent
 from app.utilities import utils
@@ -96,9 +95,7 @@ class RoamAIMovementComponent(RoamPlayerMovementComponent):
 
         # Move the unit's true position if necessary
         if rounded_pos != self.unit.position:
-            action.QuickLeave(self.unit).do()
-            action.QuickArrive(self.unit, rounded_pos).do()
-            action.UpdateFogOfWar(self.unit).do()
+            game.roam_move(self.unit, rounded_pos)
 
         if self.path and self.unit.position == self.path[-1]:
             self.path.pop()
@@ -6,7 +6,6 @@ from typing import List, Tuple
 from app.data.database.database import DB
 
 from app.engine.game_state import game
-from app.engine import action
 from app.engine.input_manager import get_input_manager
 from app.engine.movement.movement_component import MovementComponent
 from app.engine.movement import movement_funcs
@@ -264,6 +263,4 @@ class RoamPlayerMovementComponent(MovementComponent):
 
         # Move the unit's true position if necessary
         if rounded_pos != self.unit.position:
-            action.QuickLeave(self.unit).do()
-            action.QuickArrive(self.unit, rounded_pos).do()
-            action.UpdateFogOfWar(self.unit).do()
+            game.roam_move(self.unit, rounded_pos)
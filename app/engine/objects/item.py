@@ -34,6 +34,9 @@ class ItemObject():
             component_value.item = self
 
         self.data = {}
+        # Hook name -> components that define that hook
+        # See item_system.get_item_hook_components
+        self._hook_index = {}
 
         # For subitems
         self.subitem_uids = []
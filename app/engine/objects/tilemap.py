@@ -122,6 +122,8 @@ class TileMapObject(Prefab):
         self.width: int = 0
         self.height: int = 0
         self.nid: NID = None
+        # foreground -> (layer state key, composited image of the whole map)
+        self._composites = {}
 
     @classmethod
     def from_prefab(cls, prefab):
@@ -247,6 +249,58 @@ class TileMapObject(Prefab):
                     image.blit(autotile_image, (0, 0))
         return image
 
+    def _get_composite(self, foreground: bool):
+        """
+        Returns all the visible background (or foreground) layers of the whole map
+        composited into a single image. Only rebuilt when a layer is shown or hidden
+        or the autotiles advance a frame.
+        Returns None while a layer is fading, since that changes every frame.
+        """
+        layers = self.foreground_layers() if foreground else self.background_layers()
+        if any(layer.state for layer in layers):
+            return None
+        key = tuple((layer.visible, layer.autotile_frame) for layer in layers)
+        cached = self._composites.get(foreground)
+        if cached and cached[0] == key:
+            return cached[1]
+        full_rect = (0, 0, self.width * TILEWIDTH, self.height * TILEHEIGHT)
+        if cached:  # Reuse the old image
+            image = cached[1]
+        else:
+            image = engine.create_surface(full_rect[2:], transparent=foreground)
+            if not foreground:
+                # No RLE, since we take a subsurface of this every frame
+                engine.set_colorkey(image, COLORKEY, rleaccel=False)
+        if foreground:
+            engine.fill(image, (0, 0, 0, 0))
+        else:
+            engine.fill(image, COLORKEY)
+        for layer in layers:
+            if layer.visible and layer.should_draw(full_rect):
+                image.blit(layer.image, (0, 0))
+                if layer.autotile_images:
+                    image.blit(layer.autotile_images[layer.autotile_frame], (0, 0))
+        self._composites[foreground] = (key, image)
+        return image
+
+    def blit_full_image(self, surf, cull_rect, offset=(0, 0)):
+        """
+        Same as blitting get_full_image(cull_rect) to surf at offset,
+        but just blits the camera's window of the cached composite
+        """
+        composite = self._get_composite(False)
+        if composite:
+            surf.blit(engine.subsurface(composite, cull_rect), offset)
+        else:
+            surf.blit(self.get_full_image(cull_rect), offset)
+
+    def blit_foreground_image(self, surf, cull_rect, offset=(0, 0)):
+        composite = self._get_composite(True)
+        if composite:
+            surf.blit(engine.subsurface(composite, cull_rect), offset)
+        else:
+            surf.blit(self.get_foreground_image(cull_rect), offset)
+
     def save_screenshot(self):
         import os
         from datetime import datetime
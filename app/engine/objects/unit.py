@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
@@ -13,6 +14,7 @@ from app.engine.objects.difficulty_mode import DifficultyModeObject
 from app.engine.objects.item import ItemObject
 from app.engine.objects.skill import SkillObject
 from app.engine.source_type import SourceType
+from app.engine.utils import ltcache
 from app.utilities import utils
 from app.utilities.data import Prefab
 from app.utilities.typing import NID
@@ -24,6 +26,10 @@ if TYPE_CHECKING:
 
 import logging
 
+# Set LT_CHECK_STAT_CACHE to check every memoized stat bonus
+# against a fresh calculation, and log any that are stale
+CHECK_STAT_BONUS_CACHE: bool = "LT_CHECK_STAT_CACHE" in os.environ
+
 @dataclass
 class UnitSkill():
     """Structure used to store each skill that a unit has.
@@ -108,6 +114,14 @@ class UnitObject(Prefab):
 
     _skills: List[UnitSkill] = field(default_factory=list)
     _visible_skills_cache: List[SkillObject] = field(default_factory=list)
+    # Hook name -> (skill, component) for the components that define that hook
+    # See skill_system.get_hook_components
+    _skill_hook_index: Dict[str, list] = field(default_factory=dict)
+    _skill_hook_version: int = -1
+    # Stat NID -> bonus from skills and equipment
+    # Thrown away whenever the game state changes (see ltcache) or by invalidate_stat_bonuses
+    _stat_bonus_cache: Dict[NID, int] = field(default_factory=dict)
+    _stat_bonus_state: Optional[object] = None
 
     has_rescued: bool = False  #: Has the unit *rescued* someone this phase?
     has_taken: bool = False  #: Has the unit *taken* someone this phase?
@@ -320,6 +334,8 @@ class UnitObject(Prefab):
         for s in self._skills:
             skill_system.after_add(self, s.get())
         self._visible_skills_cache.clear()
+        self._skill_hook_index.clear()
+        self._stat_bonus_cache.clear()
 
         # -- Equipped Items
         self.autoequip()
@@ -437,6 +453,8 @@ class UnitObject(Prefab):
         if not test:
             self._skills.append(UnitSkill(skill, source, source_type))
             self._visible_skills_cache.clear()
+            self._skill_hook_index.clear()
+            self._stat_bonus_cache.clear()
         return popped_skill
 
     def remove_skill(self, skill, source, source_type=SourceType.DEFAULT, test=False):
@@ -456,6 +474,8 @@ class UnitObject(Prefab):
         if not test and to_remove:
             self._skills.remove(to_remove)
             self._visible_skills_cache.clear()
+            self._skill_hook_index.clear()
+            self._stat_bonus_cache.clear()
         return removed_skill_info
 
     @property
@@ -500,6 +520,7 @@ class UnitObject(Prefab):
         """Given a stat NID, determines the unit's bonus for that stat.
 
         Stat bonuses can come from skills or their currently equipped items.
+        Memoized until the game state changes, since equations ask for them constantly.
 
         Args:
             stat_nid (NID): The NID of the stat in question.
@@ -507,6 +528,25 @@ class UnitObject(Prefab):
         Returns:
             The unit's bonus stats for that stat.
         """
+        state = ltcache.get_state()
+        if state != self._stat_bonus_state:
+            self._stat_bonus_cache.clear()
+            self._stat_bonus_state = state
+        bonus = self._stat_bonus_cache.get(stat_nid)
+        if bonus is None:
+            bonus = self._stat_bonus_cache[stat_nid] = self._calculate_stat_bonus(stat_nid)
+        elif CHECK_STAT_BONUS_CACHE:
+            actual = self._calculate_stat_bonus(stat_nid)
+            if actual != bonus:
+                logging.error("Stale %s stat bonus for %s: memoized %s, actually %s", stat_nid, self.nid, bonus, actual)
+                bonus = self._stat_bonus_cache[stat_nid] = actual
+        return bonus
+
+    def invalidate_stat_bonuses(self):
+        """Call whenever something a stat bonus depends on changes outside of an action."""
+        self._stat_bonus_cache.clear()
+
+    def _calculate_stat_bonus(self, stat_nid: NID) -> int:
         bonus = skill_system.stat_change(self, stat_nid)
         weapon = self.equipped_weapon
         if weapon:
@@ -729,6 +769,7 @@ class UnitObject(Prefab):
             if self.equipped_weapon:
                 self.unequip(self.equipped_weapon, item)
             self.equipped_weapon = item
+        self.invalidate_stat_bonuses()
         item_system.on_equip_item(self, item)
         skill_system.on_equip_item(self, item)
 
@@ -739,6 +780,7 @@ class UnitObject(Prefab):
                 self.equipped_accessory = swap_to
             else:
                 self.equipped_weapon = swap_to
+            self.invalidate_stat_bonuses()
             skill_system.on_unequip_item(self, item)
             item_system.on_unequip_item(self, item)
 
@@ -1019,6 +1061,8 @@ class UnitObject(Prefab):
         for s in self._skills:
             skill_system.after_add_from_restore(self, s.get())
         self._visible_skills_cache.clear()
+        self._skill_hook_index.clear()
+        self._stat_bonus_cache.clear()
 
         return self
 
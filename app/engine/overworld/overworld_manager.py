@@ -53,6 +53,11 @@ class OverworldManager(OverworldManagerInterface):
         # generate useful structs
         self.nodes: Dict[NID, OverworldNodeObject] = {}
         self.roads: Dict[NID, RoadObject] = {}
+        # nodes never move, so these can be built once
+        self._nodes_by_position: Dict[Point, OverworldNodeObject] = {}
+        self._nodes_by_level: Dict[NID, OverworldNodeObject] = {}
+        # (n1, n2, neighbor_priority, force) -> roads, until the explored graph changes
+        self._routes: Dict[Tuple[NID, NID, bool, bool], List[RoadObject]] = {}
 
         self.overworld_full_graph: LTGraph[NID, OverworldNodeObject, RoadObject]  = None
         self.overworld_explored_graph: LTGraph[NID, OverworldNodeObject, RoadObject] = None
@@ -199,13 +204,20 @@ class OverworldManager(OverworldManagerInterface):
                 if no such path exists.
 
         """
-        if not self.any_path(n1, n2, force):
-            return []
-
         if isinstance(n1, OverworldNodeObject):
             n1 = n1.nid
         if isinstance(n2, OverworldNodeObject):
             n2 = n2.nid
+        key = (n1, n2, neighbor_priority, force)
+        if key not in self._routes:
+            self._routes[key] = self._find_route(n1, n2, neighbor_priority, force)
+        # callers are free to edit the list they get back
+        return self._routes[key][:]
+
+    def _find_route(self, n1: NID, n2: NID, neighbor_priority: bool, force: bool) -> List[RoadObject]:
+        if not self.any_path(n1, n2, force):
+            return []
+
         if force:
             graph = self.overworld_full_graph
         else:
@@ -231,22 +243,15 @@ class OverworldManager(OverworldManagerInterface):
         return self._overworld.node_properties.get(node, set())
 
     def node_at(self, pos: Point, force=False) -> OverworldNodeObject:
-        for node in self.nodes.values():
-            if node.position == pos:
-                if force:
-                    return node
-                else:
-                    if node.nid in self._overworld.enabled_nodes:
-                        return node
-                    else:
-                        break
+        if isinstance(pos, list):  # positions restored from a save
+            pos = tuple(pos)
+        node = self._nodes_by_position.get(pos)
+        if node and (force or node.nid in self._overworld.enabled_nodes):
+            return node
         return None
 
     def node_by_level(self, level_nid: NID) -> OverworldNodeObject:
-        for node in self.nodes.values():
-            if node.prefab.level == level_nid:
-                return node
-        return None
+        return self._nodes_by_level.get(level_nid)
 
     def move_party_to_node(self, entity_nid: NID, node_nid: NID):
         entity = self.entities[entity_nid]
@@ -330,6 +335,10 @@ class OverworldManager(OverworldManagerInterface):
     def _initialize_objects(self):
         for nid, node in self._overworld.prefab.overworld_nodes.items():
             self.nodes[nid] = OverworldNodeObject.from_prefab(node)
+        for node in self.nodes.values():
+            # if nodes overlap, the first one wins
+            self._nodes_by_position.setdefault(node.position, node)
+            self._nodes_by_level.setdefault(node.prefab.level, node)
         for rid, road in self._overworld.prefab.map_paths.items():
             self.roads[rid] = RoadObject.from_prefab(road, rid)
 
@@ -348,6 +357,7 @@ class OverworldManager(OverworldManagerInterface):
     def regenerate_explored_graph(self):
         """Forcibly regenerates the graph representation of the visible overworld graph.
         """
+        self._routes.clear()
         self.overworld_explored_graph = LTGraph()
         for vis_node_nid in self._overworld.enabled_nodes:
             self.overworld_explored_graph.add_vertex(vis_node_nid, self.nodes[vis_node_nid])
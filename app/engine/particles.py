@@ -147,6 +147,57 @@ class MapParticleSystem(SimpleParticleSystem):
         for particle in self.particles:
             particle.draw(surf, offset_x, offset_y)
 
+class ArrayParticleSystem(MapParticleSystem):
+    """
+    MapParticleSystem for LinearParticles. Rather than keeping a Particle
+    object for each particle, keeps their positions, speeds and sprites
+    in parallel lists, so each frame is a few list comprehensions
+    and a single Surface.blits call.
+    """
+    def __init__(self, nid, particle, abundance, bounds, size, blend=None, blend_type=engine.BLEND_RGB_ADD):
+        super().__init__(nid, particle, abundance, bounds, size, blend, blend_type)
+        # Only used to roll the random values of each new particle
+        self._template = particle()
+        self.xs, self.ys = [], []
+        self.x_speeds, self.y_speeds = [], []
+        self.sprites = []
+
+    def generate_new_particle(self):
+        xpos = random.randint(self.lx, self.ux)
+        ypos = random.randint(self.ly, self.uy)
+        new_particle = self._template.reset((xpos, ypos))
+        self.xs.append(new_particle.x)
+        self.ys.append(new_particle.y)
+        self.x_speeds.append(new_particle.x_speed)
+        self.y_speeds.append(new_particle.y_speed)
+        self.sprites.append(new_particle.sprite)
+
+    def update(self):
+        xs = self.xs = [x + x_speed for x, x_speed in zip(self.xs, self.x_speeds)]
+        ys = self.ys = [y + y_speed for y, y_speed in zip(self.ys, self.y_speeds)]
+
+        # Remove particles that have left the map
+        if game.tilemap:
+            max_x, min_y, max_y = self.particle.limits(game.tilemap.width * TILEWIDTH, game.tilemap.height * TILEHEIGHT)
+            keep = [idx for idx, (x, y) in enumerate(zip(xs, ys)) if x <= max_x and min_y <= y <= max_y]
+            if len(keep) < len(xs):
+                self.xs = [xs[idx] for idx in keep]
+                self.ys = [ys[idx] for idx in keep]
+                self.x_speeds = [self.x_speeds[idx] for idx in keep]
+                self.y_speeds = [self.y_speeds[idx] for idx in keep]
+                self.sprites = [self.sprites[idx] for idx in keep]
+
+        for _ in range(self.abundance - len(self.xs)):
+            self.generate_new_particle()
+
+        if self.abundance <= 0 and not self.xs:
+            self.remove_me_flag = True
+
+    def draw(self, surf, offset_x=0, offset_y=0):
+        if self.blend:
+            engine.blit(surf, self.blend, (0, 0), None, self.blend_type)
+        surf.blits([(sprite, (x - offset_x, y - offset_y)) for sprite, x, y in zip(self.sprites, self.xs, self.ys)], False)
+
 class Particle():
     sprite = None
 
@@ -162,25 +213,45 @@ class Particle():
         pos = (self.x - offset_x, self.y - offset_y)
         surf.blit(self.sprite, pos)
 
-class Raindrop(Particle):
-    sprite = SPRITES.get('particle_raindrop')
-    speed = 3
+class LinearParticle(Particle):
+    """
+    Moves at a constant speed until it leaves its limits.
+    Can be run by an ArrayParticleSystem
+    """
+    x_speed = 0
+    y_speed = 0
+
+    @classmethod
+    def limits(cls, width, height) -> tuple:
+        """
+        Returns the max x, min y and max y a particle can reach
+        before being removed, given the pixel size of the map
+        """
+        return width, -math.inf, height
 
     def update(self):
-        self.x += self.speed
-        self.y += self.speed * 4
-        if game.tilemap and (self.x > game.tilemap.width * TILEWIDTH or self.y > game.tilemap.height * TILEHEIGHT):
-            self.remove_me_flag = True
+        self.x += self.x_speed
+        self.y += self.y_speed
+        if game.tilemap:
+            max_x, min_y, max_y = self.limits(game.tilemap.width * TILEWIDTH, game.tilemap.height * TILEHEIGHT)
+            if self.x > max_x or self.y < min_y or self.y > max_y:
+                self.remove_me_flag = True
+
+class Raindrop(LinearParticle):
+    sprite = SPRITES.get('particle_raindrop')
+    speed = 3
+    x_speed = speed
+    y_speed = speed * 4
 
-class Sand(Particle):
+class Sand(LinearParticle):
     sprite = SPRITES.get('particle_sand')
     speed = 6
+    x_speed = speed * 2
+    y_speed = -speed
 
-    def update(self):
-        self.x += self.speed * 2
-        self.y -= self.speed
-        if game.tilemap and (self.x > game.tilemap.width * TILEWIDTH or self.y < -32):
-            self.remove_me_flag = True
+    @classmethod
+    def limits(cls, width, height) -> tuple:
+        return width, -32, math.inf
 
 class Smoke(Particle):
     sprite = SPRITES.get('particle_smoke')
@@ -243,24 +314,23 @@ class Fire(Particle):
         # Fire does obey camera offset
         surf.blit(self.sprite, (self.x, self.y))
 
-class Snow(Particle):
-    full_sprite = SPRITES.get('particle_snow')
+_snow_sprite = SPRITES.get('particle_snow')
+class Snow(LinearParticle):
+    full_sprite = _snow_sprite
+    if _snow_sprite:
+        sprites = [engine.subsurface(_snow_sprite, (0, i*8, 8, 8)) for i in range(3)]
+    else:
+        sprites = []
 
     def reset(self, pos):
         super().reset(pos)
-        self.sprite = engine.subsurface(self.full_sprite, (0, random.randint(0, 2) * 8, 8, 8))
+        self.sprite = self.sprites[random.randint(0, 2)]
         speeds = [1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0, 3.25, 3.5]
         self.y_speed = random.choice(speeds)
         x_speeds = speeds[:speeds.index(self.y_speed) + 1]
         self.x_speed = random.choice(x_speeds)
         return self
 
-    def update(self):
-        self.x += self.x_speed
-        self.y += self.y_speed
-        if game.tilemap and (self.x > game.tilemap.width * TILEWIDTH or self.y > game.tilemap.height * TILEHEIGHT):
-            self.remove_me_flag = True
-
 class WarpFlower(Particle):
     sprite = SPRITES.get('particle_warp_flower')
     speed = 0
@@ -435,13 +505,13 @@ def create_system(nid, width, height, position):
     twidth, theight = width * TILEWIDTH, height * TILEHEIGHT
     if nid == 'rain':
         creation_bounds = -theight // 4, twidth, -16, -8
-        ps = MapParticleSystem(nid, Raindrop, .1, creation_bounds, (width, height))
+        ps = ArrayParticleSystem(nid, Raindrop, .1, creation_bounds, (width, height))
     elif nid == 'snow':
         creation_bounds = -theight, twidth, -16, -8
-        ps = MapParticleSystem(nid, Snow, .2, creation_bounds, (width, height))
+        ps = ArrayParticleSystem(nid, Snow, .2, creation_bounds, (width, height))
     elif nid == 'sand':
         creation_bounds = -2 * theight, twidth, theight + 16, theight + 32
-        ps = MapParticleSystem(nid, Sand, .075, creation_bounds, (width, height))
+        ps = ArrayParticleSystem(nid, Sand, .075, creation_bounds, (width, height))
     elif nid == 'smoke':
         creation_bounds = -theight, twidth, theight, theight + 16
         ps = MapParticleSystem(nid, Smoke, .075, creation_bounds, (width, height))
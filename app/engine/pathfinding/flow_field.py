@@ -0,0 +1,84 @@
+import heapq
+from typing import Dict, List, Optional
+
+from app.engine import bresenham_line_algorithm
+
+from app.engine.pathfinding.node import Node
+from app.utilities.grid import BoundedGrid
+from app.utilities.typing import Pos
+
+class FlowField():
+    """
+    Every position's distance to a single goal and its next step towards it,
+    found with one Djikstra search outward from the goal.
+
+    Any number of units heading to the same goal can then read off
+    their next step, or their whole path, without searching themselves.
+    Like free roam pathfinding, other units never block the way.
+    """
+    __slots__ = ['goal', 'grid', 'distances', 'next_steps']
+
+    def __init__(self, goal: Pos, grid: BoundedGrid[Node]):
+        self.goal: Pos = goal
+        self.grid: BoundedGrid[Node] = grid
+        self.distances: Dict[Pos, float] = {}
+        self.next_steps: Dict[Pos, Pos] = {}
+        if grid.check_bounds(goal) and grid.get(goal).reachable:
+            self._process()
+
+    def _process(self):
+        grid = self.grid
+        distances = self.distances
+        next_steps = self.next_steps
+        distances[self.goal] = 0
+        open_list = [(0, self.goal)]
+        while open_list:
+            dist, pos = heapq.heappop(open_list)
+            if dist > distances[pos]:
+                continue
+            # Anything next to pos can step onto it for pos's cost
+            dist += grid.get(pos).cost
+            x, y = pos
+            for adj in ((x, y + 1), (x + 1, y), (x - 1, y), (x, y - 1)):
+                if grid.check_bounds(adj) and dist < distances.get(adj, dist + 1):
+                    distances[adj] = dist
+                    next_steps[adj] = pos
+                    # Unreachable positions can only ever be the start of a path
+                    if grid.get(adj).reachable:
+                        heapq.heappush(open_list, (dist, adj))
+
+    def get_next_step(self, pos: Pos) -> Optional[Pos]:
+        """
+        Where to go from pos to get closer to the goal.
+        None if the goal cannot be reached from pos (or pos is the goal)
+        """
+        return self.next_steps.get(pos)
+
+    def get_distance(self, pos: Pos) -> Optional[float]:
+        return self.distances.get(pos)
+
+    def _line_of_sight(self, pos1: Pos, pos2: Pos) -> bool:
+        def cannot_move_through(pos: Pos) -> bool:
+            return not self.grid.get(pos).reachable
+        return bresenham_line_algorithm.get_line(pos1, pos2, cannot_move_through)
+
+    def get_path(self, start: Pos) -> List[Pos]:
+        """
+        Returns the path from start, with the goal position first and the start position last,
+        like ThetaStar, skipping any steps that can be cut across in a straight line.
+        Returns an empty list if the goal cannot be reached
+        """
+        if start == self.goal:
+            return [start]
+        if start not in self.next_steps:
+            return []
+        steps = [start]
+        while steps[-1] != self.goal:
+            steps.append(self.next_steps[steps[-1]])
+        path = [start]
+        for idx in range(1, len(steps) - 1):
+            if not self._line_of_sight(path[-1], steps[idx + 1]):
+                path.append(steps[idx])
+        path.append(self.goal)
+        path.reverse()
+        return path
@@ -1,11 +1,13 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Optional, Set
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
 import functools
 
-from app.engine import equations, skill_system
+from app.engine import equations, frame_profiler, skill_system
 from app.engine.movement import movement_funcs
 from app.engine.pathfinding import pathfinding
+from app.engine.pathfinding.flow_field import FlowField
 from app.engine.game_state import GameState
 from app.utilities.typing import Pos
 
@@ -15,6 +17,8 @@ if TYPE_CHECKING:
     from app.engine.pathfinding.node import Node
 
 class PathSystem():
+    max_flow_fields = 16
+
     def __init__(self, game: Optional[GameState] = None):
         if game:
             self.game = game
@@ -22,6 +26,12 @@ class PathSystem():
             from app.engine.game_state import game
             self.game = game
 
+        # Key: (Movement group, Goal), most recently used last
+        self._flow_fields: OrderedDict[Tuple[str, Pos], FlowField] = OrderedDict()
+        # The board the flow fields were made for, and the version and bounds of its movement grids
+        self._flow_field_board = None
+
+    @frame_profiler.timed('pathfinding')
     def get_valid_moves(self, unit: UnitObject, force: bool = False, witch_warp: bool = True) -> Set[Pos]:
         """Given a unit, finds all positions on the map they can move to
         Assumes unit is on the map.
@@ -54,6 +64,7 @@ class PathSystem():
             valid_moves |= witch_warp
         return valid_moves
 
+    @frame_profiler.timed('pathfinding')
     def get_path(self, unit: UnitObject, position: Pos, ally_block: bool = False, 
                  use_limit: bool = False, free_movement: bool = False) -> List[Pos]:
         """Given a unit and a goal position, find the best path for the unit to get to that goal position
@@ -92,6 +103,36 @@ class PathSystem():
             return []
         return path
 
+    @frame_profiler.timed('pathfinding')
+    def get_flow_field(self, unit: UnitObject, goal: Pos) -> FlowField:
+        """Returns a flow field towards the goal position for the unit's movement group,
+        for free roam movement. Flow fields are shared by all units with the same
+        movement group and goal, and kept until the map's movement grids or bounds change.
+
+        Args:
+            unit (UnitObject): The unit that will follow the flow field
+            goal (Pos): The goal position
+
+        Returns:
+            FlowField: Gives the next step or the full path towards the goal from anywhere
+        """
+        board = self.game.board
+        board_state = (board, board.movement_grid_version, board.bounds)
+        if self._flow_field_board != board_state:
+            self._flow_fields.clear()
+            self._flow_field_board = board_state
+
+        key = (movement_funcs.get_movement_group(unit), goal)
+        flow_field = self._flow_fields.get(key)
+        if flow_field:
+            self._flow_fields.move_to_end(key)
+        else:
+            flow_field = FlowField(goal, board.get_movement_grid(key[0]))
+            self._flow_fields[key] = flow_field
+            if len(self._flow_fields) > self.max_flow_fields:
+                self._flow_fields.popitem(last=False)
+        return flow_field
+
     def check_path(self, unit: UnitObject, path: List[Pos]) -> bool:
         """Determines whether path is possible for the unit to traverse.
 
@@ -142,6 +183,6 @@ class PathSystem():
                 break
         # Don't move where a unit already is, and don't make through path < 0
         # Lower the through path by one, cause we can't move that far
-        while through_path > 0 and any(other_unit.position == path[-(through_path + 1)] for other_unit in self.game.units if unit is not other_unit):
+        while through_path > 0 and any(other_unit.position == path[-(through_path + 1)] for other_unit in self.game.units_on_map if unit is not other_unit):
             through_path -= 1
         return path[-(through_path + 1)]  # Travel as far as we can
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import time
 from typing import Dict, List, Optional, Tuple
 from app.engine.objects.unit import UnitObject
 from app.utilities.typing import NID
 
+from app.constants import TILEX, TILEY
 from app.data.database.database import DB
 from app.engine.game_state import game
-from app.engine import action, ai_controller, engine, equations, evaluate, item_funcs
+from app.engine import action, ai_controller, engine, equations, evaluate, frame_profiler, item_funcs
 from app.engine.roam import roam_ai_action
 from app.engine.movement.roam_ai_movement_component import RoamAIMovementComponent
 from app.engine.objects.region import RegionObject
@@ -18,11 +20,41 @@ import logging
 
 BASE_SPEED_DENOMINATOR = 100.
 RECALCULATE_TIME = 333  # ms
+# Offset between each unit's path recalculations, so they don't all happen on the same frame
+RECALCULATE_STAGGER = 17  # ms, about one frame
+
+# Time each frame that roam AIs far from the camera can spend updating.
+# Units near the camera are always updated and don't count against it
+FRAME_BUDGET = 2  # ms
+# How many tiles outside the camera a unit can be while still counting as near
+NEAR_MARGIN = 2
+# How many frames between each update for the units in each tier
+TIER_INTERVALS = {'near': 1, 'far': 4}
+
+class TierStats:
+    """
+    How much work the roam AIs in one update tier did during the last frame.
+    Reported to the frame profiler as a counter for each tier
+    """
+    __slots__ = ['updates', 'deferred', 'time']
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.updates: int = 0
+        # Units that were due to update, but did not fit in the budget
+        self.deferred: int = 0
+        self.time: float = 0.  # ms
 
 class FreeRoamAIHandler:
     def __init__(self):
         self.active: bool = True
         self.roam_ais: Dict[NID, RoamAI] = {}
+        self.frame: int = 0
+        # Frame on which each far away unit is next due to update
+        self.next_update: Dict[NID, int] = {}
+        self.tier_stats: Dict[str, TierStats] = {tier: TierStats() for tier in TIER_INTERVALS}
         # Keep a reference to the movement components
         # we added to the main movement system
         # to be able to stop them later
@@ -34,7 +66,10 @@ class FreeRoamAIHandler:
 
     def _add_movement_component(self, unit: UnitObject) -> Optional[RoamAIMovementComponent]:
         if unit.get_roam_ai() and DB.ai.get(unit.get_roam_ai()).roam_ai:
-            self.roam_ais[unit.nid] = RoamAI(unit)
+            count = len(self.roam_ais)
+            self.roam_ais[unit.nid] = RoamAI(unit, (count * RECALCULATE_STAGGER) % RECALCULATE_TIME)
+            # Spread out the far away units' updates too
+            self.next_update[unit.nid] = self.frame + 1 + count % TIER_INTERVALS['far']
             mc = RoamAIMovementComponent(unit)
             self.components[unit.nid] = mc
             return mc
@@ -54,20 +89,64 @@ class FreeRoamAIHandler:
     def contains_unit(self, unit: UnitObject) -> Optional[RoamAIMovementComponent]:
         return self.components.get(unit.nid)
 
+    def get_tier(self, unit: UnitObject) -> str:
+        x, y = unit.position
+        camera_x, camera_y = game.camera.get_xy()
+        if camera_x - NEAR_MARGIN <= x < camera_x + TILEX + NEAR_MARGIN and \
+                camera_y - NEAR_MARGIN <= y < camera_y + TILEY + NEAR_MARGIN:
+            return 'near'
+        return 'far'
+
+    @frame_profiler.timed('roam_ai')
     def update(self):
         if not self.active:
             return
+        self.frame += 1
+        for stats in self.tier_stats.values():
+            stats.reset()
+
+        near, far = [], []
         for unit in game.get_all_units():
             roam_ai = self.get_roam_ai(unit)
             if not roam_ai or not unit.position:
                 continue
-            if not roam_ai.state:
-                roam_ai.think()
-            self.components[roam_ai.unit.nid].set_speed(roam_ai.speed_mult)
-            roam_ai.act()
-            # Every frame, make sure our movement component has the right path
-            # if roam_ai.path:
-            self.components[roam_ai.unit.nid].set_path(roam_ai.path)
+            if self.get_tier(unit) == 'near':
+                near.append(roam_ai)
+            elif self.next_update.get(unit.nid, self.frame) <= self.frame:
+                far.append(roam_ai)
+        # Those that have waited the longest go first
+        far.sort(key=lambda roam_ai: self.next_update.get(roam_ai.unit.nid, self.frame))
+
+        for roam_ai in near:
+            self._update_unit(roam_ai, 'near')
+        # The budget is only for far units, so a busy crowd of near units
+        # can't starve them. The most overdue always gets its turn
+        start = time.perf_counter()
+        for idx, roam_ai in enumerate(far):
+            if idx and (time.perf_counter() - start) * 1e3 >= FRAME_BUDGET:
+                # The rest stay due, and so will be first next frame
+                self.tier_stats['far'].deferred = len(far) - idx
+                break
+            self._update_unit(roam_ai, 'far')
+
+        for tier, stats in self.tier_stats.items():
+            frame_profiler.count('roam_ai %s' % tier, updates=stats.updates,
+                                 deferred=stats.deferred, ms=stats.time)
+
+    def _update_unit(self, roam_ai: RoamAI, tier: str):
+        start = time.perf_counter()
+        if not roam_ai.state:
+            roam_ai.think()
+        self.components[roam_ai.unit.nid].set_speed(roam_ai.speed_mult)
+        roam_ai.act()
+        # Every frame, make sure our movement component has the right path
+        # if roam_ai.path:
+        self.components[roam_ai.unit.nid].set_path(roam_ai.path)
+        self.next_update[roam_ai.unit.nid] = self.frame + TIER_INTERVALS[tier]
+
+        stats = self.tier_stats[tier]
+        stats.updates += 1
+        stats.time += (time.perf_counter() - start) * 1e3
 
     def stop_all_units(self):
         self.active = False
@@ -90,8 +169,9 @@ class FreeRoamAIHandler:
         return self.roam_ais.get(unit.nid)
 
 class RoamAI:
-    def __init__(self, unit):
+    def __init__(self, unit, recalculate_offset: int = 0):
         self.unit = unit
+        self.recalculate_offset: int = recalculate_offset
         self.reset()
 
     def reset(self):
@@ -103,7 +183,7 @@ class RoamAI:
         self.desired_proximity = 0
         self.speed_mult: float = 1.
 
-        self._last_recalculate = engine.get_time()
+        self._last_recalculate = engine.get_time() - self.recalculate_offset
 
     def reset_for_next_behaviour(self):
         self.state = None
@@ -137,7 +217,8 @@ class RoamAI:
             next_behaviour = None
 
     def get_path(self, pos) -> List[Tuple[int, int]]:
-        return game.path_system.get_path(self.unit, pos, free_movement=True)
+        # Shared with every other roaming unit with the same goal
+        return game.path_system.get_flow_field(self.unit, pos).get_path(self.unit.position)
 
     def _calc_state(self) -> bool:
         # Returns whether we should try again
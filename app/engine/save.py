@@ -18,6 +18,8 @@ from app.engine.objects.skill import SkillObject
 import logging
 
 SAVE_THREAD = None
+# Headless simulations turn this off so they don't litter the saves folder
+DISK_SAVES_ENABLED = True
 
 def GAME_NID():
     return str(DB.constants.value('game_nid'))
@@ -137,6 +139,9 @@ def suspend_game(game_state, kind, slot: int = None, name=None):
     """
     Saves game state to file
     """
+    if not DISK_SAVES_ENABLED:
+        logging.debug("Skipping save, disk saves are disabled")
+        return
     logging.debug("Suspending game...")
     s_dict, meta_dict = game_state.save()
     logging.debug("Suspend state: %s", game_state.state.state_names())
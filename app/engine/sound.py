@@ -4,6 +4,7 @@ from app.utilities.typing import NID
 from enum import Enum
 from typing import Set, List, Optional
 from abc import ABC, abstractmethod
+import threading
 import pygame
 
 from app.utilities import utils
@@ -12,6 +13,10 @@ from app.engine import engine
 
 import logging
 
+# Songs are decoded in full into memory (about 10 MB a minute),
+# so only keep this many bytes of songs around
+MUSIC_CACHE_LIMIT = 256 * 1024 * 1024
+
 class SongObject(HasNid):
     def __init__(self, prefab: SongPrefab):
         self.nid = prefab.nid
@@ -21,34 +26,75 @@ class SongObject(HasNid):
 
         self.channel = None
 
+    @property
+    def size(self) -> int:
+        """Bytes of decoded audio"""
+        return sum(memoryview(sound).nbytes for sound in (self.song, self.battle, self.intro) if sound)
+
 class MusicDict(dict):
+    """
+    Ordered from least to most recently used.
+    Once the songs take up more than MUSIC_CACHE_LIMIT bytes,
+    the least recently used songs that are not on a channel are unloaded
+    """
+    def __init__(self):
+        super().__init__()
+        self.total_size = 0
+        # Songs are preloaded on another thread
+        self.lock = threading.Lock()
+
     def preload(self, nids):
         for nid in nids:
             self.get(nid)
 
     def get(self, val):
-        if val not in self:
-            logging.debug("Loading %s into MusicDict", val)
-            prefab = RESOURCES.music.get(val)
-            if prefab:
-                try:
-                    self[val] = SongObject(prefab)
-                except Exception as e:
-                    self[val] = None
-                    logging.warning(e)
-                    return None
-            else:
-                return None
-        return self[val]
+        with self.lock:
+            if val in self:
+                # Mark as most recently used
+                song = self[val] = self.pop(val)
+                return song
+        logging.debug("Loading %s into MusicDict", val)
+        prefab = RESOURCES.music.get(val)
+        if not prefab:
+            return None
+        try:
+            song = SongObject(prefab)
+        except Exception as e:
+            song = None
+            logging.warning(e)
+        with self.lock:
+            if val in self:  # Someone else finished loading it first
+                return self[val]
+            self[val] = song
+            if song:
+                self.total_size += song.size
+                self._evict(val)
+        return song
+
+    def _evict(self, song_to_keep: NID):
+        for nid in list(self.keys()):
+            if self.total_size <= MUSIC_CACHE_LIMIT:
+                return
+            song = self[nid]
+            if nid == song_to_keep or (song and song.channel):
+                continue
+            logging.debug("Unloading %s from MusicDict", nid)
+            del self[nid]
+            if song:
+                self.total_size -= song.size
 
     def clear(self, song_to_keep: NID = None):
-        if not song_to_keep:
-            super().clear()
-        else:
-            our_keys = list(self.keys())
-            for key in our_keys:
-                if key != song_to_keep:
-                    del self[key]
+        with self.lock:
+            if not song_to_keep:
+                super().clear()
+                self.total_size = 0
+            else:
+                our_keys = list(self.keys())
+                for key in our_keys:
+                    if key != song_to_keep:
+                        song = self.pop(key)
+                        if song:
+                            self.total_size -= song.size
 
 class SoundDict(dict):
     def get(self, val):
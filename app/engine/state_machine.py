@@ -7,6 +7,8 @@ if TYPE_CHECKING:
 
 import logging
 
+from app.engine import frame_profiler
+
 
 class SimpleStateMachine():
     def __init__(self, starting_state):
@@ -261,7 +263,8 @@ class StateMachine():
                 repeat_flag = True
         # Update
         if not repeat_flag:
-            update_output = state.update()
+            with frame_profiler.scope('state_update'):
+                update_output = state.update()
             if update_output == 'repeat':
                 repeat_flag = True
         # Draw
@@ -273,9 +276,10 @@ class StateMachine():
                     idx -= 1
                 else:
                     break
-            while idx <= -1:
-                surf = self.state[idx].draw(surf)
-                idx += 1
+            with frame_profiler.scope('state_draw'):
+                while idx <= -1:
+                    surf = self.state[idx].draw(surf)
+                    idx += 1
         # End
         if self.temp_state and state.processed:
             state.processed = False
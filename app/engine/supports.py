@@ -114,6 +114,41 @@ class SupportController():
     def __init__(self):
         self.support_pairs: Dict[NID, SupportPair] = {}
 
+        # Index over the support pairs in the database, built on first use
+        self._index_source = None
+        self._index_size: int = 0
+        self._unit_prefabs: Dict[NID, List[SupportPrefab]] = {}
+        self._pair_order: Dict[NID, int] = {}
+
+    def _build_index(self):
+        """
+        Rebuilds the per unit index of the support pair graph if the
+        support pairs in the database have changed since it was last built
+        """
+        if self._index_source is DB.support_pairs and self._index_size == len(DB.support_pairs):
+            return
+        self._index_source = DB.support_pairs
+        self._index_size = len(DB.support_pairs)
+        self._unit_prefabs.clear()
+        self._pair_order.clear()
+        for idx, prefab in enumerate(DB.support_pairs):
+            self._pair_order[prefab.nid] = idx
+            self._unit_prefabs.setdefault(prefab.unit1, []).append(prefab)
+            if prefab.unit2 != prefab.unit1:
+                self._unit_prefabs.setdefault(prefab.unit2, []).append(prefab)
+
+    def get_prefabs(self, unit_nid: NID) -> List[SupportPrefab]:
+        """
+        Returns every support pair prefab the unit is a part of, in database order
+        """
+        self._build_index()
+        return self._unit_prefabs.get(unit_nid, [])
+
+    def get_prefabs_between(self, unit1_nid: NID, unit2_nid: NID) -> List[SupportPrefab]:
+        return [prefab for prefab in self.get_prefabs(unit1_nid)
+                if (prefab.unit1 == unit1_nid and prefab.unit2 == unit2_nid) or
+                (prefab.unit1 == unit2_nid and prefab.unit2 == unit1_nid)]
+
     def get(self, unit1_nid: str, unit2_nid: str) -> SupportPair:
         nid = "%s | %s" % (unit1_nid, unit2_nid)
         if nid in self.support_pairs:
@@ -146,13 +181,34 @@ class SupportController():
 
     def get_pairs(self, unit_nid: str) -> list:
         pairs = []
-        for prefab in DB.support_pairs:
-            if prefab.unit1 == unit_nid or prefab.unit2 == unit_nid:
-                if prefab.nid not in self.support_pairs:
-                    self.create_pair(prefab.nid)
-                pairs.append(self.support_pairs[prefab.nid])
+        for prefab in self.get_prefabs(unit_nid):
+            if prefab.nid not in self.support_pairs:
+                self.create_pair(prefab.nid)
+            pairs.append(self.support_pairs[prefab.nid])
         return pairs
 
+    def get_growth_pairs(self, units) -> List[NID]:
+        """
+        Returns the nids of the support pairs between any of the units
+        and a partner on the same team within growth range, in database order.
+        Partners must be on the map and not generic
+        """
+        dist = DB.support_constants.value('growth_range')
+        nids = set()
+        for unit in units:
+            if not unit.position:
+                continue
+            for prefab in self.get_prefabs(unit.nid):
+                if prefab.nid in nids:
+                    continue
+                other_nid = prefab.unit2 if prefab.unit1 == unit.nid else prefab.unit1
+                other = game.get_unit(other_nid)
+                if not other or other is unit or not other.position or other.generic or other.team != unit.team:
+                    continue
+                if dist == 99 or utils.calculate_distance(unit.position, other.position) <= dist:
+                    nids.add(prefab.nid)
+        return sorted(nids, key=self._pair_order.get)
+
     def get_bonus_pairs(self, unit_nid: str) -> list:
         """
         Only gets the pairs that could conceivably give out a support bonus
@@ -236,11 +292,10 @@ class SupportController():
             return dist <= r
 
     def get_specific_bonus(self, unit1, unit2, highest_rank):
-        for pair in DB.support_pairs:
-            if (pair.unit1 == unit1.nid and pair.unit2 == unit2.nid) or (pair.unit1 == unit2.nid and pair.unit2 == unit1.nid):
-                for support_rank_req in pair.requirements:
-                    if support_rank_req.support_rank == highest_rank:
-                        return support_rank_req
+        for pair in self.get_prefabs_between(unit1.nid, unit2.nid):
+            for support_rank_req in pair.requirements:
+                if support_rank_req.support_rank == highest_rank:
+                    return support_rank_req
         return None
 
     def get_bonus(self, unit1, unit2, highest_rank) -> SupportEffect:
@@ -330,31 +385,19 @@ def increment_unit_end_turn_supports(unit):
         return
     inc = DB.support_constants.value('end_turn_points')
     if inc:
-        dist = DB.support_constants.value('growth_range')
-        units = [u for u in game.units if u.position and not u.generic and u.team == unit.team and u is not unit]
-        unit_nids = {unit.nid for unit in units}
-        for support_prefab in DB.support_pairs:
-            if (support_prefab.unit1 in unit_nids and support_prefab.unit2 == unit.nid) or \
-               (support_prefab.unit2 in unit_nids and support_prefab.unit1 == unit.nid):
-                unit1 = game.get_unit(support_prefab.unit1)
-                unit2 = game.get_unit(support_prefab.unit2)
-                if dist == 99 or utils.calculate_distance(unit1.position, unit2.position) <= dist:
-                    action.do(action.IncrementSupportPoints(support_prefab.nid, inc))
+        nids = game.supports.get_growth_pairs([unit])
+        if nids:
+            action.do(action.IncrementMultipleSupportPoints(nids, inc))
 
 def increment_team_end_turn_supports(team='player'):
     if not game.game_vars.get('_supports'):
         return
     inc = DB.support_constants.value('end_turn_points')
     if inc:
-        dist = DB.support_constants.value('growth_range')
         units = [unit for unit in game.units if unit.position and not unit.generic and unit.team == team]
-        unit_nids = {unit.nid for unit in units}
-        for support_prefab in DB.support_pairs:
-            if support_prefab.unit1 in unit_nids and support_prefab.unit2 in unit_nids:
-                unit1 = game.get_unit(support_prefab.unit1)
-                unit2 = game.get_unit(support_prefab.unit2)
-                if dist == 99 or utils.calculate_distance(unit1.position, unit2.position) <= dist:
-                    action.do(action.IncrementSupportPoints(support_prefab.nid, inc))
+        nids = game.supports.get_growth_pairs(units)
+        if nids:
+            action.do(action.IncrementMultipleSupportPoints(nids, inc))
 
 def increment_end_combat_supports(combatant, target=None) -> list:
     """
@@ -368,15 +411,11 @@ def increment_end_combat_supports(combatant, target=None) -> list:
     pairs = []
     if inc:
         dist = DB.support_constants.value('growth_range')
-        units = [unit for unit in game.units if unit.position and not unit.generic and unit.team == combatant.team and unit is not combatant]
-        unit_nids = {unit.nid for unit in units}
-        for support_prefab in DB.support_pairs:
-            other_unit = None
-            if support_prefab.unit1 == combatant.nid and support_prefab.unit2 in unit_nids:
-                other_unit = game.get_unit(support_prefab.unit2)
-            elif support_prefab.unit2 == combatant.nid and support_prefab.unit1 in unit_nids:
-                other_unit = game.get_unit(support_prefab.unit1)
-            if not other_unit:
+        for support_prefab in game.supports.get_prefabs(combatant.nid):
+            other_nid = support_prefab.unit2 if support_prefab.unit1 == combatant.nid else support_prefab.unit1
+            other_unit = game.get_unit(other_nid)
+            if not other_unit or other_unit is combatant or not other_unit.position or \
+                    other_unit.generic or other_unit.team != combatant.team:
                 continue
             assert other_unit.position is not None
             if dist == 0 and target:
@@ -397,11 +436,9 @@ def increment_supports(combatant, partner, constant: str) -> bool:
     inc = DB.support_constants.value(constant)
     success: bool = False
     if inc:
-        for support_prefab in DB.support_pairs:
-            if (support_prefab.unit1 == combatant.nid and support_prefab.unit2 == partner.nid) or \
-                    (support_prefab.unit2 == combatant.nid and support_prefab.unit1 == partner.nid):
-                action.do(action.IncrementSupportPoints(support_prefab.nid, inc))
-                success = True
+        for support_prefab in game.supports.get_prefabs_between(combatant.nid, partner.nid):
+            action.do(action.IncrementSupportPoints(support_prefab.nid, inc))
+            success = True
     return success
 
 def increment_interact_supports(combatant, target) -> bool:
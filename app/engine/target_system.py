@@ -8,6 +8,7 @@ from app.engine import (combat_calcs, item_funcs, item_system,
 from app.engine.movement import movement_funcs
 from app.engine.game_state import GameState
 from app.utilities import utils
+from app.utilities.grid_bitmap import GridBitmap
 from app.utilities.typing import Pos
 from app.engine.combat.utils import resolve_weapon
 
@@ -16,6 +17,9 @@ if TYPE_CHECKING:
     from app.engine.objects.unit import UnitObject
     from app.engine.objects.item import ItemObject
 
+# Below this many positions, building the shell from sets is faster than using a bitmap
+BITMAP_SHELL_THRESHOLD = 8
+
 class TargetSystem():
     def __init__(self, game: GameState = None):
         if game:
@@ -24,7 +28,6 @@ class TargetSystem():
             from app.engine.game_state import game
             self.game = game
 
-    # Consider making these sections faster
     def get_shell(self, valid_moves: Set[Pos], potential_range: Set[int],
                   bounds: Tuple[int, int, int, int], manhattan_restriction: Optional[Set[Pos]] = None) -> Set[Pos]:
         """Finds positions in a shell of radius {potential_range} from each of the positions in {valid_moves}.
@@ -38,6 +41,29 @@ class TargetSystem():
         Returns:
             The set of positions in the shell within {bounds} and that fall within the {manhattan_restriction}
         """
+        if len(valid_moves) < BITMAP_SHELL_THRESHOLD or not potential_range:
+            return self._get_shell_from_sets(valid_moves, potential_range, bounds, manhattan_restriction)
+        return self.get_shell_bitmap(valid_moves, potential_range, bounds, manhattan_restriction).to_positions()
+
+    def get_shell_bitmap(self, valid_moves: Set[Pos], potential_range: Set[int],
+                         bounds: Tuple[int, int, int, int], manhattan_restriction: Optional[Set[Pos]] = None) -> GridBitmap:
+        """As get_shell, but returns a GridBitmap, built by dilating the valid moves by the range diamond.
+        """
+        offsets = self._cached_base_manhattan_spheres(frozenset(potential_range))
+        if manhattan_restriction:
+            offsets = [offset for offset in offsets if offset in manhattan_restriction]
+        pad = max(potential_range, default=0)
+        shell = GridBitmap.from_positions(valid_moves, bounds, pad).dilate(offsets)
+        # Moves off the board can still reach onto it
+        left, top, right, bottom = bounds
+        outside_moves = {move for move in valid_moves if not (left <= move[0] <= right and top <= move[1] <= bottom)}
+        if outside_moves:
+            extra = self._get_shell_from_sets(outside_moves, potential_range, bounds, manhattan_restriction)
+            shell.bits |= GridBitmap.from_positions(extra, bounds, pad).bits
+        return shell
+
+    def _get_shell_from_sets(self, valid_moves: Set[Pos], potential_range: Set[int],
+                             bounds: Tuple[int, int, int, int], manhattan_restriction: Optional[Set[Pos]] = None) -> Set[Pos]:
         valid_attacks = set()
         if manhattan_restriction:
             for valid_move in valid_moves:
@@ -327,11 +353,15 @@ class TargetSystem():
         item_range = item_funcs.get_range(unit, item)
         restriction = item_system.range_restrict(unit, item)
         valid_moves: Set[Pos] = set()
-        for move in moves:
-            possible_strike_locations = \
-                self.get_shell({move}, item_range, self.game.board.bounds, restriction)
-            if target in possible_strike_locations:
-                valid_moves.add(move)
+        left, top, right, bottom = self.game.board.bounds
+        tx, ty = target
+        if left <= tx <= right and top <= ty <= bottom:
+            # Just check the distance from each move, rather than building each move's shell
+            for move in moves:
+                dx, dy = tx - move[0], ty - move[1]
+                if abs(dx) + abs(dy) in item_range and \
+                        (not restriction or (dx, dy) in restriction):
+                    valid_moves.add(move)
 
         # Filter away possible attacks that aren't in line of sight
         if DB.constants.value('line_of_sight') and not item_system.ignore_line_of_sight(unit, item):
@@ -1,15 +1,17 @@
 from __future__ import annotations
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+import bisect
 import math
 import logging
+import pickle
 from dataclasses import dataclass
 
 from app.data.resources.resources import RESOURCES
 
 import app.engine.action as Action
 from app.constants import WINHEIGHT, WINWIDTH
-from app.engine import base_surf, engine, gui, image_mods
+from app.engine import action_log_codec, base_surf, engine, gui, image_mods
 from app.engine.background import SpriteBackground
 from app.engine.battle_animation import BattleAnimation
 from app.engine.fonts import FONT
@@ -50,15 +52,51 @@ class ActionLog():
         self.current_move_index = 0
         self.action_groups = []
 
+        # Incrementally maintained action group index
+        # and keyframes (indices of LockTurnwheel and MarkPhase actions)
+        self._group_index = ActionGroupIndex(self._first_free_action)
+        self._lock_indices: List[int] = []
+        self._phase_indices: List[int] = []
+        # Indices into self.action_groups of each Phase group
+        self._phase_groups: List[int] = []
+
+    def _index_action(self, action_index: int, action):
+        if isinstance(action, Action.LockTurnwheel):
+            self._lock_indices.append(action_index)
+        elif isinstance(action, Action.MarkPhase):
+            self._phase_indices.append(action_index)
+
+    def _truncate_indices(self, length: int):
+        """
+        Throws away any indexing information about actions
+        at or after `length`
+        """
+        del self._lock_indices[bisect.bisect_left(self._lock_indices, length):]
+        del self._phase_indices[bisect.bisect_left(self._phase_indices, length):]
+        self._group_index.truncate(length)
+
+    def _rebuild_indices(self):
+        self._lock_indices.clear()
+        self._phase_indices.clear()
+        self._group_index = ActionGroupIndex(self._first_free_action)
+        for action_index, action in enumerate(self.actions):
+            self._index_action(action_index, action)
+
     def append(self, action):
         logging.debug("Add Action %d: %s", self.action_index + 1, action)
         self.actions.append(action)
         self.action_index += 1
+        self._index_action(len(self.actions) - 1, action)
 
     def remove(self, action):
         logging.debug("Remove Action %d: %s", self.action_index, action)
-        self.actions.remove(action)
+        idx = self.actions.index(action)
+        self.actions.pop(idx)
         self.action_index -= 1
+        if idx == len(self.actions):
+            self._truncate_indices(idx)
+        else:  # Removed from the middle, so everything after it has shifted
+            self._rebuild_indices()
 
     def hard_remove(self, action):
         """
@@ -67,13 +105,21 @@ class ActionLog():
         """
         logging.debug("Hard Remove Action %d: %s", self.action_index, action)
         idx = self.actions.index(action)
+        kept = []
         for act in reversed(self.actions[idx:]):
             if act.persist_through_menu_cancel:
                 logging.debug("Not going to reverse or remove the " + act.__class__.__name__ + " action")
+                kept.append(act)
             else:
                 act.reverse()
-                self.actions.remove(act)
                 self.action_index -= 1
+        # Persistent actions keep their order, but move down
+        # to fill the space left by the removed actions
+        del self.actions[idx:]
+        self._truncate_indices(idx)
+        for act in reversed(kept):
+            self.actions.append(act)
+            self._index_action(len(self.actions) - 1, act)
         logging.debug("New Action Index: %d", self.action_index)
 
     def reverse_move_to_action_group_start(self, action: Action.Move):
@@ -83,8 +129,9 @@ class ActionLog():
         top_action = self.actions[-1]
         if isinstance(top_action, Action.MarkActionGroupStart):
             top_action.reverse()
-            self.actions.remove(top_action)
+            self.actions.pop()
             self.action_index -= 1
+            self._truncate_indices(len(self.actions))
             logging.debug("New Action Index: %d after removing the action group start marker", self.action_index)
 
     def run_action_backward(self):
@@ -145,62 +192,14 @@ class ActionLog():
         2. Phase: Tells the turnwheel as it's iterating through that we are in a new phase now. 
         3. Extra: Handles any hanging actions that are not part of an action group (Equips, etc.)
         """
-        action_groups: List[ActionLog.ActionGroup] = []
-
-        def finalize(move: [ActionLog.ActionGroup]):
-            if isinstance(move, ActionLog.Move) and move.end is None:
-                move.end = move.begin
-            action_groups.append(move)
-
-        # Pay attention to which actions the turnwheel actually has to know about
-        current_move: ActionLog.Move = None
-
-        for action_index in range(max(0, first_free_action), len(actions)):
-            action = actions[action_index]
-            # Only regular moves, not CantoMove or other nonsense gets counted
-            # Event moves aren't considered a real move
-            if isinstance(action, Action.MarkActionGroupStart):
-                if current_move:
-                    finalize(current_move)
-                current_move = ActionLog.Move(action.unit, action_index)
-            elif isinstance(action, Action.MarkActionGroupEnd):
-                if current_move:
-                    current_move.end = action_index
-                    finalize(current_move)
-                    current_move = None
-            elif isinstance(action, Action.MarkPhase):
-                if current_move:
-                    finalize(current_move)
-                    current_move = None
-                action_groups.append(ActionLog.Phase(action.phase_name, action_index))
-
-        # Finalize an existing move if it was never ended by any other special
-        # action (usually would be ended by a Wait or death of the unit)
-        # But sometimes is not
-        if current_move:
-            finalize(current_move)
-            current_move = None
-
-        # Handles having extra actions off the right of the action log
-        # Imagine you finish up a unit A's move, they wait. Then you 
-        # fiddle with the equipped item of unit B. When you turnwheel
-        # back from that point, the Equipped item of unit B better 
-        # be back to the previous point it was during Unit A's move, otherwise
-        # you have screwed up the timeline. This handles those extra
-        # actions at the end of the timeline not associated with a move
-        if action_groups:
-            last_move = action_groups[-1]
-            last_action_index = len(actions) - 1
-            if isinstance(last_move, ActionLog.Move):
-                if last_move.end < last_action_index:
-                    action_groups.append(ActionLog.Extra(last_move.end + 1, last_action_index))
-            elif last_move.action_index < last_action_index:
-                action_groups.append(ActionLog.Extra(last_move.action_index + 1, last_action_index))
-
-        return action_groups
+        group_index = ActionGroupIndex(first_free_action)
+        group_index.update(actions)
+        return group_index.get_action_groups(len(actions))
 
     def set_up(self):
-        self.action_groups: List[self.ActionGroup] = ActionLog.get_action_groups(self.actions, self._first_free_action)
+        self._group_index.update(self.actions)
+        self.action_groups: List[self.ActionGroup] = self._group_index.get_action_groups(len(self.actions))
+        self._phase_groups = [idx for idx, group in enumerate(self.action_groups) if isinstance(group, self.Phase)]
 
         logging.debug("*** Turnwheel Begin ***")
         # logging.debug(self.actions)
@@ -333,6 +332,37 @@ class ActionLog():
                 action = self.run_action_forward()
             return []
 
+    def jump_backward(self):
+        """
+        Jumps straight back to the start of the previous phase keyframe,
+        rather than stepping back one action group at a time
+        """
+        # Find the last phase that starts strictly before where we are now
+        idx = bisect.bisect_left(self._phase_groups, self.current_move_index) - 1
+        while idx >= 0 and self.action_groups[self._phase_groups[idx]].action_index >= self.action_index:
+            idx -= 1
+        if idx < 0:
+            return None
+        group_index = self._phase_groups[idx]
+        self.current_unit = None
+        self.current_move_index = group_index + 1
+        return self.backward()
+
+    def jump_forward(self):
+        """
+        Jumps straight forward to the start of the next phase keyframe,
+        rather than stepping forward one action group at a time
+        """
+        idx = bisect.bisect_left(self._phase_groups, self.current_move_index)
+        while idx < len(self._phase_groups) and self.action_groups[self._phase_groups[idx]].action_index <= self.action_index:
+            idx += 1
+        if idx >= len(self._phase_groups):
+            return None
+        group_index = self._phase_groups[idx]
+        self.current_unit = None
+        self.current_move_index = group_index
+        return self.forward()
+
     def finalize(self):
         """
         Removes all actions after the one we turned back to
@@ -340,7 +370,8 @@ class ActionLog():
         self.current_unit = None
         if self.hovered_unit:
             self.hover_off()
-        self.actions = self.actions[:self.action_index + 1]
+        del self.actions[self.action_index + 1:]
+        self._truncate_indices(len(self.actions))
 
     def reset(self):
         """
@@ -353,21 +384,17 @@ class ActionLog():
             self.run_action_forward()
 
     def get_last_lock(self) -> bool:
-        cur_index = self.action_index
-        while cur_index > 0:
-            cur_index -= 1
-            cur_action = self.actions[cur_index]
-            if isinstance(cur_action, Action.LockTurnwheel):
-                return cur_action.lock
+        # Last LockTurnwheel strictly before the current action
+        idx = bisect.bisect_left(self._lock_indices, self.action_index) - 1
+        if idx >= 0:
+            return self.actions[self._lock_indices[idx]].lock
         return False  # Assume not locked
 
     def get_current_phase(self):
-        cur_index = self.action_index
-        while cur_index > 0:
-            cur_index -= 1
-            cur_action = self.actions[cur_index]
-            if isinstance(cur_action, Action.MarkPhase):
-                return cur_action.phase_name
+        # Last MarkPhase strictly before the current action
+        idx = bisect.bisect_left(self._phase_indices, self.action_index) - 1
+        if idx >= 0:
+            return self.actions[self._phase_indices[idx]].phase_name
         return 'player'
 
     def is_turned_back(self):
@@ -397,6 +424,7 @@ class ActionLog():
     def set_first_free_action(self):
         logging.debug("*** First Free Action ***")
         self._first_free_action = self.action_index
+        self._group_index = ActionGroupIndex(self._first_free_action)
 
     def hover_on(self, unit):
         game.cursor.set_turnwheel_sprite()
@@ -415,13 +443,46 @@ class ActionLog():
     def start_recording(self) -> None:
         self.record -= 1
 
-    def save(self):
-        return ([action.save() for action in self.actions], self._first_free_action, self.record)
+    def get_compacted_actions(self) -> Tuple[List[Action.Action], int]:
+        """
+        Returns the actions the turnwheel can still reach, along with the new first free action.
+        Actions before the first free action can never be turned back to, so they are dropped,
+        except for the last LockTurnwheel and MarkPhase among them, since the turnwheel
+        still needs to know whether it starts out locked and what phase it starts out in.
+        """
+        if self._first_free_action <= 0:
+            return self.actions, self._first_free_action
+        kept = []
+        lock_idx = bisect.bisect_left(self._lock_indices, self._first_free_action) - 1
+        if lock_idx >= 0:
+            kept.append(self._lock_indices[lock_idx])
+        phase_idx = bisect.bisect_left(self._phase_indices, self._first_free_action) - 1
+        if phase_idx >= 0:
+            kept.append(self._phase_indices[phase_idx])
+        kept.sort()
+        actions = [self.actions[idx] for idx in kept] + self.actions[self._first_free_action:]
+        return actions, len(kept)
+
+    def save(self, compact: bool = False):
+        if compact:
+            actions, first_free_action = self.get_compacted_actions()
+        else:
+            actions, first_free_action = self.actions, self._first_free_action
+        serialized_actions = [action.save() for action in actions]
+        encoded = action_log_codec.encode_actions(serialized_actions)
+        logging.debug("Action log save: %d actions -> %d actions", len(self.actions), len(actions))
+        return {'actions': encoded,
+                'first_free_action': first_free_action,
+                'record': self.record}
 
     @classmethod
     def restore(cls, serial):
         self = cls()
-        if len(serial) == 2:  # deprecated
+        if isinstance(serial, dict):
+            actions = action_log_codec.decode_actions(serial['actions'])
+            first_free_action = serial['first_free_action']
+            record = serial['record']
+        elif len(serial) == 2:  # deprecated
             actions, first_free_action = serial
             record = 0
         else:
@@ -429,9 +490,102 @@ class ActionLog():
         for name, action in actions:
             self.append(getattr(Action, name).restore(action))
         self._first_free_action = first_free_action
+        self._group_index = ActionGroupIndex(self._first_free_action)
         self.record = record
         return self
 
+class ActionGroupIndex():
+    """
+    Incrementally maintained list of action groups for the action log.
+    New actions are processed as they are appended, so that the turnwheel
+    does not need to rebuild the whole list from scratch each time it is opened.
+    """
+    def __init__(self, first_free_action: int):
+        self.first_free_action = first_free_action
+        # Closed action groups, along with the index of the action that closed each one
+        self.groups: List[ActionLog.ActionGroup] = []
+        self.closed_at: List[int] = []
+        self.current_move: Optional[ActionLog.Move] = None
+        # Index of the next action to process
+        self.num_processed: int = max(0, first_free_action)
+
+    def _close(self, group: ActionLog.ActionGroup, action_index: int):
+        self.groups.append(group)
+        self.closed_at.append(action_index)
+
+    def update(self, actions: List[Action]):
+        # Pay attention to which actions the turnwheel actually has to know about
+        for action_index in range(self.num_processed, len(actions)):
+            action = actions[action_index]
+            # Only regular moves, not CantoMove or other nonsense gets counted
+            # Event moves aren't considered a real move
+            if isinstance(action, Action.MarkActionGroupStart):
+                if self.current_move:
+                    self._close(self.current_move, action_index)
+                self.current_move = ActionLog.Move(action.unit, action_index)
+            elif isinstance(action, Action.MarkActionGroupEnd):
+                if self.current_move:
+                    self.current_move.end = action_index
+                    self._close(self.current_move, action_index)
+                    self.current_move = None
+            elif isinstance(action, Action.MarkPhase):
+                if self.current_move:
+                    self._close(self.current_move, action_index)
+                    self.current_move = None
+                self._close(ActionLog.Phase(action.phase_name, action_index), action_index)
+        self.num_processed = max(self.num_processed, len(actions))
+
+    def truncate(self, length: int):
+        """
+        Forgets about every action at or after `length`,
+        reopening any move that was closed by one of those actions
+        """
+        if length >= self.num_processed:
+            return
+        reopened = None
+        while self.closed_at and self.closed_at[-1] >= length:
+            self.closed_at.pop()
+            reopened = self.groups.pop()
+        if self.current_move and self.current_move.begin >= length:
+            self.current_move = None
+        if isinstance(reopened, ActionLog.Move) and reopened.begin < length:
+            reopened.end = None
+            self.current_move = reopened
+        self.num_processed = max(length, max(0, self.first_free_action))
+
+    def get_action_groups(self, num_actions: int) -> List[ActionLog.ActionGroup]:
+        def finalize(move: ActionLog.Move) -> ActionLog.Move:
+            if move.end is None:
+                return ActionLog.Move(move.unit, move.begin, move.begin)
+            return move
+
+        action_groups: List[ActionLog.ActionGroup] = [
+            finalize(group) if isinstance(group, ActionLog.Move) else group for group in self.groups]
+
+        # Finalize an existing move if it was never ended by any other special
+        # action (usually would be ended by a Wait or death of the unit)
+        # But sometimes is not
+        if self.current_move:
+            action_groups.append(finalize(self.current_move))
+
+        # Handles having extra actions off the right of the action log
+        # Imagine you finish up a unit A's move, they wait. Then you 
+        # fiddle with the equipped item of unit B. When you turnwheel
+        # back from that point, the Equipped item of unit B better 
+        # be back to the previous point it was during Unit A's move, otherwise
+        # you have screwed up the timeline. This handles those extra
+        # actions at the end of the timeline not associated with a move
+        if action_groups:
+            last_move = action_groups[-1]
+            last_action_index = num_actions - 1
+            if isinstance(last_move, ActionLog.Move):
+                if last_move.end < last_action_index:
+                    action_groups.append(ActionLog.Extra(last_move.end + 1, last_action_index))
+            elif last_move.action_index < last_action_index:
+                action_groups.append(ActionLog.Extra(last_move.action_index + 1, last_action_index))
+
+        return action_groups
+
 class TurnwheelDisplay():
     locked_sprite = SPRITES.get('focus_fade_red')
     unlocked_sprite = SPRITES.get('focus_fade_green')
@@ -566,6 +720,24 @@ class TurnwheelState(MapState):
             self.display.change_text(new_message, game.turncount)
         self.last_direction = 'BACKWARD'
 
+    def jump_forward(self):
+        new_message = game.action_log.jump_forward()
+        if new_message is None:
+            get_sound_thread().play_sfx('Error')
+            return
+        get_sound_thread().play_sfx('Select 1')
+        self.display.change_text(new_message, game.turncount)
+        self.last_direction = 'FORWARD'
+
+    def jump_back(self):
+        new_message = game.action_log.jump_backward()
+        if new_message is None:
+            get_sound_thread().play_sfx('Error')
+            return
+        get_sound_thread().play_sfx('Select 2')
+        self.display.change_text(new_message, game.turncount)
+        self.last_direction = 'BACKWARD'
+
     def take_input(self, event):
         first_push = self.fluid.update()
         directions = self.fluid.get_directions()
@@ -578,6 +750,12 @@ class TurnwheelState(MapState):
         elif 'UP' in directions or 'LEFT' in directions:
             self.move_back()
 
+        # Skip a whole phase at a time
+        if event == 'INFO':
+            self.jump_forward()
+        elif event == 'AUX':
+            self.jump_back()
+
         if event == 'SELECT':
             if self.check_mouse_position():
                 pass
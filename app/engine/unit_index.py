@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, Tuple
+
+if TYPE_CHECKING:
+    from app.engine.objects.unit import UnitObject
+    from app.utilities.typing import NID
+
+class UnitIndex():
+    """
+    The registered units grouped the ways the engine most often looks them up.
+    Built in one pass over the unit registry, and every group keeps the registry's order.
+
+    GameState throws this away whenever units are registered or unregistered,
+    arrive on or leave the map, or an action alters the game state,
+    and builds a new one the next time it is asked for.
+    """
+    __slots__ = ['on_map', 'on_field', 'by_team', 'on_field_by_team', 'on_field_by_ai_group']
+
+    def __init__(self, units: Iterable[UnitObject]):
+        on_map = []
+        on_field = []
+        by_team: Dict[NID, list] = {}
+        on_field_by_team: Dict[NID, list] = {}
+        on_field_by_ai_group: Dict[NID, list] = {}
+        for unit in units:
+            by_team.setdefault(unit.team, []).append(unit)
+            if not unit.position:
+                continue
+            on_map.append(unit)
+            if not unit.dead and not unit.is_dying and 'Tile' not in unit.tags:
+                on_field.append(unit)
+                on_field_by_team.setdefault(unit.team, []).append(unit)
+                on_field_by_ai_group.setdefault(unit.ai_group, []).append(unit)
+
+        # Units that have a position
+        self.on_map: Tuple[UnitObject, ...] = tuple(on_map)
+        # Units that have a position and are not dead, dying or tiles
+        self.on_field: Tuple[UnitObject, ...] = tuple(on_field)
+        self.by_team: Dict[NID, Tuple[UnitObject, ...]] = {k: tuple(v) for k, v in by_team.items()}
+        self.on_field_by_team: Dict[NID, Tuple[UnitObject, ...]] = {k: tuple(v) for k, v in on_field_by_team.items()}
+        self.on_field_by_ai_group: Dict[NID, Tuple[UnitObject, ...]] = {k: tuple(v) for k, v in on_field_by_ai_group.items()}
@@ -15,7 +15,7 @@ import app.engine.graphics.ui_framework as uif
 from app.constants import WINHEIGHT, WINWIDTH
 from app.data.database.database import DB
 from app.engine import (action, background, dialog, engine, evaluate,
-                        image_mods, item_funcs)
+                        frame_profiler, image_mods, item_funcs)
 from app.engine.game_state import GameState
 from app.engine.movement import movement_funcs
 from app.engine.objects.overworld import OverworldNodeObject
@@ -164,6 +164,7 @@ class Event():
     def finished(self):
         return self.processor.finished() and not self.command_queue
 
+    @frame_profiler.timed('events')
     def update(self):
         # update all internal updates, remove the ones that are finished
         self.should_update = {name: to_update for name, to_update in self.should_update.items() if not to_update(self.do_skip)}
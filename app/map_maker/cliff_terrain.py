@@ -3,7 +3,7 @@ import math
 from PyQt5.QtGui import QPixmap, QPainter, qRgb
 
 from app.constants import TILEWIDTH, TILEHEIGHT
-from app.map_maker.utilities import random_choice, edge_random, flood_fill
+from app.map_maker.utilities import random_choice, edge_random
 from app.utilities import utils
 from app.map_maker.wang_terrain import WangCorner2Terrain
 
@@ -113,7 +113,7 @@ class CliffTerrain(WangCorner2Terrain):
         counter: int = 0
         while positions and counter < 99999:
             pos = positions.pop()
-            near_positions: set = flood_fill(tilemap, pos, diagonal=True)
+            near_positions: set = set(tilemap.get_blob(pos, diagonal=True))
             groupings.append(near_positions)
             positions -= near_positions
             counter += 1
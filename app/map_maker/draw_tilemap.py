@@ -1,3 +1,5 @@
+from typing import Dict, List, Optional, Tuple
+
 from PyQt5.QtCore import QDateTime
 from PyQt5.QtGui import QImage, QPainter, QPixmap, QColor
 
@@ -5,22 +7,105 @@ from app.constants import TILEWIDTH, TILEHEIGHT, AUTOTILE_FRAMES
 
 from app.map_maker.map_prefab import MapPrefab
 from app.map_maker.terrain_database import DB_terrain
+from app.map_maker.utilities import diff_drawn_tiles
 
 def get_tilemap_pixmap(tilemap) -> QPixmap:
     return QPixmap.fromImage(draw_tilemap(tilemap))
 
-last_autotile_num = 0
+def _new_image(width: int, height: int) -> QImage:
+    image = QImage(width * TILEWIDTH,
+                   height * TILEHEIGHT,
+                   QImage.Format_ARGB32)
+    image.fill(QColor(0, 0, 0, 0))
+    return image
+
+class TilemapDrawCache():
+    """
+    Keeps what draw_tilemap has already painted for a tilemap, so each draw
+    only repaints the tiles whose pixmap in the tile grid has changed.
+
+    Tiles without autotiles are painted onto the base image. Tiles with autotiles
+    are painted onto a separate layer for each autotile frame, which are filled
+    in as each frame is first shown, so afterwards animating is just drawing
+    a different layer on top of the base. Maps without autotiles have no layers.
+    """
+    def __init__(self, width: int, height: int):
+        self.width, self.height = width, height
+        self.base: QImage = _new_image(width, height)
+        # Key: Position, Value: The pixmap painted there
+        self.base_drawn: Dict[Tuple[int, int], QPixmap] = {}
+        self.layers: List[Optional[QImage]] = [None] * AUTOTILE_FRAMES
+        # Key: Position, Value: The pixmap painted there, or None if
+        # it is out of date and will need to be determined again
+        self.layer_drawn: List[Dict[Tuple[int, int], Optional[QPixmap]]] = \
+            [{} for _ in range(AUTOTILE_FRAMES)]
+        self.autotile_num: int = 0
+
+    def invalidate(self, pos: Tuple[int, int]):
+        for drawn in self.layer_drawn:
+            if pos in drawn:
+                drawn[pos] = None
+
+    def get_autotile_sprite(self, pos: Tuple[int, int], autotile_num: int) -> Optional[QPixmap]:
+        return self.layer_drawn[autotile_num].get(pos)
+
+    def _paint(self, image: QImage, tiles: List[Tuple[Tuple[int, int], Optional[QPixmap]]]):
+        if not tiles:
+            return
+        painter = QPainter()
+        painter.begin(image)
+        # Replace what was there before, rather than blending on top of it
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        for pos, pix in tiles:
+            if pix is not None:
+                assert pix.width() == TILEWIDTH, pix.width()
+                assert pix.height() == TILEHEIGHT, pix.height()
+                painter.drawPixmap(pos[0] * TILEWIDTH, pos[1] * TILEHEIGHT, pix)
+            else:
+                painter.fillRect(pos[0] * TILEWIDTH, pos[1] * TILEHEIGHT,
+                                 TILEWIDTH, TILEHEIGHT, QColor(0, 0, 0, 0))
+        painter.end()
+
+    def update(self, tilemap: MapPrefab, autotile_num: int):
+        """
+        Brings the base image and the current autotile frame's layer
+        in line with the tilemap's tile grid
+        """
+        base_tiles = diff_drawn_tiles(self.base_drawn, tilemap.tile_grid, tilemap.autotile_set, False)
+        self._paint(self.base, base_tiles)
+
+        layer_drawn = self.layer_drawn[autotile_num]
+        layer_tiles = diff_drawn_tiles(layer_drawn, tilemap.tile_grid, tilemap.autotile_set, True)
+        if not layer_drawn:
+            # Nothing left on this layer, so don't keep a whole transparent map around
+            self.layers[autotile_num] = None
+            return
+        if self.layers[autotile_num] is None:
+            self.layers[autotile_num] = _new_image(self.width, self.height)
+        self._paint(self.layers[autotile_num], layer_tiles)
+
+    def get_image(self, autotile_num: int) -> QImage:
+        if self.layers[autotile_num] is None:
+            # Shares the base's data until painted on
+            return QImage(self.base)
+        image = self.base.copy()
+        painter = QPainter()
+        painter.begin(image)
+        painter.drawImage(0, 0, self.layers[autotile_num])
+        painter.end()
+        return image
+
+def get_draw_cache(tilemap: MapPrefab) -> TilemapDrawCache:
+    cache = tilemap.draw_cache
+    if cache is None or (cache.width, cache.height) != (tilemap.width, tilemap.height):
+        cache = TilemapDrawCache(tilemap.width, tilemap.height)
+        tilemap.draw_cache = cache
+    return cache
 
 def draw_tilemap(tilemap: MapPrefab, autotile_fps=29) -> QImage:
     # import time
     # start = time.time_ns() / 1e6
-    image = QImage(tilemap.width * TILEWIDTH,
-                   tilemap.height * TILEHEIGHT,
-                   QImage.Format_ARGB32)
-    image.fill(QColor(0, 0, 0, 0))
-
-    painter = QPainter()
-    painter.begin(image)
+    cache = get_draw_cache(tilemap)
     ms = QDateTime.currentMSecsSinceEpoch()
 
     if autotile_fps:
@@ -32,46 +117,44 @@ def draw_tilemap(tilemap: MapPrefab, autotile_fps=29) -> QImage:
     # Process terrain
     # a = time.time_ns() / 1e6
     processed_nids = set()
-    for pos in sorted(tilemap.terrain_grid):
+    # Only process the ones that need to be updated
+    for pos in sorted(tilemap.terrain_grid_to_update):
         # Determine what terrain is in this position
         terrain_nid = tilemap.get_terrain(pos)
         if not terrain_nid:
             continue
         terrain = DB_terrain.get(terrain_nid)
 
-        # Only process the ones that need to be updated
-        if pos in tilemap.terrain_grid_to_update:
-            if terrain_nid not in processed_nids:
-                terrain.single_process(tilemap)
-                processed_nids.add(terrain_nid)
-            sprite = terrain.determine_sprite(tilemap, pos, autotile_num)
-            tilemap.tile_grid[pos] = sprite
+        if terrain_nid not in processed_nids:
+            terrain.single_process(tilemap)
+            processed_nids.add(terrain_nid)
+        sprite = terrain.determine_sprite(tilemap, pos, autotile_num)
+        tilemap.tile_grid[pos] = sprite
+        # Its other autotile frames are out of date too
+        cache.invalidate(pos)
 
     # b = time.time_ns() / 1e6
 
     # Autotiles
-    global last_autotile_num
-    if autotile_num != last_autotile_num:
+    if autotile_num != cache.autotile_num:
         for pos in sorted(tilemap.autotile_set):
             if pos not in tilemap.terrain_grid_to_update:
-                # Determine what terrain is in this position
-                terrain_nid = tilemap.get_terrain(pos)
-                if not terrain_nid:
-                    continue
-                terrain = DB_terrain.get(terrain_nid)
-                sprite = terrain.determine_sprite(tilemap, pos, autotile_num)
+                # Reuse the sprite from the last time this frame was shown
+                sprite = cache.get_autotile_sprite(pos, autotile_num)
+                if sprite is None:
+                    # Determine what terrain is in this position
+                    terrain_nid = tilemap.get_terrain(pos)
+                    if not terrain_nid:
+                        continue
+                    terrain = DB_terrain.get(terrain_nid)
+                    sprite = terrain.determine_sprite(tilemap, pos, autotile_num)
                 tilemap.tile_grid[pos] = sprite
-        last_autotile_num = autotile_num
+        cache.autotile_num = autotile_num
     # c = time.time_ns() / 1e6
 
     # Draw the tile grid
-    for pos, pix in tilemap.tile_grid.items():
-        assert pix.width() == TILEWIDTH, pix.width()
-        assert pix.height() == TILEHEIGHT, pix.height()
-        painter.drawPixmap(pos[0] * TILEWIDTH,
-                           pos[1] * TILEHEIGHT,
-                           pix)
-    painter.end()
+    cache.update(tilemap, autotile_num)
+    image = cache.get_image(autotile_num)
 
     # Make sure we don't need to update it anymore
     tilemap.terrain_grid_to_update.clear()
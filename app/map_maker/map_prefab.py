@@ -3,6 +3,12 @@ from app.constants import TILEX, TILEY
 from app.utilities.data import Prefab
 import app.map_maker.utilities as map_utils
 
+# Bits of the masks returned by MapPrefab.get_edge_mask
+NORTH, EAST, SOUTH, WEST = 1, 2, 4, 8
+NORTHEAST, SOUTHEAST, SOUTHWEST, NORTHWEST = 16, 32, 64, 128
+EDGE_OFFSETS = ((NORTH, (0, -1)), (EAST, (1, 0)), (SOUTH, (0, 1)), (WEST, (-1, 0)),
+                (NORTHEAST, (1, -1)), (SOUTHEAST, (1, 1)), (SOUTHWEST, (-1, 1)), (NORTHWEST, (-1, -1)))
+
 class MapPrefab(Prefab):
     def __init__(self, nid):
         self.nid = nid
@@ -10,6 +16,8 @@ class MapPrefab(Prefab):
         self.autotile_fps = 29
 
         self.pixmap = None
+        # Used by draw_tilemap to only repaint what changed
+        self.draw_cache = None
         
         self.terrain_grid = {}  # Key: Position, Value: Terrain Nids
         self.terrain_grid_to_update = set()  # Positions
@@ -20,6 +28,11 @@ class MapPrefab(Prefab):
 
         self.current_palette = None
 
+        # Key: terrain_like, Value: Dict of Position -> edge mask
+        self._edge_masks = {}
+        # Key: Whether diagonals count as connected
+        self._blobs = {False: map_utils.BlobIndex(self), True: map_utils.BlobIndex(self, True)}
+
     def reset_all(self):
         for position in self.terrain_grid:
             self.terrain_grid_to_update.add(position)
@@ -27,7 +40,10 @@ class MapPrefab(Prefab):
     def set(self, pos: tuple, old_terrain, new_terrain):
         if old_terrain and old_terrain.check_flood_fill and pos not in self.terrain_grid_to_update:
             self._update_flood_fill(pos, old_terrain.check_flood_fill == 'diagonal')  # Need to check flood fill both before and after changing terrain
-        self.terrain_grid[pos] = new_terrain.nid
+        if self.terrain_grid.get(pos) != new_terrain.nid:
+            self._before_change(pos)
+            self.terrain_grid[pos] = new_terrain.nid
+            self._after_change(pos)
         self.terrain_grid_to_update.add(pos)
         self._update_adjacent(pos)
         self._update_diagonal(pos)
@@ -64,9 +80,53 @@ class MapPrefab(Prefab):
             self.terrain_grid_to_update.add(northwest)
 
     def _update_flood_fill(self, pos, diagonal=False):
-        blob_positions = map_utils.flood_fill(self, pos, diagonal)
-        for p in blob_positions:
-            self.terrain_grid_to_update.add(p)
+        self.terrain_grid_to_update |= self.get_blob(pos, diagonal)
+
+    def _before_change(self, pos):
+        for blobs in self._blobs.values():
+            blobs.remove(pos)
+
+    def _after_change(self, pos):
+        for blobs in self._blobs.values():
+            blobs.add(pos)
+        # The edge masks of pos and everything around it may be different now
+        x, y = pos
+        for masks in self._edge_masks.values():
+            masks.pop(pos, None)
+            for _, (dx, dy) in EDGE_OFFSETS:
+                masks.pop((x + dx, y + dy), None)
+
+    def _reset_indexes(self):
+        self._edge_masks.clear()
+        for blobs in self._blobs.values():
+            blobs.clear()
+
+    def get_blob(self, pos: tuple, diagonal: bool = False) -> set:
+        """
+        All positions connected to pos with the same terrain, like map_utils.flood_fill.
+        Do not change the returned set; copy it first
+        """
+        return self._blobs[diagonal].get(pos)
+
+    def get_edge_mask(self, pos: tuple, terrain_like) -> int:
+        """
+        Returns a bitmask of which positions around pos are empty or have terrain in terrain_like,
+        with NORTH, EAST, SOUTH, WEST in the low four bits and then the diagonals
+        """
+        masks = self._edge_masks.get(terrain_like)
+        if masks is None:
+            masks = self._edge_masks[terrain_like] = {}
+        mask = masks.get(pos)
+        if mask is None:
+            mask = 0
+            x, y = pos
+            terrain_grid = self.terrain_grid
+            for bit, (dx, dy) in EDGE_OFFSETS:
+                nid = terrain_grid.get((x + dx, y + dy))
+                if not nid or nid in terrain_like:
+                    mask |= bit
+            masks[pos] = mask
+        return mask
 
     def get_terrain(self, pos: tuple) -> str:
         return self.terrain_grid.get(pos)
@@ -75,7 +135,9 @@ class MapPrefab(Prefab):
         if old_terrain and old_terrain.check_flood_fill:
             self._update_flood_fill(pos, old_terrain.check_flood_fill == 'diagonal')
         if pos in self.terrain_grid:
+            self._before_change(pos)
             del self.terrain_grid[pos]
+            self._after_change(pos)
         self.autotile_set.discard(pos)
 
         if pos in self.tile_grid:
@@ -104,6 +166,7 @@ class MapPrefab(Prefab):
         self.terrain_grid_to_update.clear()
         self.tile_grid.clear()
         self.autotile_set.clear()
+        self._reset_indexes()
 
     def check_bounds(self, pos: tuple):
         return 0 <= pos[0] < self.width and 0 <= pos[1] < self.height
@@ -125,6 +188,7 @@ class MapPrefab(Prefab):
             if self.check_bounds(new_pos):
                 new_terrain_grid[new_pos] = terrain_nid
         self.terrain_grid = new_terrain_grid
+        self._reset_indexes()
 
         new_tile_grid = {}
         for pos, tile_coord in self.tile_grid.items():
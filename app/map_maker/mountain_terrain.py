@@ -8,7 +8,7 @@ except ImportError:
 from PyQt5.QtCore import QThread
 from PyQt5.QtGui import QPixmap
 
-from app.map_maker.utilities import random_choice, flood_fill
+from app.map_maker.utilities import random_choice
 from app.map_maker.terrain import Terrain
 from app.map_maker.mountain_process import NaiveBacktrackingThread, AlgorithmXThread
 
@@ -64,7 +64,7 @@ class MountainTerrain(Terrain):
         limit: int = int(1e6)
         while positions and counter < limit:
             pos = positions.pop()
-            near_positions: set = flood_fill(tilemap, pos)
+            near_positions: set = set(tilemap.get_blob(pos))
             groupings.append(near_positions)
             for near_pos in near_positions:
                 positions.discard(near_pos)
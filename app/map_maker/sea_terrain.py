@@ -41,13 +41,8 @@ class SeaTerrain(WangEdge2Terrain):
         return self.display_pixmap
 
     def _determine_index(self, tilemap, pos: tuple) -> int:
-        north, east, south, west = tilemap.get_cardinal_terrain(pos)
-        north_edge = bool(not north or north in self.terrain_like)
-        south_edge = bool(not south or south in self.terrain_like)
-        east_edge = bool(not east or east in self.terrain_like)
-        west_edge = bool(not west or west in self.terrain_like)
-        index = 1 * north_edge + 2 * east_edge + 4 * south_edge + 8 * west_edge
-        return index
+        # The low four bits are 1 * north_edge + 2 * east_edge + 4 * south_edge + 8 * west_edge
+        return tilemap.get_edge_mask(pos, self.terrain_like) & 0xF
 
     def _near_sand(self, tilemap, pos: tuple) -> bool:
         return any(x == 'Sand' for x in tilemap.get_cardinal_terrain(pos))
@@ -140,12 +140,139 @@ def _noise2(x, y, perm):
 
     return value / NORM_CONSTANT2
 
+@lru_cache(64)
+def _init_gradients(seed):
+    """
+    The GRADIENTS2 index _extrapolate2 would use for every
+    (xsb & 0xFF, ysb & 0xFF) pair, flattened to xsb * 256 + ysb
+    """
+    perm = _init(seed)
+    gradients = [0] * (256 * 256)
+    for xsb in range(256):
+        offset = perm[xsb]
+        row = xsb << 8
+        for ysb in range(256):
+            gradients[row | ysb] = perm[(offset + ysb) & 0xFF] & 0x0E
+    return gradients
+
+def _noise2_batch(xs, ys, seed) -> list:
+    """
+    Same as calling _noise2 on every (x, y) pair in xs and ys,
+    with the same result down to the last bit, but all in one loop
+    """
+    gradients = _init_gradients(seed)
+    grads = GRADIENTS2
+    squish = SQUISH_CONSTANT2
+    squish2 = 2 * SQUISH_CONSTANT2
+    _floor = floor
+    values = []
+    append = values.append
+    for x, y in zip(xs, ys):
+        # See _noise2 for what each step does
+        stretch_offset = (x + y) * STRETCH_CONSTANT2
+        xs_ = x + stretch_offset
+        ys_ = y + stretch_offset
+        xsb = _floor(xs_)
+        ysb = _floor(ys_)
+        squish_offset = (xsb + ysb) * squish
+        xb = xsb + squish_offset
+        yb = ysb + squish_offset
+        xins = xs_ - xsb
+        yins = ys_ - ysb
+        in_sum = xins + yins
+        dx0 = x - xb
+        dy0 = y - yb
+
+        value = 0
+
+        # Contribution (1, 0)
+        dx1 = dx0 - 1 - squish
+        dy1 = dy0 - 0 - squish
+        attn1 = 2 - dx1 * dx1 - dy1 * dy1
+        if attn1 > 0:
+            attn1 *= attn1
+            index = gradients[((xsb + 1) & 0xFF) << 8 | (ysb & 0xFF)]
+            value += attn1 * attn1 * (grads[index] * dx1 + grads[index + 1] * dy1)
+
+        # Contribution (0, 1)
+        dx2 = dx0 - 0 - squish
+        dy2 = dy0 - 1 - squish
+        attn2 = 2 - dx2 * dx2 - dy2 * dy2
+        if attn2 > 0:
+            attn2 *= attn2
+            index = gradients[(xsb & 0xFF) << 8 | ((ysb + 1) & 0xFF)]
+            value += attn2 * attn2 * (grads[index] * dx2 + grads[index + 1] * dy2)
+
+        if in_sum <= 1:
+            zins = 1 - in_sum
+            if zins > xins or zins > yins:
+                if xins > yins:
+                    xsv_ext = xsb + 1
+                    ysv_ext = ysb - 1
+                    dx_ext = dx0 - 1
+                    dy_ext = dy0 + 1
+                else:
+                    xsv_ext = xsb - 1
+                    ysv_ext = ysb + 1
+                    dx_ext = dx0 + 1
+                    dy_ext = dy0 - 1
+            else:
+                xsv_ext = xsb + 1
+                ysv_ext = ysb + 1
+                dx_ext = dx0 - 1 - squish2
+                dy_ext = dy0 - 1 - squish2
+        else:
+            zins = 2 - in_sum
+            if zins < xins or zins < yins:
+                if xins > yins:
+                    xsv_ext = xsb + 2
+                    ysv_ext = ysb + 0
+                    dx_ext = dx0 - 2 - squish2
+                    dy_ext = dy0 + 0 - squish2
+                else:
+                    xsv_ext = xsb + 0
+                    ysv_ext = ysb + 2
+                    dx_ext = dx0 + 0 - squish2
+                    dy_ext = dy0 - 2 - squish2
+            else:
+                xsv_ext = xsb
+                ysv_ext = ysb
+                dx_ext = dx0
+                dy_ext = dy0
+            xsb += 1
+            ysb += 1
+            dx0 = dx0 - 1 - squish2
+            dy0 = dy0 - 1 - squish2
+
+        # Contribution (0, 0) or (1, 1)
+        attn0 = 2 - dx0 * dx0 - dy0 * dy0
+        if attn0 > 0:
+            attn0 *= attn0
+            index = gradients[(xsb & 0xFF) << 8 | (ysb & 0xFF)]
+            value += attn0 * attn0 * (grads[index] * dx0 + grads[index + 1] * dy0)
+
+        # Extra vertex
+        attn_ext = 2 - dx_ext * dx_ext - dy_ext * dy_ext
+        if attn_ext > 0:
+            attn_ext *= attn_ext
+            index = gradients[(xsv_ext & 0xFF) << 8 | (ysv_ext & 0xFF)]
+            value += attn_ext * attn_ext * (grads[index] * dx_ext + grads[index + 1] * dy_ext)
+
+        append(value / NORM_CONSTANT2)
+    return values
+
 def get(x, y, seed):
     perm = _init(seed)
     val = _noise2(x, y, perm)
     new_val = (val - -0.865) / (.865 - -0.865)
     return new_val
 
+def get_batch(xs, ys, seed) -> list:
+    """
+    Same as calling get on every (x, y) pair in xs and ys
+    """
+    return [(val - -0.865) / (.865 - -0.865) for val in _noise2_batch(xs, ys, seed)]
+
 def get_full_noise(x, y, seed,
                    starting_frequency=1.0, starting_amplitude=0.5,
                    octaves=4, lacunarity=2.0, gain=0.5):
@@ -162,47 +289,58 @@ def get_full_noise(x, y, seed,
     total /= denominator
     return total
 
+def get_full_noise_batch(xs, ys, seed,
+                         starting_frequency=1.0, starting_amplitude=0.5,
+                         octaves=4, lacunarity=2.0, gain=0.5) -> list:
+    """
+    Same as calling get_full_noise on every (x, y) pair in xs and ys
+    """
+    totals = [0] * len(xs)
+    freq = starting_frequency
+    amp = starting_amplitude
+    denominator = 0
+    for _ in range(octaves):
+        vals = get_batch([x * freq for x in xs], [y * freq for y in ys], seed)
+        totals = [total + val * amp for total, val in zip(totals, vals)]
+        denominator += amp
+        freq *= lacunarity
+        amp *= gain
+    return [total / denominator for total in totals]
+
 def gen_noise_map(size: tuple, seed,
                   starting_frequency=1.0, starting_amplitude=0.5,
                   octaves=4, lacunarity=2.0, gain=0.5) -> dict:
     width, height = size
-    noise_map = {}
-    for x in range(width):
-        for y in range(height):
-            val = \
-                get_full_noise(
-                    x, y, seed, 
-                    starting_frequency, starting_amplitude, 
-                    octaves, lacunarity, gain)
-            noise_map[(x, y)] = val
-    return noise_map
+    positions = [(x, y) for x in range(width) for y in range(height)]
+    xs = [x for x, y in positions]
+    ys = [y for x, y in positions]
+    vals = get_full_noise_batch(
+        xs, ys, seed,
+        starting_frequency, starting_amplitude,
+        octaves, lacunarity, gain)
+    return dict(zip(positions, vals))
 
 def gen_double_noise_map(size: tuple, seed,
                          starting_frequency=1.0, starting_amplitude=0.5,
                          octaves=4, lacunarity=2.0, gain=0.5) -> dict:
     width, height = size
-    noise_map1, noise_map2, noise_map3 = {}, {}, {}
-    for x in range(width):
-        for y in range(height):
-            val1 = \
-                get_full_noise(
-                    x, y, seed, 
-                    starting_frequency, starting_amplitude, 
-                    octaves, lacunarity, gain)
-            val2 = \
-                get_full_noise(
-                    x + 5.2*width, y + 1.3*height, seed, 
-                    starting_frequency, starting_amplitude, 
-                    octaves, lacunarity, gain)
-            val3 = \
-                get_full_noise(
-                    x + 4 * width * val1, y + 4 * height * val2, seed, 
-                    starting_frequency, starting_amplitude, 
-                    octaves, lacunarity, gain)
-            noise_map1[(x, y)] = val1
-            noise_map2[(x, y)] = val2
-            noise_map3[(x, y)] = val3
-    return noise_map1, noise_map2, noise_map3
+    positions = [(x, y) for x in range(width) for y in range(height)]
+    xs = [x for x, y in positions]
+    ys = [y for x, y in positions]
+    vals1 = get_full_noise_batch(
+        xs, ys, seed,
+        starting_frequency, starting_amplitude,
+        octaves, lacunarity, gain)
+    vals2 = get_full_noise_batch(
+        [x + 5.2*width for x in xs], [y + 1.3*height for y in ys], seed,
+        starting_frequency, starting_amplitude,
+        octaves, lacunarity, gain)
+    vals3 = get_full_noise_batch(
+        [x + 4 * width * val1 for x, val1 in zip(xs, vals1)],
+        [y + 4 * height * val2 for y, val2 in zip(ys, vals2)], seed,
+        starting_frequency, starting_amplitude,
+        octaves, lacunarity, gain)
+    return dict(zip(positions, vals1)), dict(zip(positions, vals2)), dict(zip(positions, vals3))
 
 if __name__ == '__main__':
     perm = _init(47)
@@ -1,7 +1,7 @@
 from PyQt5.QtGui import QPixmap
 
 import app.utilities as utils
-from app.map_maker.utilities import random_choice, edge_random, flood_fill, find_bounds
+from app.map_maker.utilities import random_choice, edge_random, find_bounds
 from app.map_maker.terrain import Terrain, TerrainCatalog
 from app.map_maker.wang_terrain import WangCorner2Terrain, WangEdge2Terrain, WangEdge2Terrain16
 from app.map_maker.building_terrain import CastleTerrain, HouseTerrain, RuinsTerrain
@@ -99,7 +99,7 @@ class ForestTerrain(Terrain):
 
     def determine_sprite(self, tilemap, pos: tuple, autotile_num: int) -> QPixmap:
         north, east, south, west = tilemap.get_cardinal_terrain(pos)
-        blob_positions = flood_fill(tilemap, pos)
+        blob_positions = tilemap.get_blob(pos)
         _, _, _, _, blob_width, blob_height, center_x, center_y = \
             find_bounds(tilemap, blob_positions)
         my_radius_width = abs(pos[0] + 0.5 - center_x)
@@ -184,16 +184,8 @@ class RiverTerrain(WangEdge2Terrain):
     terrain_like = ('River', 'Sea', 'BridgeH', 'BridgeV')
 
     def determine_sprite(self, tilemap, pos: tuple, autotile_num: int) -> QPixmap:
-        north, east, south, west = tilemap.get_cardinal_terrain(pos)
-        northeast, southeast, southwest, northwest = tilemap.get_diagonal_terrain(pos)
-        north_edge = bool(not north or north in self.terrain_like)
-        south_edge = bool(not south or south in self.terrain_like)
-        east_edge = bool(not east or east in self.terrain_like)
-        west_edge = bool(not west or west in self.terrain_like)
-        northeast_edge = bool(not northeast or northeast in self.terrain_like)
-        southeast_edge = bool(not southeast or southeast in self.terrain_like)
-        southwest_edge = bool(not southwest or southwest in self.terrain_like)
-        northwest_edge = bool(not northwest or northwest in self.terrain_like)
+        north_edge, south_edge, east_edge, west_edge, northeast_edge, northwest_edge, southeast_edge, southwest_edge = \
+            self.get_edges(tilemap, pos)
         if random_choice([1, 2], pos) == 1:
             use_top = True
         else:
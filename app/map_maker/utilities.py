@@ -77,6 +77,89 @@ def flood_fill(tilemap, pos: tuple, diagonal: bool = False, match: set = None, m
     find_similar(pos, match)
     return blob_positions
 
+class BlobIndex():
+    """
+    Remembers the blobs flood_fill finds (connected positions with the same terrain)
+    in a union-find, so asking for the blob of any position in it again is cheap.
+
+    Kept up to date as terrain changes: setting a position's terrain joins it
+    to the blobs next to it, while the blob it used to be part of may have
+    been split apart, so it is forgotten and flood filled again when next asked for.
+    """
+    def __init__(self, tilemap, diagonal: bool = False):
+        self.tilemap = tilemap
+        self.diagonal: bool = diagonal
+        self.parent: dict = {}  # Key: Position, Value: Position closer to the root of its blob
+        self.members: dict = {}  # Key: Root position, Value: Set of positions in its blob
+
+    def clear(self):
+        self.parent.clear()
+        self.members.clear()
+
+    def _neighbors(self, pos: tuple) -> list:
+        x, y = pos
+        neighbors = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+        if self.diagonal:
+            neighbors += [(x - 1, y - 1), (x - 1, y + 1), (x + 1, y - 1), (x + 1, y + 1)]
+        return neighbors
+
+    def _find(self, pos: tuple) -> tuple:
+        parent = self.parent
+        while parent[pos] != pos:
+            # Path halving
+            parent[pos] = parent[parent[pos]]
+            pos = parent[pos]
+        return pos
+
+    def _union(self, pos1: tuple, pos2: tuple):
+        root1, root2 = self._find(pos1), self._find(pos2)
+        if root1 == root2:
+            return
+        # Always merge the smaller blob into the larger one
+        if len(self.members[root1]) < len(self.members[root2]):
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.members[root1] |= self.members.pop(root2)
+
+    def get(self, pos: tuple) -> set:
+        """
+        Same as flood_fill(tilemap, pos, diagonal), but the returned set
+        belongs to the index, so copy it before changing it or keeping it around
+        """
+        if pos not in self.parent:
+            blob = flood_fill(self.tilemap, pos, self.diagonal)
+            for p in blob:
+                self.parent[p] = pos
+            self.members[pos] = blob
+        return self.members[self._find(pos)]
+
+    def remove(self, pos: tuple):
+        """
+        Call before the terrain at pos changes
+        """
+        if pos in self.parent:
+            for p in self.members.pop(self._find(pos)):
+                del self.parent[p]
+
+    def add(self, pos: tuple):
+        """
+        Call after the terrain at pos changes
+        """
+        tilemap = self.tilemap
+        nid = tilemap.get_terrain(pos)
+        same = [p for p in self._neighbors(pos)
+                if tilemap.check_bounds(p) and tilemap.get_terrain(p) == nid]
+        if any(p not in self.parent for p in same):
+            # Joins up with a blob we don't know all of yet,
+            # so leave it all to be flood filled later
+            for p in same:
+                self.remove(p)
+            return
+        self.parent[pos] = pos
+        self.members[pos] = {pos}
+        for p in same:
+            self._union(pos, p)
+
 def find_bounds(tilemap, group: set) -> tuple:
     left_most = min(p[0] for p in group)
     right_most = max(p[0] for p in group)
@@ -115,3 +198,26 @@ def find_bounding_rect(coords: set) -> tuple:
     blob_width = (right_most - left_most)
     blob_height = (bottom_most - top_most)
     return left_most, top_most, blob_width, blob_height
+
+def diff_drawn_tiles(drawn: dict, tile_grid: dict, autotile_set: set, autotiles: bool) -> list:
+    """
+    Finds what needs to be repainted to bring an image in line with the tile grid.
+    The image holds either only the autotile positions or only the others.
+
+    drawn maps each position to the sprite already painted there, compared by identity,
+    and is updated to match. Returns a list of (position, sprite) to paint,
+    where a sprite of None means the position should be cleared
+    """
+    if autotiles:
+        removed = drawn.keys() - (tile_grid.keys() & autotile_set)
+    else:
+        removed = (drawn.keys() - tile_grid.keys()) | (drawn.keys() & autotile_set)
+    changes = []
+    for pos in removed:
+        changes.append((pos, None))
+        del drawn[pos]
+    for pos, sprite in tile_grid.items():
+        if (pos in autotile_set) == autotiles and drawn.get(pos) is not sprite:
+            changes.append((pos, sprite))
+            drawn[pos] = sprite
+    return changes
@@ -1,9 +1,48 @@
 from PyQt5.QtGui import QPixmap, QPainter, qRgb
 
 from app.constants import TILEWIDTH, TILEHEIGHT
+from app.map_maker.map_prefab import NORTH, EAST, SOUTH, WEST, NORTHEAST, SOUTHEAST, SOUTHWEST, NORTHWEST
 from app.map_maker.terrain import Terrain
 from app.map_maker.utilities import random_choice, random_random
 
+def _edge2_index(mask: int) -> tuple:
+    north_edge = bool(mask & NORTH)
+    south_edge = bool(mask & SOUTH)
+    east_edge = bool(mask & EAST)
+    west_edge = bool(mask & WEST)
+    index1 = 6 + 1 * north_edge + 8 * west_edge
+    index2 = 12 + 1 * north_edge + 2 * east_edge
+    index3 = 9 + 4 * south_edge + 2 * east_edge
+    index4 = 3 + 4 * south_edge + 8 * west_edge
+    return index1, index2, index3, index4
+
+def _corner2_index(mask: int) -> tuple:
+    north_edge = bool(mask & NORTH)
+    south_edge = bool(mask & SOUTH)
+    east_edge = bool(mask & EAST)
+    west_edge = bool(mask & WEST)
+    index1 = 1 * north_edge + \
+        2 * True + \
+        4 * west_edge + \
+        8 * (bool(mask & NORTHWEST) and north_edge and west_edge)
+    index2 = 1 * (bool(mask & NORTHEAST) and north_edge and east_edge) + \
+        2 * east_edge + \
+        4 * True + \
+        8 * north_edge
+    index3 = 1 * east_edge + \
+        2 * (bool(mask & SOUTHEAST) and south_edge and east_edge) + \
+        4 * south_edge + \
+        8 * True
+    index4 = 1 * True + \
+        2 * south_edge + \
+        4 * (bool(mask & SOUTHWEST) and south_edge and west_edge) + \
+        8 * west_edge
+    return index1, index2, index3, index4
+
+# Indices to use for each edge mask (see MapPrefab.get_edge_mask)
+EDGE2_INDICES = [_edge2_index(mask) for mask in range(16)]
+CORNER2_INDICES = [_corner2_index(mask) for mask in range(256)]
+
 class WangEdge2Terrain(Terrain):
     terrain_like = ()
 
@@ -34,17 +73,20 @@ class WangEdge2Terrain(Terrain):
             self.display_pixmap = main_pix
         return self.display_pixmap
 
+    def get_edges(self, tilemap, pos):
+        mask = tilemap.get_edge_mask(pos, self.terrain_like)
+        north_edge = bool(mask & NORTH)
+        south_edge = bool(mask & SOUTH)
+        east_edge = bool(mask & EAST)
+        west_edge = bool(mask & WEST)
+        northeast_edge = bool(mask & NORTHEAST)
+        southeast_edge = bool(mask & SOUTHEAST)
+        southwest_edge = bool(mask & SOUTHWEST)
+        northwest_edge = bool(mask & NORTHWEST)
+        return north_edge, south_edge, east_edge, west_edge, northeast_edge, northwest_edge, southeast_edge, southwest_edge
+
     def _determine_index(self, tilemap, pos: tuple) -> tuple:
-        north, east, south, west = tilemap.get_cardinal_terrain(pos)
-        north_edge = bool(not north or north in self.terrain_like)
-        south_edge = bool(not south or south in self.terrain_like)
-        east_edge = bool(not east or east in self.terrain_like)
-        west_edge = bool(not west or west in self.terrain_like)
-        index1 = 6 + 1 * north_edge + 8 * west_edge
-        index2 = 12 + 1 * north_edge + 2 * east_edge
-        index3 = 9 + 4 * south_edge + 2 * east_edge
-        index4 = 3 + 4 * south_edge + 8 * west_edge
-        return index1, index2, index3, index4
+        return EDGE2_INDICES[tilemap.get_edge_mask(pos, self.terrain_like) & 0xF]
 
     def determine_sprite(self, tilemap, pos: tuple, autotile_num: int) -> QPixmap:
         index1, index2, index3, index4 = self._determine_index(tilemap, pos)  
@@ -60,29 +102,7 @@ class WangCorner2Terrain(WangEdge2Terrain):
     terrain_like = ()
 
     def _determine_index(self, tilemap, pos: tuple) -> tuple:
-        north, east, south, west = tilemap.get_cardinal_terrain(pos)
-        northeast, southeast, southwest, northwest = tilemap.get_diagonal_terrain(pos)
-        north_edge = bool(not north or north in self.terrain_like)
-        south_edge = bool(not south or south in self.terrain_like)
-        east_edge = bool(not east or east in self.terrain_like)
-        west_edge = bool(not west or west in self.terrain_like)
-        index1 = 1 * north_edge + \
-            2 * True + \
-            4 * west_edge + \
-            8 * (bool(not northwest or northwest in self.terrain_like) and north_edge and west_edge)
-        index2 = 1 * (bool(not northeast or northeast in self.terrain_like) and north_edge and east_edge) + \
-            2 * east_edge + \
-            4 * True + \
-            8 * north_edge
-        index3 = 1 * east_edge + \
-            2 * (bool(not southeast or southeast in self.terrain_like) and south_edge and east_edge) + \
-            4 * south_edge + \
-            8 * True
-        index4 = 1 * True + \
-            2 * south_edge + \
-            4 * (bool(not southwest or southwest in self.terrain_like) and south_edge and west_edge) + \
-            8 * west_edge
-        return index1, index2, index3, index4
+        return CORNER2_INDICES[tilemap.get_edge_mask(pos, self.terrain_like)]
 
     def _pos_to_vertices(self, pos) -> tuple:
         center_vertex_pos = pos[0]*2 + 1, pos[1]*2 + 1
@@ -98,19 +118,6 @@ class WangCorner2Terrain(WangEdge2Terrain):
             top_vertex_pos, bottom_vertex_pos, topleft_vertex_pos, \
             topright_vertex_pos, bottomleft_vertex_pos, bottomright_vertex_pos
 
-    def get_edges(self, tilemap, pos):
-        north, east, south, west = tilemap.get_cardinal_terrain(pos)
-        north_edge = bool(not north or north in self.terrain_like)
-        south_edge = bool(not south or south in self.terrain_like)
-        east_edge = bool(not east or east in self.terrain_like)
-        west_edge = bool(not west or west in self.terrain_like)
-        northeast, southeast, southwest, northwest = tilemap.get_diagonal_terrain(pos)
-        northeast_edge = bool(not northeast or northeast in self.terrain_like)
-        southeast_edge = bool(not southeast or southeast in self.terrain_like)
-        southwest_edge = bool(not southwest or southwest in self.terrain_like)
-        northwest_edge = bool(not northwest or northwest in self.terrain_like)
-        return north_edge, south_edge, east_edge, west_edge, northeast_edge, northwest_edge, southeast_edge, southwest_edge
-
     def determine_vertex(self, tilemap, pos):
         north_edge, south_edge, east_edge, west_edge, northeast_edge, northwest_edge, southeast_edge, southwest_edge = self.get_edges(tilemap, pos)
         # 0 is patch
@@ -199,13 +206,8 @@ class WangEdge2Terrain16(WangEdge2Terrain):
         return self.display_pixmap
 
     def _determine_index(self, tilemap, pos: tuple) -> tuple:
-        north, east, south, west = tilemap.get_cardinal_terrain(pos)
-        north_edge = bool(not north or north in self.terrain_like)
-        south_edge = bool(not south or south in self.terrain_like)
-        east_edge = bool(not east or east in self.terrain_like)
-        west_edge = bool(not west or west in self.terrain_like)
-        index = 1 * north_edge + 2 * east_edge + 4 * south_edge + 8 * west_edge
-        return index
+        # The low four bits are 1 * north_edge + 2 * east_edge + 4 * south_edge + 8 * west_edge
+        return tilemap.get_edge_mask(pos, self.terrain_like) & 0xF
 
     def determine_sprite(self, tilemap, pos: tuple, autotile_num: int) -> QPixmap:
         index = self._determine_index(tilemap, pos)
@@ -0,0 +1,41 @@
+import pickle
+import unittest
+
+from app.engine import action_log_codec
+
+class ActionLogCodecTests(unittest.TestCase):
+    def test_round_trip(self):
+        actions = [
+            ('MarkPhase', {'phase_name': ('generic', 'player')}),
+            ('LockTurnwheel', {'lock': ('generic', True)}),
+            ('Move', {'unit': ('unit', 'Eirika'),
+                      'old_pos': ('generic', (3, 4)),
+                      'new_pos': ('generic', (5, 2)),
+                      'prev_movement_left': ('generic', -1),
+                      'path': ('list', [('generic', (5, 2)), ('generic', (4, 2)), ('generic', (4, 3)), ('generic', (3, 4))]),
+                      'speed': ('generic', 48.5),
+                      'event': ('generic', False),
+                      'follow': ('generic', None)}),
+            ('GiveItem', {'unit': ('unit', 'Seth'),
+                          'item': ('item', 104),
+                          'skills': ('list', [('skill', 201), ('skill', 2 ** 70)]),
+                          'uids': ('generic', ([1, 5, 3, -7], {'a': (1, 2, 3)}, {(1, 2): 'b'})),
+                          'flags': ('generic', {1, 2, 3}),
+                          'region': ('region', 'Door1'),
+                          'sub': ('action', ('MarkPhase', {'phase_name': ('generic', 'enemy')}))}),
+            ('Action', {}),
+        ]
+        encoded = action_log_codec.encode_actions(actions)
+        decoded = action_log_codec.decode_actions(encoded)
+        self.assertEqual(actions, decoded)
+        # Tuples stay tuples and lists stay lists
+        self.assertEqual(repr(actions), repr(decoded))
+
+    def test_smaller_than_pickle(self):
+        actions = [('Move', {'unit': ('unit', 'Eirika'),
+                             'old_pos': ('generic', (i, i + 1)),
+                             'new_pos': ('generic', (i + 1, i + 1)),
+                             'path': ('list', [('generic', (i + 1, i + 1)), ('generic', (i, i + 1))])})
+                   for i in range(200)]
+        encoded = action_log_codec.encode_actions(actions)
+        self.assertLess(len(pickle.dumps(encoded)), len(pickle.dumps(actions)) // 2)
@@ -0,0 +1,46 @@
+import logging
+import unittest
+
+from app.engine import headless
+
+class AssetWarmupTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.runner = headless.HeadlessRunner('testing_proj')
+
+    def tearDown(self):
+        from app.engine import engine
+        engine.clear_staged_images()
+        logging.disable(logging.NOTSET)
+
+    def test_staged_image_used_once(self):
+        headless.init()
+        from app.engine import engine
+        image = engine.create_surface((4, 4))
+        engine.stage_image('not_a_real_file.png', image)
+        self.assertIs(engine.image_load('not_a_real_file.png'), image)
+        with self.assertRaises(FileNotFoundError):
+            engine.image_load('not_a_real_file.png')
+
+    def test_warmup_builds_map_sprites(self):
+        from app.data.resources.resources import RESOURCES
+        from app.engine import asset_warmup, engine
+        game = self.runner.start_level('0')
+        for res in RESOURCES.map_sprites:
+            res.standing_image = None
+            res.moving_image = None
+        game.map_sprite_registry.clear()
+        units = game.get_all_units()
+        for unit in units:
+            unit.reset_sprite()
+
+        warmup = asset_warmup.AssetWarmup(units)
+        warmup.start()
+        self.assertTrue(warmup.futures)
+        warmup.finish()
+        self.assertTrue(warmup.done)
+        for unit in units:
+            self.assertIsNotNone(unit._sprite)
+            self.assertIsNotNone(unit.sprite.map_sprite)
+        # Every image that was decoded ahead of time was used
+        self.assertFalse(engine._staged_images)
@@ -0,0 +1,54 @@
+import logging
+import random
+import unittest
+
+from app.engine import headless
+
+class CombatParityTests(unittest.TestCase):
+    """
+    Combats resolved all at once (SimpleCombat) must consume the same rolls
+    and reach the same outcome as combats stepped through frame by frame (MapCombat)
+    """
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.runner = headless.HeadlessRunner('testing_proj')
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def run_combat(self, attacker_nid: str, defender_nid: str, seed: int, skip: bool) -> tuple:
+        from app.engine import action
+        from app.engine.combat import interaction
+        from app.utilities import static_random
+
+        game = self.runner.start_level('0')
+        self.assertTrue(self.runner.run_until(game, 'free'))
+        attacker = game.get_unit(attacker_nid)
+        defender = game.get_unit(defender_nid)
+        x, y = defender.position
+        action.do(action.Teleport(attacker, (x - 1, y)))
+        static_random.set_combat_random_state(seed)
+
+        interaction.start_combat(attacker, defender.position, attacker.get_weapon(),
+                                 skip=skip, event_combat=True)
+        self.assertEqual('SimpleCombat' if skip else 'MapCombat', game.combat_instance[-1].__class__.__name__)
+        self.runner.step(game)  # Switch to the combat state
+        self.assertTrue(self.runner.run_until(game, 'free'))
+        return ([(unit.nid, unit.get_hp(), unit.exp, unit.dead) for unit in game.units],
+                [item.data.get('uses') for item in game.item_registry.values()],
+                static_random.get_combat_random_state(),
+                static_random.r.growth_random.state)
+
+    def test_randomized_combats(self):
+        rng = random.Random(0)
+        pairs = [('Eirika', '101'), ('Seth', '102'), ('101', 'Eirika'), ("O'Neill", 'Seth')]
+        for _ in range(6):
+            attacker_nid, defender_nid = rng.choice(pairs)
+            seed = rng.randint(0, 2**16)
+            with self.subTest(attacker=attacker_nid, defender=defender_nid, seed=seed):
+                displayed = self.run_combat(attacker_nid, defender_nid, seed, skip=False)
+                resolved = self.run_combat(attacker_nid, defender_nid, seed, skip=True)
+                self.assertEqual(displayed, resolved)
+
+if __name__ == '__main__':
+    unittest.main()
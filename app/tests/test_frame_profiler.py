@@ -0,0 +1,62 @@
+import json
+import os
+import tempfile
+import unittest
+
+from app.engine import frame_profiler
+
+class FrameProfilerTests(unittest.TestCase):
+    def setUp(self):
+        frame_profiler.set_enabled(True)
+
+    def tearDown(self):
+        frame_profiler.set_enabled(False)
+
+    def test_scopes_and_trace(self):
+        @frame_profiler.timed('pathfinding')
+        def find():
+            return 3
+
+        for _ in range(10):
+            frame_profiler.begin_frame()
+            with frame_profiler.scope('state_update'):
+                self.assertEqual(3, find())
+            frame_profiler.end_frame()
+
+        stats = {name: (p50, p95, worst) for name, p50, p95, worst in frame_profiler.PROFILER.get_stats()}
+        self.assertEqual({'frame', 'pathfinding', 'state_update'}, set(stats))
+        for p50, p95, worst in stats.values():
+            self.assertTrue(0 <= p50 <= p95 <= worst)
+        self.assertEqual(10, len(frame_profiler.PROFILER.scope_times['pathfinding']))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fn = os.path.join(tmpdir, 'trace.json')
+            frame_profiler.PROFILER.export_chrome_trace(fn)
+            with open(fn) as fp:
+                trace = json.load(fp)
+        self.assertEqual(30, len(trace['traceEvents']))
+
+    def test_counters(self):
+        for updates in range(3):
+            frame_profiler.begin_frame()
+            frame_profiler.count('roam_ai far', updates=updates, deferred=1)
+            frame_profiler.end_frame()
+        self.assertEqual([('roam_ai far', {'updates': 2, 'deferred': 1})], frame_profiler.PROFILER.get_counters())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fn = os.path.join(tmpdir, 'trace.json')
+            frame_profiler.PROFILER.export_chrome_trace(fn)
+            with open(fn) as fp:
+                trace = json.load(fp)
+        counters = [event for event in trace['traceEvents'] if event['ph'] == 'C']
+        self.assertEqual([0, 1, 2], [event['args']['updates'] for event in counters])
+
+    def test_disabled(self):
+        frame_profiler.set_enabled(False)
+        frame_profiler.begin_frame()
+        with frame_profiler.scope('state_update'):
+            pass
+        frame_profiler.count('roam_ai far', updates=1)
+        frame_profiler.end_frame()
+        self.assertEqual([], frame_profiler.PROFILER.get_stats()[1:])
+        self.assertEqual([], frame_profiler.PROFILER.get_counters())
@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.engine import frame_profiler
+from app.engine.roam import free_roam_ai
+
+class FreeRoamAIHandlerTests(unittest.TestCase):
+    def setUp(self):
+        self.units = []
+        self.game = MagicMock()
+        self.game.get_all_units.return_value = self.units
+        self.game.camera.get_xy.return_value = (0, 0)
+        self.patch = patch.object(free_roam_ai, 'game', new=self.game)
+        self.patch.start()
+        # Mocks are slow enough to run out of the real budget
+        self.budget_patch = patch.object(free_roam_ai, 'FRAME_BUDGET', 1000)
+        self.budget_patch.start()
+        self.handler = free_roam_ai.FreeRoamAIHandler()
+
+    def tearDown(self):
+        self.budget_patch.stop()
+        self.patch.stop()
+
+    def add_unit(self, nid, position):
+        unit = MagicMock()
+        unit.nid = nid
+        unit.position = position
+        roam_ai = MagicMock()
+        roam_ai.unit = unit
+        self.handler.roam_ais[nid] = roam_ai
+        self.handler.components[nid] = MagicMock()
+        self.handler.next_update[nid] = self.handler.frame + 1 + len(self.units) % free_roam_ai.TIER_INTERVALS['far']
+        self.units.append(unit)
+        return roam_ai
+
+    def test_far_units_updated_less_often(self):
+        near = self.add_unit('near', (3, 3))
+        far = [self.add_unit('far%d' % idx, (100, 100)) for idx in range(8)]
+        self.assertEqual(self.handler.get_tier(near.unit), 'near')
+        self.assertEqual(self.handler.get_tier(far[0].unit), 'far')
+
+        for _ in range(8):
+            self.handler.update()
+            self.assertEqual(self.handler.tier_stats['near'].updates, 1)
+            # Staggered, so only some of the far units update each frame
+            self.assertEqual(self.handler.tier_stats['far'].updates, 2)
+        self.assertEqual(near.act.call_count, 8)
+        for roam_ai in far:
+            self.assertEqual(roam_ai.act.call_count, 2)
+
+    def test_budget_defers_far_units(self):
+        near = self.add_unit('near', (3, 3))
+        far = [self.add_unit('far%d' % idx, (100, 100)) for idx in range(3)]
+        self.handler.next_update = {nid: 0 for nid in self.handler.next_update}
+        with patch.object(free_roam_ai, 'FRAME_BUDGET', 0):
+            self.handler.update()
+        self.assertEqual(near.act.call_count, 1)
+        # The most overdue far unit still gets its turn
+        self.assertEqual(self.handler.tier_stats['far'].updates, 1)
+        self.assertEqual(self.handler.tier_stats['far'].deferred, 2)
+        self.assertEqual(far[0].act.call_count, 1)
+
+        # Deferred units are first in line next frame
+        far[2].unit.position = (4, 4)
+        self.add_unit('late', (100, 100))
+        self.handler.next_update['late'] = self.handler.frame + 2
+        self.handler.update()
+        self.assertEqual(self.handler.tier_stats['near'].updates, 2)
+        self.assertEqual(self.handler.tier_stats['far'].updates, 1)
+        for roam_ai in far:
+            self.assertEqual(roam_ai.act.call_count, 1)
+        self.assertEqual(self.handler.roam_ais['late'].act.call_count, 0)
+
+    def test_budget_exhausted_by_near_units(self):
+        near = [self.add_unit('near%d' % idx, (3, 3)) for idx in range(4)]
+        far = [self.add_unit('far%d' % idx, (100, 100)) for idx in range(3)]
+        self.handler.next_update = {nid: 0 for nid in self.handler.next_update}
+        with patch.object(free_roam_ai, 'FRAME_BUDGET', 0):
+            # Far units still get through, one a frame, while the budget is gone
+            for frame in range(3):
+                self.handler.update()
+                self.assertEqual(self.handler.tier_stats['near'].updates, 4)
+                self.assertEqual(self.handler.tier_stats['far'].updates, 1)
+        for roam_ai in near:
+            self.assertEqual(roam_ai.act.call_count, 3)
+        for roam_ai in far:
+            self.assertEqual(roam_ai.act.call_count, 1)
+
+    def test_tier_stats_reported(self):
+        self.add_unit('near', (3, 3))
+        self.add_unit('far', (100, 100))
+        self.handler.next_update = {nid: 0 for nid in self.handler.next_update}
+        frame_profiler.set_enabled(True)
+        try:
+            self.handler.update()
+            counters = dict(frame_profiler.PROFILER.get_counters())
+        finally:
+            frame_profiler.set_enabled(False)
+        self.assertEqual(counters['roam_ai near']['updates'], 1)
+        self.assertEqual(counters['roam_ai far']['updates'], 1)
+        self.assertEqual(counters['roam_ai far']['deferred'], 0)
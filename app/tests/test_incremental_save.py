@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from app.utilities import serialization
+
+class IncrementalSaveTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_json_if_changed(self):
+        path = self.dir / 'a.json'
+        self.assertTrue(serialization.save_json_if_changed(path, {'nid': 'a'}))
+        self.assertFalse(serialization.save_json_if_changed(path, {'nid': 'a'}))
+        self.assertEqual(serialization.load_json(path), {'nid': 'a'})
+        self.assertTrue(serialization.save_json_if_changed(path, {'nid': 'b'}))
+        self.assertEqual(serialization.load_json(path), {'nid': 'b'})
+
+        # Files written some other way are compared by their contents
+        other = self.dir / 'b.json'
+        serialization.save_json(other, [1, 2])
+        self.assertFalse(serialization.save_json_if_changed(other, [1, 2]))
+        # Edited behind our back
+        serialization.save_json(path, {'nid': 'c'})
+        os.utime(path, ns=(0, 0))
+        self.assertTrue(serialization.save_json_if_changed(path, {'nid': 'b'}))
+        self.assertEqual(serialization.load_json(path), {'nid': 'b'})
+
+    def test_remove_other_files(self):
+        for name in ('a.json', 'b.json', '.orderkeys'):
+            (self.dir / name).write_text('[]')
+        (self.dir / 'sub').mkdir()
+        serialization.remove_other_files(self.dir, ['a.json', '.orderkeys'])
+        self.assertEqual(sorted(os.listdir(self.dir)), ['.orderkeys', 'a.json'])
+
+    def test_autosave_copies_changed_files(self):
+        from app.data.resources.resources import Resources
+        proj_dir = self.dir / 'proj'
+        autosave_dir = self.dir / 'autosave'
+        (proj_dir / 'resources' / 'icons16').mkdir(parents=True)
+        first = proj_dir / 'resources' / 'icons16' / 'a.png'
+        second = proj_dir / 'resources' / 'b.json'
+        first.write_bytes(b'first')
+        second.write_bytes(b'second')
+
+        copy = MagicMock(side_effect=shutil.copy)
+        with patch('app.data.resources.resources.shutil.copy', new=copy):
+            Resources.autosave(None, str(proj_dir), str(autosave_dir))
+            self.assertEqual(copy.call_count, 2)
+            self.assertEqual((autosave_dir / 'resources' / 'icons16' / 'a.png').read_bytes(), b'first')
+
+            copy.reset_mock()
+            Resources.autosave(None, str(proj_dir), str(autosave_dir))
+            copy.assert_not_called()
+
+            second.write_bytes(b'changed')
+            (autosave_dir / 'resources' / 'icons16' / 'a.png').unlink()
+            progress = MagicMock()
+            Resources.autosave(None, str(proj_dir), str(autosave_dir), progress)
+            self.assertEqual(copy.call_count, 2)
+            self.assertEqual((autosave_dir / 'resources' / 'b.json').read_bytes(), b'changed')
+            progress.setValue.assert_called_with(75)
@@ -8,6 +8,7 @@ from app.engine.codegen import source_generator
 from app.engine.item_components.base_components import ItemTag, Spell, Weapon
 from app.engine.item_components.advanced_components import MultiTarget
 from app.engine.item_components.exp_components import Wexp
+from app.engine.item_components.target_components import MaximumRange
 from app.engine.item_components.weapon_components import Damage, Hit, Crit
 from app.engine.item_components.extra_components import CustomTriangleMultiplier
 from app.engine.objects.item import ItemObject
@@ -52,6 +53,8 @@ class ItemSkillComponentTests(unittest.TestCase):
         mock_skill.components = components
         mock_unit = MagicMock()
         mock_unit.skills = [mock_skill]
+        mock_unit._skill_hook_index = {}
+        mock_unit._skill_hook_version = -1
         mock_unit.ai = 'Pursue'
         mock_unit.team = 'player'
         self.assertEqual(expected_result, call_hook(mock_unit))
@@ -114,6 +117,30 @@ class ItemSkillComponentTests(unittest.TestCase):
         self._test_skill_hook_with_components([mock_component_1, mock_component_2], lambda unit: skill_system.modify_damage(unit, mock_item), 3)
         self._test_skill_hook_with_components([mock_component_2, mock_component_1], lambda unit: skill_system.modify_damage(unit, mock_item), 3)
 
+    def test_skill_hook_index(self):
+        from app.engine import skill_system
+        mock_item = MagicMock()
+        mock_skill = MagicMock()
+        mock_skill.components = [DynamicDamage("1"), Vantage()]
+        mock_unit = MagicMock()
+        mock_unit.skills = [mock_skill]
+        mock_unit._skill_hook_index = {}
+        mock_unit._skill_hook_version = -1
+        call_hook = lambda: skill_system.dynamic_damage(mock_unit, mock_item, mock_unit, mock_item, 'attack', (0, 0), 1)
+        self.assertEqual(1, call_hook())
+        self.assertEqual([(mock_skill, mock_skill.components[0])], mock_unit._skill_hook_index['dynamic_damage'])
+        self.assertTrue(skill_system.vantage(mock_unit))
+
+        # Index is only rebuilt once it is cleared
+        mock_skill.components.append(DynamicDamage("2"))
+        self.assertEqual(1, call_hook())
+        skill_system.reset_hook_index()
+        self.assertEqual(3, call_hook())
+        mock_unit.skills = []
+        mock_unit._skill_hook_index.clear()
+        self.assertEqual(0, call_hook())
+        self.assertFalse(skill_system.vantage(mock_unit))
+
     def test_skill_hooks_accumulate(self):
         from app.engine import skill_system
         mock_item = MagicMock()
@@ -254,6 +281,7 @@ class ItemSkillComponentTests(unittest.TestCase):
     def _test_item_hook_with_components(self, components: List[ItemComponent], call_hook: Callable[[], Any], expected_result: Any):
         mock_item = MagicMock()
         mock_item.components = components
+        mock_item._hook_index = {}
         mock_unit = MagicMock()
         self.assertEqual(expected_result, call_hook(mock_unit, mock_item))
 
@@ -317,7 +345,9 @@ class ItemSkillComponentTests(unittest.TestCase):
         mock_component_2.start_combat = MagicMock(return_value=None)
         mock_component_2.battle_music = MagicMock(return_value=None)
         mock_item.components = [mock_component_1]
+        mock_item._hook_index = {}
         mock_parent.components = [mock_component_2]
+        mock_parent._hook_index = {}
         mock_item.parent_item = mock_parent
         self.assertEqual(None, item_system.on_end_chapter(mock_arg, mock_item))
         self.assertEqual(None, item_system.on_upkeep(mock_arg, mock_arg, mock_arg, mock_item))
@@ -332,6 +362,21 @@ class ItemSkillComponentTests(unittest.TestCase):
         self.assertTrue(mock_component_1.battle_music.called)
         self.assertFalse(mock_component_2.battle_music.called)
 
+    def test_item_hook_index(self):
+        from app.engine import action, item_system
+        item = ItemObject("test", "Test", "Test", None, (0, 0), Data([Weapon(), MaximumRange(2)]))
+        self.assertTrue(item_system.is_weapon(None, item))
+        self.assertEqual(2, item_system.maximum_range(None, item))
+        self.assertEqual([item.components.get('max_range')], item._hook_index['maximum_range'])
+
+        # Removing a component rebuilds the index and clears the memoized results
+        remove_range = action.RemoveItemComponent(item, 'max_range')
+        remove_range.do()
+        self.assertNotIn('maximum_range', item._hook_index)
+        self.assertEqual(0, item_system.maximum_range(None, item))
+        remove_range.reverse()
+        self.assertEqual(2, item_system.maximum_range(None, item))
+
     @patch('app.engine.skill_system')
     def test_item_override(self, test_patch):
         from app.engine import item_system
@@ -339,6 +384,7 @@ class ItemSkillComponentTests(unittest.TestCase):
         test_patch.item_override = MagicMock(return_value = [Damage(4), Hit(90), CustomTriangleMultiplier(2)])
         mock_item = MagicMock()
         mock_item.components = [Damage(10), Crit(25), CustomTriangleMultiplier(2)]
+        mock_item._hook_index = {}
         self.assertEqual(4, item_system.damage(mock_unit, mock_item))
         self.assertEqual(90, item_system.hit(mock_unit, mock_item))
         self.assertEqual(25, item_system.crit(mock_unit, mock_item))
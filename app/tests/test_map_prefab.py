@@ -0,0 +1,103 @@
+import random
+import unittest
+
+from app.map_maker import map_prefab
+from app.map_maker.map_prefab import MapPrefab
+from app.map_maker.utilities import diff_drawn_tiles, flood_fill
+
+class FakeTerrain():
+    def __init__(self, nid, check_flood_fill=False):
+        self.nid = nid
+        self.check_flood_fill = check_flood_fill
+
+    def has_autotiles(self):
+        return False
+
+class MapPrefabTests(unittest.TestCase):
+    def setUp(self):
+        self.terrains = [FakeTerrain('Sea', True), FakeTerrain('Cliff', 'diagonal'), FakeTerrain('Plains')]
+        self.tilemap = MapPrefab('test')
+        self.tilemap.width, self.tilemap.height = 8, 6
+
+    def expected_mask(self, pos, terrain_like):
+        mask = 0
+        for bit, (dx, dy) in map_prefab.EDGE_OFFSETS:
+            nid = self.tilemap.get_terrain((pos[0] + dx, pos[1] + dy))
+            if not nid or nid in terrain_like:
+                mask |= bit
+        return mask
+
+    def test_indexes_match_full_search(self):
+        tilemap = self.tilemap
+        rng = random.Random(3)
+        positions = [(x, y) for x in range(tilemap.width) for y in range(tilemap.height)]
+        for pos in positions:
+            tilemap.set(pos, None, rng.choice(self.terrains))
+        for _ in range(300):
+            pos = rng.choice(positions)
+            old_terrain = next((t for t in self.terrains if t.nid == tilemap.get_terrain(pos)), None)
+            if rng.random() < 0.2:
+                tilemap.erase_terrain(pos, old_terrain)
+            else:
+                tilemap.set(pos, old_terrain, rng.choice(self.terrains))
+            tilemap.terrain_grid_to_update.clear()
+
+            for check in rng.sample(positions, 6):
+                for diagonal in (False, True):
+                    self.assertEqual(tilemap.get_blob(check, diagonal), flood_fill(tilemap, check, diagonal))
+                for terrain_like in (('Sea', 'Cliff'), ('Cliff',), ()):
+                    self.assertEqual(tilemap.get_edge_mask(check, terrain_like), self.expected_mask(check, terrain_like))
+
+    def test_set_updates_whole_blob(self):
+        tilemap = self.tilemap
+        sea, _, plains = self.terrains
+        for x in range(4):
+            tilemap.set((x, 0), None, sea)
+        tilemap.terrain_grid_to_update.clear()
+        tilemap.set((4, 0), None, sea)
+        self.assertTrue({(x, 0) for x in range(5)} <= tilemap.terrain_grid_to_update)
+
+        # Splits the sea in two
+        tilemap.terrain_grid_to_update.clear()
+        tilemap.set((2, 0), sea, plains)
+        self.assertEqual(tilemap.get_blob((0, 0)), {(0, 0), (1, 0)})
+        self.assertEqual(tilemap.get_blob((4, 0)), {(3, 0), (4, 0)})
+
+        tilemap.resize(3, 2, 0, 0)
+        self.assertEqual(tilemap.get_blob((0, 0)), {(0, 0), (1, 0)})
+        self.assertEqual(tilemap.get_edge_mask((1, 0), ('Sea',)), 0xFF & ~map_prefab.EAST)
+
+class DiffDrawnTilesTests(unittest.TestCase):
+    def test_diff_drawn_tiles(self):
+        # Sprites are compared by identity, so plain objects stand in for pixmaps
+        grass, water1, water2 = object(), object(), object()
+        tile_grid = {(0, 0): grass, (1, 0): grass, (2, 0): water1}
+        autotile_set = {(2, 0)}
+        base_drawn, layer_drawn = {}, {}
+        self.assertEqual(sorted(diff_drawn_tiles(base_drawn, tile_grid, autotile_set, False)),
+                         [((0, 0), grass), ((1, 0), grass)])
+        self.assertEqual(diff_drawn_tiles(layer_drawn, tile_grid, autotile_set, True), [((2, 0), water1)])
+        # Nothing has changed
+        self.assertEqual(diff_drawn_tiles(base_drawn, tile_grid, autotile_set, False), [])
+        self.assertEqual(diff_drawn_tiles(layer_drawn, tile_grid, autotile_set, True), [])
+
+        # A new sprite in the same place, and one that is invalidated
+        tile_grid[(2, 0)] = water2
+        self.assertEqual(diff_drawn_tiles(layer_drawn, tile_grid, autotile_set, True), [((2, 0), water2)])
+        layer_drawn[(2, 0)] = None
+        self.assertEqual(diff_drawn_tiles(layer_drawn, tile_grid, autotile_set, True), [((2, 0), water2)])
+
+        # Erased tiles, and tiles moving between the base and the autotile layer
+        del tile_grid[(0, 0)]
+        tile_grid[(1, 0)] = water1
+        autotile_set = {(1, 0)}
+        self.assertEqual(sorted(diff_drawn_tiles(base_drawn, tile_grid, autotile_set, False), key=lambda x: x[0]),
+                         [((0, 0), None), ((1, 0), None), ((2, 0), water2)])
+        self.assertEqual(sorted(diff_drawn_tiles(layer_drawn, tile_grid, autotile_set, True), key=lambda x: x[0]),
+                         [((1, 0), water1), ((2, 0), None)])
+        self.assertEqual(base_drawn, {(2, 0): water2})
+        self.assertEqual(layer_drawn, {(1, 0): water1})
+
+        # No autotiles left, so the layer ends up empty
+        self.assertEqual(diff_drawn_tiles(layer_drawn, tile_grid, set(), True), [((1, 0), None)])
+        self.assertEqual(layer_drawn, {})
@@ -0,0 +1,61 @@
+import logging
+import unittest
+from unittest.mock import patch
+
+from app.engine import headless
+
+class MiniMapTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        # The minimap's sprites are loaded on import
+        headless.init()
+        self.runner = headless.HeadlessRunner('testing_proj')
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_cliff_chains(self):
+        from app.engine.minimap import CliffManager
+        horizontal = [(x, 0) for x in range(5)]
+        vertical = [(8, y) for y in range(4)]
+        diagonal = [(10, 0), (11, 1)]
+        manager = CliffManager(horizontal + vertical + diagonal, (12, 4))
+        self.assertEqual(sorted(len(chain) for chain in manager.chains), [2, 4, 5])
+        for pos in horizontal:
+            self.assertEqual(manager.get_orientation(pos), (8, 6))
+        for pos in vertical:
+            self.assertEqual(manager.get_orientation(pos), (9, 6))
+        for pos in diagonal:
+            self.assertEqual(manager.get_orientation(pos), (11, 6))
+
+    def test_terrain_cached(self):
+        from app.engine import engine, minimap
+        game = self.runner.start_level('0')
+        self.assertTrue(self.runner.run_until(game, 'free'))
+        first = minimap.MiniMap(game.tilemap, game.units)
+        with patch.object(minimap.MiniMap, 'handle_key') as handle_key:
+            second = minimap.MiniMap(game.tilemap, game.units)
+            handle_key.assert_not_called()
+        self.assertIsNot(first.surf, second.surf)
+        self.assertEqual(engine.surf_to_raw(first.surf, 'RGB'), engine.surf_to_raw(second.surf, 'RGB'))
+
+    def test_fog_runs(self):
+        from app.engine import engine, minimap
+        game = self.runner.start_level('0')
+        self.assertTrue(self.runner.run_until(game, 'free'))
+        mini = minimap.MiniMap(game.tilemap, game.units)
+        expected = engine.copy_surface(mini.surf)
+        in_vision = lambda pos: pos[0] % 3 == 0
+        terrain_known = lambda pos, is_in_vision: pos[1] % 2 == 0
+        for x in range(mini.width):
+            for y in range(mini.height):
+                if not in_vision((x, y)):
+                    mask = (x * mini.scale_factor, y * mini.scale_factor, mini.scale_factor, mini.scale_factor)
+                    if terrain_known((x, y), False):
+                        engine.fill(expected, (128, 128, 128), mask, engine.BLEND_RGB_MULT)
+                    else:
+                        engine.fill(expected, (12, 12, 12), mask)
+        with patch.object(game.board, 'in_vision', new=in_vision), \
+                patch.object(game.board, 'terrain_known', new=terrain_known):
+            mini.draw_fog()
+        self.assertEqual(engine.surf_to_raw(mini.surf, 'RGB'), engine.surf_to_raw(expected, 'RGB'))
@@ -0,0 +1,106 @@
+import logging
+import math
+import unittest
+
+from app.engine import headless
+from app.utilities.algorithms.ltgraph import LTGraph
+
+class LTGraphTests(unittest.TestCase):
+    def test_shortest_path(self):
+        graph = LTGraph()
+        for vert in 'abcde':
+            graph.add_vertex(vert)
+        graph.add_edge('a', 'c', weight=1)
+        graph.add_edge('a', 'b', weight=1)
+        graph.add_edge('b', 'd', weight=1)
+        graph.add_edge('c', 'd', weight=1)
+        # Both ways round are equally short, so the earlier added vertex is used
+        self.assertEqual(graph.shortest_path('a', 'd'), ['a', 'b', 'd'])
+        self.assertEqual(graph.shortest_path('d', 'a'), ['d', 'b', 'a'])
+        self.assertIsNone(graph.shortest_path('a', 'e'))
+        self.assertFalse(graph.has_path('e', 'a'))
+        self.assertEqual(graph.shortest_path('c', 'c'), [])
+
+        graph.add_edge('a', 'd', weight=1.5)
+        self.assertEqual(graph.shortest_path('a', 'd'), ['a', 'd'])
+        graph.add_edge('d', 'e', weight=1)
+        self.assertEqual(graph.shortest_path('e', 'c'), ['e', 'd', 'c'])
+        self.assertTrue(graph.has_path('a', 'e'))
+
+class OverworldManagerTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        headless.init()
+        runner = headless.HeadlessRunner('testing_proj')
+        runner.start_level('0')
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def make_manager(self):
+        from app.data.database.database import DB
+        from app.engine.objects.overworld.overworld import OverworldObject
+        from app.engine.overworld.overworld_manager import OverworldManager
+        overworld = OverworldObject.from_prefab(DB.overworlds.values()[0], {}, {})
+        return OverworldManager(overworld)
+
+    def test_node_lookups(self):
+        manager = self.make_manager()
+        node = list(manager.nodes.values())[3]
+        self.assertIsNone(manager.node_at(node.position))
+        self.assertIs(manager.node_at(node.position, force=True), node)
+        manager.enable_node(node)
+        self.assertIs(manager.node_at(node.position), node)
+        self.assertIs(manager.node_at(list(node.position)), node)
+        self.assertIsNone(manager.node_at((-1, -1), force=True))
+        self.assertIsNone(manager.node_at(None))
+        for node in manager.nodes.values():
+            expected = [other for other in manager.nodes.values() if other.prefab.level == node.prefab.level][0]
+            self.assertIs(manager.node_by_level(node.prefab.level), expected)
+        self.assertIsNone(manager.node_by_level('not a level'))
+
+    def test_shortest_path(self):
+        manager = self.make_manager()
+        nids = list(manager.nodes)
+        for nid in nids:
+            manager.enable_node(nid)
+        self.assertEqual(manager.shortest_path(nids[0], nids[1]), [])
+        for road_nid in manager.roads:
+            manager.enable_road(road_nid)
+
+        # Floyd-Warshall for reference
+        graph = manager.overworld_explored_graph
+        dist = {(n1, n2): (0 if n1 == n2 else math.inf) for n1 in nids for n2 in nids}
+        for n1 in nids:
+            for n2 in graph.adj[n1]:
+                dist[n1, n2] = graph[n1][n2].weight
+        for k in nids:
+            for n1 in nids:
+                for n2 in nids:
+                    dist[n1, n2] = min(dist[n1, n2], dist[n1, k] + dist[k, n2])
+
+        for n1 in nids:
+            for n2 in nids:
+                roads = manager.shortest_path(n1, n2, neighbor_priority=False)
+                if n1 == n2 or dist[n1, n2] == math.inf:
+                    self.assertEqual(roads, [])
+                    continue
+                self.assertAlmostEqual(sum(road.tile_length for road in roads), dist[n1, n2])
+                # The roads join up from n1 to n2
+                pos = manager.nodes[n1].position
+                for road in roads:
+                    self.assertIn(pos, (road.prefab[0], road.prefab[-1]))
+                    pos = road.prefab[-1] if road.prefab[0] == pos else road.prefab[0]
+                self.assertEqual(pos, manager.nodes[n2].position)
+
+        # Callers get their own list
+        n1, n2 = nids[0], next(iter(graph.adj[nids[0]]))
+        roads = manager.shortest_path(n1, n2)
+        self.assertEqual(len(roads), 1)
+        roads.pop()
+        self.assertEqual(len(manager.shortest_path(n1, n2)), 1)
+        # Routes are forgotten when the explored graph changes
+        manager._overworld.enabled_roads.clear()
+        manager.regenerate_explored_graph()
+        self.assertEqual(manager.shortest_path(n1, n2), [])
+        self.assertEqual(len(manager.shortest_path(n1, n2, force=True)), 1)
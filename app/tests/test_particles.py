@@ -0,0 +1,34 @@
+import logging
+import random
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+class ParticleTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_array_system_matches_objects(self):
+        from app.engine import particles
+        from app.engine.game_state import GameState
+
+        tilemap = SimpleNamespace(width=20, height=15)
+        with patch.object(GameState, 'tilemap', property(lambda self: tilemap)):
+            for particle, bounds in ((particles.Raindrop, (-60, 320, -16, -8)),
+                                     (particles.Sand, (-480, 320, 256, 272)),
+                                     (particles.Snow, (-240, 320, -16, -8))):
+                with self.subTest(particle=particle.__name__):
+                    random.seed(0)
+                    old = particles.MapParticleSystem('test', particle, .1, bounds, (20, 15))
+                    old.prefill()
+                    random.seed(0)
+                    new = particles.ArrayParticleSystem('test', particle, .1, bounds, (20, 15))
+                    new.prefill()
+                    self.assertEqual([(p.x, p.y) for p in old.particles], list(zip(new.xs, new.ys)))
+                    self.assertEqual([p.sprite for p in old.particles], new.sprites)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -30,6 +30,7 @@ class PathSystemTests(unittest.TestCase):
         self.game.board = GameBoard(tilemap)
         self.game.board.bounds = (0, 0, 28, 28)
         self.game.units = []
+        self.game.units_on_map = ()
 
         self.player_unit = UnitObject('player')
         self.player_unit.klass = 'Citizen'
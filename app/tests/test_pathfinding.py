@@ -2,6 +2,7 @@ import unittest
 
 from app.utilities.grid import BoundedGrid
 from app.engine.pathfinding import node, pathfinding
+from app.engine.pathfinding.flow_field import FlowField
 
 class PathfindingTests(unittest.TestCase):
     """
@@ -114,5 +115,34 @@ x   x   x   x   x   x   x   x   x
         self.assertEqual(path[-1], (1, 7), 'Did not start at the beginning')
         self.assertEqual(len(path), 5, f'Longer path than necessary {path}')
 
+    def test_flow_field(self):
+        # Test the simple grid
+        flow_field = FlowField((1, 1), self.simple_grid)
+        self.assertEqual(flow_field.get_path((5, 5)), [(1, 1), (5, 5)])
+        self.assertEqual(flow_field.get_path((1, 1)), [(1, 1)])
+        self.assertEqual(flow_field.get_path((0, 0)), [], 'Ignored bounds')
+        self.assertIn(flow_field.get_next_step((5, 5)), ((4, 5), (5, 4)))
+
+        # Test the complex grid
+        flow_field = FlowField((7, 7), self.complex_grid)
+        path = flow_field.get_path((1, 7))
+        self.assertEqual(path[0], (7, 7), 'Did not find the end')
+        self.assertEqual(path[-1], (1, 7), 'Did not start at the beginning')
+        self.assertEqual(len(path), 5, f'Longer path than necessary {path}')
+
+        # Every distance matches the cost of the path AStar finds
+        can_move_through = lambda x: True
+        for x in range(1, 9):
+            for y in range(3, 11):
+                if (x, y) == (7, 7):
+                    continue
+                path = pathfinding.AStar((x, y), (7, 7), self.complex_grid).process(can_move_through)
+                cost = sum(self.complex_grid.get(pos).cost for pos in path[:-1])
+                self.assertEqual(flow_field.get_distance((x, y)), cost, f'Wrong distance from {(x, y)}')
+
+        # Can't get to a wall
+        flow_field = FlowField((3, 3), self.complex_grid)
+        self.assertEqual(flow_field.get_path((1, 3)), [])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,109 @@
+import logging
+import unittest
+
+from app.engine import headless
+
+class RoamMoveTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.runner = headless.HeadlessRunner('testing_proj')
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def boundary_grids(self, game):
+        game.boundary._recalculate_stale_units()
+        return {mode: [set(cell) for cell in grid] for mode, grid in game.boundary.grids.items()}
+
+    def test_roam_move_matches_leave_and_arrive(self):
+        from app.engine import skill_system
+        from app.engine.movement import movement_funcs
+        game = self.runner.start_level('0')
+        self.assertTrue(self.runner.run_until(game, 'free'))
+        unit = game.get_unit('Eirika')
+        log_length = len(game.action_log.actions)
+
+        path = []
+        for _ in range(6):
+            x, y = unit.position
+            for pos in ((x + 1, y), (x, y + 1), (x - 1, y), (x, y - 1)):
+                if pos not in path and game.board.check_bounds(pos) and not game.board.get_unit(pos) and \
+                        movement_funcs.check_traversable(unit, pos):
+                    break
+            path.append(unit.position)
+            game.roam_move(unit, pos)
+
+            self.assertEqual(unit.position, pos)
+            self.assertIs(game.board.get_unit(pos), unit)
+            self.assertIsNone(game.board.get_unit(path[-1]))
+            self.assertIn(unit, game.units_on_map)
+
+            # Fog of war vision moved along with the unit
+            sight_range = skill_system.sight_range(unit) + game.board.get_fog_of_war_radius(unit.team)
+            grid = game.board.fog_of_war_grids[unit.team]
+            seen = {(x, y) for x in range(game.board.width) for y in range(game.board.height)
+                    if unit.nid in grid.get((x, y))}
+            expected = {(x, y) for x in range(game.board.width) for y in range(game.board.height)
+                        if abs(x - pos[0]) + abs(y - pos[1]) <= sight_range}
+            self.assertEqual(seen, expected)
+
+            # Once brought up to date, enemy ranges match a full recalculation
+            grids = self.boundary_grids(game)
+            game.boundary.reset()
+            self.assertEqual(grids, self.boundary_grids(game))
+
+        self.assertEqual(len(game.action_log.actions), log_length)
+
+    def test_roam_move_matches_with_auras_and_regions(self):
+        from app.engine import action
+        from app.engine.movement import movement_funcs
+        from app.engine.objects.region import RegionObject
+        from app.events.regions import RegionType
+        game = self.runner.start_level('0')
+        self.assertTrue(self.runner.run_until(game, 'free'))
+        unit = game.get_unit('Eirika')
+        seth = game.get_unit('Seth')
+        for carrier in (unit, seth):
+            action.do(action.AddSkill(carrier, 'Inspiration'))
+
+        # Walk away from Seth until well out of aura range
+        path = [unit.position]
+        while len(path) < 8:
+            x, y = path[-1]
+            for pos in ((x + 1, y), (x, y + 1), (x, y - 1), (x - 1, y)):
+                if pos not in path and game.board.check_bounds(pos) and not game.board.get_unit(pos) and \
+                        movement_funcs.check_traversable(unit, pos):
+                    break
+            path.append(pos)
+        self.assertGreater(abs(path[-1][0] - seth.position[0]) + abs(path[-1][1] - seth.position[1]), 3)
+        # A status region that is stepped onto and then off of
+        region = RegionObject('roam_test', RegionType.STATUS, path[2], (1, 1), 'Strength_Plus2')
+        action.do(action.AddRegion(region))
+
+        def leave_and_arrive(pos):
+            action.QuickLeave(unit).do()
+            action.QuickArrive(unit, pos).do()
+            action.UpdateFogOfWar(unit).do()
+
+        def get_state():
+            skills = {u.nid: sorted(skill.nid for skill in u.all_skills) for u in (unit, seth)}
+            auras = {(x, y): set(game.board.get_auras((x, y)))
+                     for x in range(game.board.width) for y in range(game.board.height)}
+            return skills, auras
+
+        # There and back again, to both leave and enter the aura and region
+        path += path[-2::-1]
+        seen_region, seen_aura = False, False
+        for old_pos, pos in zip(path, path[1:]):
+            leave_and_arrive(pos)
+            expected = get_state()
+            leave_and_arrive(old_pos)
+            game.roam_move(unit, pos)
+            self.assertEqual(get_state(), expected)
+            seen_region |= 'Strength_Plus2' in expected[0]['Eirika']
+            seen_aura |= 'Inspiration_child' in expected[0]['Eirika']
+        self.assertTrue(seen_region)
+        self.assertTrue(seen_aura)
+        # Back next to Seth
+        self.assertIn('Inspiration_child', get_state()[0]['Eirika'])
+        self.assertNotIn('Strength_Plus2', get_state()[0]['Eirika'])
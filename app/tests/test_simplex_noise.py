@@ -0,0 +1,29 @@
+import unittest
+
+from app.map_maker import simplex_noise
+
+class SimplexNoiseTests(unittest.TestCase):
+    def test_batch_matches_single(self):
+        positions = [(x * 0.37, y * 0.61) for x in range(-20, 20) for y in range(-20, 20)]
+        positions += [(1e4 + 0.5, -3e3 - 0.25), (0, 0)]
+        xs = [x for x, y in positions]
+        ys = [y for x, y in positions]
+        for seed in (0, 47, -5):
+            expected = [simplex_noise.get(x, y, seed) for x, y in positions]
+            self.assertEqual(simplex_noise.get_batch(xs, ys, seed), expected)
+
+    def test_noise_maps_unchanged(self):
+        size = (12, 9)
+        settings = dict(starting_frequency=0.05, lacunarity=2.1, octaves=5, gain=0.6)
+        noise_map = simplex_noise.gen_noise_map(size, 3, **settings)
+        self.assertEqual(list(noise_map), [(x, y) for x in range(12) for y in range(9)])
+        for (x, y), val in noise_map.items():
+            self.assertEqual(val, simplex_noise.get_full_noise(x, y, 3, **settings))
+
+        noise_map1, noise_map2, noise_map3 = simplex_noise.gen_double_noise_map(size, 3, **settings)
+        self.assertEqual(noise_map1, noise_map)
+        for (x, y), val in noise_map3.items():
+            val1 = simplex_noise.get_full_noise(x, y, 3, **settings)
+            val2 = simplex_noise.get_full_noise(x + 5.2*12, y + 1.3*9, 3, **settings)
+            self.assertEqual(noise_map2[(x, y)], val2)
+            self.assertEqual(val, simplex_noise.get_full_noise(x + 4 * 12 * val1, y + 4 * 9 * val2, 3, **settings))
@@ -0,0 +1,47 @@
+import logging
+import unittest
+from unittest.mock import patch
+
+from app.engine import headless
+
+class MusicDictTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        headless.init()
+        from app.data.resources.resources import RESOURCES
+        from app.data.resources.sounds import SongPrefab
+        path = RESOURCES.music.get('Distant Roads').full_path
+        # Several songs that all happen to use the same file
+        self.prefabs = {nid: SongPrefab(nid, path) for nid in ('a', 'b', 'c')}
+        self.patch = patch.object(RESOURCES.music, 'get', new=self.prefabs.get)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        logging.disable(logging.NOTSET)
+
+    def test_least_recently_used_songs_unloaded(self):
+        from app.engine import sound
+        music = sound.MusicDict()
+        song_size = music.get('a').size
+        self.assertGreater(song_size, 0)
+        self.assertEqual(music.total_size, song_size)
+        with patch.object(sound, 'MUSIC_CACHE_LIMIT', 2 * song_size):
+            music.get('b')
+            music.get('a')  # Now b is least recently used
+            music.get('c')
+            self.assertEqual(list(music.keys()), ['a', 'c'])
+            self.assertEqual(music.total_size, 2 * song_size)
+
+            # Songs on a channel are never unloaded
+            music.get('a').channel = object()
+            music.get('c')
+            music.get('b')
+            self.assertEqual(list(music.keys()), ['a', 'b'])
+
+        self.assertIsNone(music.get('missing'))
+        music.clear('a')
+        self.assertEqual(list(music.keys()), ['a'])
+        self.assertEqual(music.total_size, song_size)
+        music.clear()
+        self.assertEqual(music.total_size, 0)
@@ -0,0 +1,48 @@
+import logging
+import unittest
+from unittest.mock import patch
+
+from app.engine import headless
+
+class StatBonusTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.runner = headless.HeadlessRunner('testing_proj')
+        self.game = self.runner.start_level('0')
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_memoized_stat_bonus(self):
+        from app.engine import action
+        unit = self.game.get_unit('Eirika')
+        self.assertEqual(unit.stat_bonus('STR'), unit._calculate_stat_bonus('STR'))
+        base = unit.stat_bonus('STR')
+        self.assertIn('STR', unit._stat_bonus_cache)
+
+        add_skill = action.AddSkill(unit, 'Ravager')
+        action.do(add_skill)
+        self.assertEqual(unit.stat_bonus('STR'), base + 15)
+        add_skill.reverse()
+        self.assertEqual(unit.stat_bonus('STR'), base)
+
+        # Equipping outside of an action still throws away the memo
+        unit.stat_bonus('STR')
+        weapon = unit.equipped_weapon
+        unit.unequip(weapon)
+        self.assertEqual(unit._stat_bonus_cache, {})
+        unit.equip(weapon)
+
+    def test_check_stat_bonus_cache(self):
+        from app.engine.objects import unit as unit_module
+        unit = self.game.get_unit('Eirika')
+        actual = unit.stat_bonus('SKL')
+        unit._stat_bonus_cache['SKL'] = actual + 7  # Stale
+        self.assertEqual(unit.stat_bonus('SKL'), actual + 7)
+        with patch.object(unit_module, 'CHECK_STAT_BONUS_CACHE', True):
+            with self.assertLogs(level='ERROR'):
+                logging.disable(logging.NOTSET)
+                self.assertEqual(unit.stat_bonus('SKL'), actual)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from app.utilities import static_random
+from app.utilities.static_random import LCG
+
+class StaticRandomTests(unittest.TestCase):
+    def setUp(self):
+        self.seed = static_random.get_seed()
+        self.state = static_random.get_combat_random_state()
+
+    def tearDown(self):
+        static_random.set_seed(self.seed)
+        static_random.set_combat_random_state(self.state)
+
+    def test_jump(self):
+        for steps in (0, 1, 2, 7, 100, 12345):
+            stepped = LCG(17)
+            for _ in range(steps):
+                stepped._random()
+            jumped = LCG(17)
+            jumped.jump(steps)
+            self.assertEqual(jumped.state, stepped.state)
+            # And back again
+            jumped.jump(-steps)
+            self.assertEqual(jumped.state, 17)
+        jumped.jump(static_random.PERIOD)
+        self.assertEqual(jumped.state, 17)
+
+    def test_batched_draws(self):
+        one, batch = LCG(3), LCG(3)
+        self.assertEqual(batch.randints(0, 99, 50), [one.randint(0, 99) for _ in range(50)])
+        self.assertEqual(batch.randints(-5, 5, 10), [one.randint(-5, 5) for _ in range(10)])
+        self.assertEqual(batch.state, one.state)
+        self.assertEqual(batch.randints(0, 99, 0), [])
+
+        static_random.set_seed(4)
+        combats = [static_random.get_combat() for _ in range(5)]
+        growths = [static_random.get_growth() for _ in range(5)]
+        static_random.set_seed(4)
+        self.assertEqual(static_random.get_combats(5), combats)
+        self.assertEqual(static_random.get_growths(5), growths)
+        static_random.jump_combat(-3)
+        self.assertEqual(static_random.get_combat(), combats[2])
@@ -0,0 +1,78 @@
+import logging
+import unittest
+
+from app.engine import headless
+
+class SupportTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.runner = headless.HeadlessRunner('testing_proj')
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_pair_index(self):
+        from app.data.database.database import DB
+        game = self.runner.start_level('0')
+        supports = game.supports
+        for unit_nid in ('Eirika', 'Seth', 'Franz', 'Nobody'):
+            expected = [prefab for prefab in DB.support_pairs if unit_nid in (prefab.unit1, prefab.unit2)]
+            self.assertEqual(supports.get_prefabs(unit_nid), expected)
+            self.assertEqual([pair.nid for pair in supports.get_pairs(unit_nid)], [prefab.nid for prefab in expected])
+        self.assertIs(supports.get('Eirika', 'Seth'), supports.support_pairs['Eirika | Seth'])
+        self.assertIs(supports.get('Seth', 'Eirika'), supports.support_pairs['Eirika | Seth'])
+        self.assertIsNone(supports.get('Eirika', 'Franz'))
+        self.assertEqual(supports.get_prefabs_between('Franz', 'Seth'), [DB.support_pairs.get('Seth | Franz')])
+
+    def test_get_one_way_pairs(self):
+        from app.data.database.database import DB
+        from app.data.database.supports import SupportPair as SupportPrefab, SupportRankRequirementList
+        game = self.runner.start_level('0')
+        prefabs = [SupportPrefab('Franz', 'Eirika', True, SupportRankRequirementList()),
+                   SupportPrefab('Eirika', 'Franz', True, SupportRankRequirementList())]
+        for prefab in prefabs:
+            DB.support_pairs.append(prefab)
+        try:
+            # Only the second way round has been created so far
+            pair = game.supports.create_pair('Eirika | Franz')
+            self.assertIs(game.supports.get('Franz', 'Eirika'), pair)
+            self.assertIs(game.supports.get('Eirika', 'Franz'), pair)
+            other = game.supports.create_pair('Franz | Eirika')
+            self.assertIs(game.supports.get('Franz', 'Eirika'), other)
+            self.assertIs(game.supports.get('Eirika', 'Franz'), pair)
+            self.assertEqual(game.supports.get_prefabs_between('Eirika', 'Franz'), prefabs)
+        finally:
+            for prefab in prefabs:
+                DB.support_pairs.delete(prefab)
+
+    def test_end_turn_supports(self):
+        from app.engine import action, supports
+        game = self.runner.start_level('0')
+        self.assertTrue(self.runner.run_until(game, 'free'))
+        game.game_vars['_supports'] = True
+        eirika = game.get_unit('Eirika')
+        seth = game.get_unit('Seth')
+        self.assertEqual(game.supports.get_growth_pairs([eirika]), ['Eirika | Seth'])
+
+        log_length = len(game.action_log.actions)
+        supports.increment_team_end_turn_supports('player')
+        # All the growth this turn is a single action
+        self.assertEqual(len(game.action_log.actions), log_length + 1)
+        last_action = game.action_log.actions[-1]
+        self.assertIsInstance(last_action, action.IncrementMultipleSupportPoints)
+        pair = game.supports.get('Eirika', 'Seth')
+        self.assertEqual(pair.points, 1)
+        supports.increment_unit_end_turn_supports(seth)
+        self.assertEqual(pair.points, 2)
+        game.action_log.actions[-1].reverse()
+        last_action.reverse()
+        self.assertEqual(pair.points, 0)
+
+        # Out of growth range
+        action.QuickLeave(seth).do()
+        action.QuickArrive(seth, (eirika.position[0] + 3, eirika.position[1])).do()
+        self.assertEqual(game.supports.get_growth_pairs([eirika, seth]), [])
+        log_length = len(game.action_log.actions)
+        supports.increment_team_end_turn_supports('player')
+        self.assertEqual(len(game.action_log.actions), log_length)
+        self.assertEqual(pair.points, 0)
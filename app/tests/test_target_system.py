@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, Mock
 
+import random
 import time
 
 from app.data.serialization.versions import CURRENT_SERIALIZATION_VERSION
@@ -73,6 +74,23 @@ class TargetSystemUnitTests(unittest.TestCase):
         self.assertNotIn((4, 1), valid_positions)
         self.assertNotIn((-5, 0), valid_positions)
 
+    def test_get_shell_bitmap(self):
+        rng = random.Random(0)
+        bounds = (1, 2, 20, 15)
+        manhattan_restriction = {(x, y) for x in range(-5, 6) for y in range(-5, 6) if x == 0 or y == 0}
+        for _ in range(20):
+            valid_moves = {(rng.randint(-2, 22), rng.randint(0, 17)) for _ in range(rng.randint(1, 40))}
+            potential_range = set(rng.sample(range(0, 6), rng.randint(1, 3)))
+            for restriction in (None, manhattan_restriction):
+                expected = self.target_system._get_shell_from_sets(valid_moves, potential_range, bounds, restriction)
+                shell = self.target_system.get_shell_bitmap(valid_moves, potential_range, bounds, restriction)
+                self.assertEqual(expected, shell.to_positions())
+                self.assertEqual(len(expected), len(shell))
+                self.assertEqual(expected, self.target_system.get_shell(valid_moves, potential_range, bounds, restriction))
+                for pos in list(expected)[:5]:
+                    self.assertIn(pos, shell)
+                self.assertNotIn((0, 0), shell)
+
     def test_get_possible_attack_positions(self):
         self.player_unit.position = (0, 0)
         self.enemy_unit.position = (0, 1)
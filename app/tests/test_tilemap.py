@@ -0,0 +1,79 @@
+import logging
+import unittest
+
+from app.constants import COLORKEY, TILEHEIGHT, TILEWIDTH
+from app.engine import headless
+
+class TileMapObjectTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        headless.init()
+        from app.engine import engine
+        from app.engine.objects.tilemap import LayerObject, TileMapObject
+        from app.utilities.data import Data
+
+        self.tilemap = TileMapObject()
+        self.tilemap.width, self.tilemap.height = 4, 3
+        size = (4 * TILEWIDTH, 3 * TILEHEIGHT)
+        layers = []
+        for nid, foreground, color in (('base', False, (10, 20, 30)), ('top', False, (40, 50, 60)),
+                                       ('roof', True, (70, 80, 90))):
+            layer = LayerObject(nid, foreground, self.tilemap)
+            images = [engine.create_surface(size) for _ in range(3)]
+            for im in images:
+                engine.fill(im, COLORKEY)
+                engine.set_colorkey(im, COLORKEY)
+            # Each layer covers a different set of tiles
+            engine.fill(images[0], color, (0, 0, TILEWIDTH * (3 - len(layers)), TILEHEIGHT * 2))
+            layer.image = images[0]
+            if nid == 'top':
+                for idx, im in enumerate(images[1:]):
+                    engine.fill(im, (idx * 100, 0, 0), (TILEWIDTH * 3, 0, TILEWIDTH, TILEHEIGHT))
+                layer.autotile_images = images[1:]
+            layer.pixel_bounds = [0, 0, size[0], size[1]]
+            layers.append(layer)
+        self.tilemap.layers = Data(layers)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def assertSameImage(self, surf, other):
+        self.assertEqual(surf.get_size(), other.get_size())
+        for x in range(0, surf.get_width(), 4):
+            for y in range(0, surf.get_height(), 4):
+                self.assertEqual(surf.get_at((x, y)), other.get_at((x, y)), (x, y))
+
+    def draw(self, cull_rect):
+        from app.engine import engine
+        old = engine.create_surface(cull_rect[2:], transparent=True)
+        old.fill((0, 0, 0))
+        old.blit(self.tilemap.get_full_image(cull_rect), (0, 0))
+        old.blit(self.tilemap.get_foreground_image(cull_rect), (0, 0))
+        new = engine.create_surface(cull_rect[2:], transparent=True)
+        new.fill((0, 0, 0))
+        self.tilemap.blit_full_image(new, cull_rect)
+        self.tilemap.blit_foreground_image(new, cull_rect)
+        return old, new
+
+    def test_composite_matches_layers(self):
+        cull_rect = (TILEWIDTH // 2, 0, TILEWIDTH * 3, TILEHEIGHT * 2)
+        self.assertSameImage(*self.draw(cull_rect))
+        composite = self.tilemap._get_composite(False)
+
+        # Hiding a layer or turning over the autotiles rebuilds the composite
+        self.tilemap.layers.get('top').visible = False
+        self.assertSameImage(*self.draw(cull_rect))
+        self.tilemap.layers.get('top').visible = True
+        self.tilemap.layers.get('top').autotile_frame = 1
+        self.assertSameImage(*self.draw(cull_rect))
+        self.tilemap.layers.get('roof').visible = False
+        self.assertSameImage(*self.draw(cull_rect))
+        self.assertIs(composite, self.tilemap._get_composite(False))
+
+        # Fading layers are drawn the old way
+        self.tilemap.layers.get('roof').show()
+        self.assertIsNone(self.tilemap._get_composite(True))
+        self.assertIsNotNone(self.tilemap._get_composite(False))
+
+if __name__ == '__main__':
+    unittest.main()
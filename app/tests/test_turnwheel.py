@@ -93,3 +93,66 @@ class TurnwheelTests(unittest.TestCase):
         self.assertTrue(type(action_groups[0]) == ActionLog.Move)
         self.assertEqual(6, action_groups[0].begin)
         self.assertEqual(9, action_groups[0].end)
+
+    def test_incremental_action_groups(self):
+        def assert_same_groups(action_log):
+            expected = ActionLog.get_action_groups(action_log.actions, action_log._first_free_action)
+            action_log.set_up()
+            self.assertEqual(expected, action_log.action_groups)
+
+        action_log = ActionLog()
+        actions = [
+            action.MarkActionGroupStart("102", "ai"),
+            action.Action(),  # Mock
+            action.MarkActionGroupEnd("ai"),
+            action.MarkPhase('player'),
+            action.LockTurnwheel(True),
+            action.MarkActionGroupStart("Eirika", "free"),
+            action.Action(),  # Mock
+            action.MarkActionGroupEnd("free"),
+            action.MarkActionGroupStart("Franz", "free"),
+            action.Action(),  # Mock
+        ]
+        for act in actions:
+            action_log.append(act)
+            assert_same_groups(action_log)
+
+        # Truncating reopens the move that was closed by the removed actions
+        action_log.action_index = 6
+        action_log.finalize()
+        assert_same_groups(action_log)
+        self.assertEqual(ActionLog.Move("Eirika", 5, 5), action_log.action_groups[-2])
+
+        action_log.append(action.MarkActionGroupEnd("free"))
+        action_log.append(action.MarkPhase('enemy'))
+        action_log.append(action.Action())  # Mock
+        assert_same_groups(action_log)
+
+        # Keyframe lookups
+        self.assertEqual('enemy', action_log.get_current_phase())
+        self.assertTrue(action_log.get_last_lock())
+        action_log.action_index = 4
+        self.assertEqual('player', action_log.get_current_phase())
+        self.assertFalse(action_log.get_last_lock())
+
+    def test_save_compacted(self):
+        action_log = ActionLog()
+        for act in [action.MarkPhase('player'), action.LockTurnwheel(True),
+                    action.MarkActionGroupStart("Eirika", "free"), action.MarkActionGroupEnd("free"),
+                    action.MarkPhase('enemy'), action.LockTurnwheel(False)]:
+            action_log.append(act)
+        action_log.set_first_free_action()
+        action_log.append(action.MarkPhase('player'))
+        action_log.append(action.MarkActionGroupStart("Franz", "free"))
+
+        restored = ActionLog.restore(action_log.save())
+        self.assertEqual(len(action_log.actions), len(restored.actions))
+        self.assertEqual(action_log._first_free_action, restored._first_free_action)
+
+        restored = ActionLog.restore(action_log.save(compact=True))
+        # The last phase and lock before the first free action are kept
+        self.assertEqual(['LockTurnwheel', 'MarkPhase', 'LockTurnwheel', 'MarkPhase', 'MarkActionGroupStart'],
+                         [act.__class__.__name__ for act in restored.actions])
+        self.assertEqual(2, restored._first_free_action)
+        self.assertEqual('enemy', restored.actions[1].phase_name)
+        self.assertFalse(restored.get_last_lock())
@@ -0,0 +1,49 @@
+import logging
+import unittest
+
+from app.engine import headless
+
+class UnitIndexTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.runner = headless.HeadlessRunner('testing_proj')
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def check_index(self, game):
+        on_map = [unit for unit in game.units if unit.position]
+        on_field = [unit for unit in on_map if not unit.dead and not unit.is_dying and 'Tile' not in unit.tags]
+        self.assertEqual(list(game.units_on_map), on_map)
+        self.assertEqual(game.get_all_units(), on_field)
+        for team in ('player', 'enemy', 'other'):
+            self.assertEqual(game.get_team_units(team), [unit for unit in on_field if unit.team == team])
+            self.assertEqual(game.get_team_units(team, False), [unit for unit in game.units if unit.team == team])
+        for ai_group in {unit.ai_group for unit in game.units}:
+            self.assertEqual(game.get_units_in_ai_group(ai_group), [unit for unit in on_field if unit.ai_group == ai_group])
+
+    def test_index_matches_units(self):
+        from app.engine import action
+        game = self.runner.start_level('0')
+        start_turn = game.turncount
+        # Let the AI play both sides for a couple turns, checking every frame
+        for _ in range(20000):
+            if game.state.current() == 'free':
+                game.state.change('ai')
+            self.runner.step(game)
+            self.check_index(game)
+            if game.turncount - start_turn >= 2:
+                break
+        self.assertGreaterEqual(game.turncount - start_turn, 2)
+
+        unit = game.get_unit('Eirika')
+        action.do(action.ChangeTeam(unit, 'other'))
+        self.check_index(game)
+        die = action.Die(unit)
+        action.do(die)
+        self.check_index(game)
+        die.reverse()
+        self.check_index(game)
+
+if __name__ == '__main__':
+    unittest.main()
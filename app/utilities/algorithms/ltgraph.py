@@ -1,4 +1,5 @@
 from __future__ import annotations
+import heapq
 import math
 from typing import Dict, Generic, Iterable, List, Set, Tuple, TypeVar
 
@@ -42,6 +43,9 @@ class LTGraph(Generic[V, D, E]):
         self.vertices: Dict[V, LTVertex] = {}
         self.adj: Dict[V, Set[V]] = {}
         self._path_dict: Dict[V, Dict[V, List[Tuple[V, V]]]] = {}
+        # Shortest path tree from each source vertex searched so far,
+        # as each reached vertex's previous step back towards the source
+        self._path_trees: Dict[V, Dict[V, V]] = {}
         if vertices:
             for vertex in vertices:
                 self.add_vertex(vertex)
@@ -84,8 +88,7 @@ class LTGraph(Generic[V, D, E]):
 
     def has_path(self, v1: V, v2: V) -> bool:
         """Determines whether or not a path exists between the two nodes.
-        NOTE: I don't give a rat's ass about performance, but
-        if you, reader, do, turn this into bfs or use a cache or something.
+        Uses the same cache as shortest_path.
         """
         if self.shortest_path(v1, v2):
             return True
@@ -117,26 +120,13 @@ class LTGraph(Generic[V, D, E]):
         if v2 not in self._path_dict:
             self._path_dict[v2] = {}
 
-        # and run djikstra from v1 to v2
-        visited: Dict[V, float] = {}
-        prev_step: Dict[V, V] = {}
-        dist_from_v1 = {vert_id: math.inf for vert_id in self.vertices.keys()}
-        dist_from_v1[v1] = 0
-        while len(dist_from_v1.keys()) != 0:
-            min_dist = min(dist_from_v1.values())
-            min_vert = [vert for vert in dist_from_v1 if dist_from_v1[vert] == min_dist][0]
-            visited[min_vert] = min_dist
-            next_verts = self.adj[min_vert]
-            for neighbor in next_verts:
-                if neighbor not in visited.keys():
-                    neighbor_dist = min_dist + self[min_vert][neighbor].weight
-                    if neighbor_dist < dist_from_v1[neighbor]:
-                        prev_step[neighbor] = min_vert
-                        dist_from_v1[neighbor] = neighbor_dist
-            dist_from_v1.pop(min_vert)
+        # one search from v1 finds the way to every other vertex
+        if v1 not in self._path_trees:
+            self._path_trees[v1] = self._path_tree(v1)
+        prev_step = self._path_trees[v1]
 
         # does a path exist
-        if v2 not in visited.keys():
+        if v2 not in prev_step:
             self._path_dict[v1][v2] = None
             self._path_dict[v2][v1] = None
             return None
@@ -156,9 +146,37 @@ class LTGraph(Generic[V, D, E]):
         self._path_dict[v2][v1] = reverse_path
         return path
 
+    def _path_tree(self, v1: V) -> Dict[V, V]:
+        """Runs djikstra outward from v1 to every vertex it can reach.
+
+        Ties are broken in favor of the vertex added to the graph first.
+
+        Returns:
+            Dict[V, V]: Previous step on the shortest path from v1 for each reached vertex (v1 maps to itself)
+        """
+        order = {vert_id: idx for idx, vert_id in enumerate(self.vertices)}
+        prev_step: Dict[V, V] = {v1: v1}
+        dist_from_v1: Dict[V, float] = {v1: 0}
+        visited: Set[V] = set()
+        open_list = [(0, order[v1], v1)]
+        while open_list:
+            min_dist, _, min_vert = heapq.heappop(open_list)
+            if min_vert in visited:
+                continue
+            visited.add(min_vert)
+            for neighbor in self.adj[min_vert]:
+                if neighbor not in visited:
+                    neighbor_dist = min_dist + self[min_vert][neighbor].weight
+                    if neighbor_dist < dist_from_v1.get(neighbor, math.inf):
+                        prev_step[neighbor] = min_vert
+                        dist_from_v1[neighbor] = neighbor_dist
+                        heapq.heappush(open_list, (neighbor_dist, order[neighbor], neighbor))
+        return prev_step
+
     def clear_cache(self):
         # usually we want to regenerate all paths after adding nodes
         self._path_dict.clear()
+        self._path_trees.clear()
 
     def __contains__(self, value: V) -> bool:
         if value in self.vertices:
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable, Set, Tuple
+
+from app.utilities.typing import Pos
+
+@lru_cache(64)
+def _valid_mask(width: int, height: int, stride: int) -> int:
+    row_mask = (1 << width) - 1
+    mask = 0
+    for y in range(height):
+        mask |= row_mask << (y * stride)
+    return mask
+
+class GridBitmap():
+    """
+    A set of positions within some bounds, packed into a single int with one bit per tile.
+
+    Rows are `stride` bits apart. The `pad` columns between the end of one row
+    and the start of the next are always kept empty, so shifting the whole bitmap
+    by up to `pad` columns in either direction never wraps a tile into a neighboring row.
+    """
+    __slots__ = ['left', 'top', 'width', 'height', 'pad', 'stride', 'bits']
+
+    def __init__(self, bounds: Tuple[int, int, int, int], pad: int = 0, bits: int = 0):
+        self.left, self.top = bounds[0], bounds[1]
+        self.width = bounds[2] - bounds[0] + 1
+        self.height = bounds[3] - bounds[1] + 1
+        self.pad = pad
+        self.stride = self.width + pad
+        self.bits = bits
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[Pos], bounds: Tuple[int, int, int, int], pad: int = 0) -> GridBitmap:
+        """
+        Positions outside of the bounds are ignored
+        """
+        bitmap = cls(bounds, pad)
+        left, top, right, bottom = bounds
+        stride = bitmap.stride
+        bits = 0
+        for x, y in positions:
+            if left <= x <= right and top <= y <= bottom:
+                bits |= 1 << ((y - top) * stride + x - left)
+        bitmap.bits = bits
+        return bitmap
+
+    def in_bounds(self, pos: Pos) -> bool:
+        return 0 <= pos[0] - self.left < self.width and 0 <= pos[1] - self.top < self.height
+
+    def __contains__(self, pos: Pos) -> bool:
+        if not self.in_bounds(pos):
+            return False
+        return bool(self.bits >> ((pos[1] - self.top) * self.stride + pos[0] - self.left) & 1)
+
+    def __len__(self) -> int:
+        return bin(self.bits).count('1')
+
+    def __bool__(self) -> bool:
+        return bool(self.bits)
+
+    def dilate(self, offsets: Iterable[Pos]) -> GridBitmap:
+        """
+        Morphological dilation: returns the bitmap of every position that is
+        some offset away from a position in this bitmap, clipped to the bounds.
+        Every offset must be within `pad` columns.
+        """
+        bits = self.bits
+        stride = self.stride
+        result = 0
+        for dx, dy in offsets:
+            shift = dy * stride + dx
+            if shift >= 0:
+                result |= bits << shift
+            else:
+                result |= bits >> -shift
+        return GridBitmap((self.left, self.top, self.left + self.width - 1, self.top + self.height - 1),
+                          self.pad, result & _valid_mask(self.width, self.height, stride))
+
+    def to_positions(self) -> Set[Pos]:
+        positions = set()
+        bits = self.bits
+        row_mask = (1 << self.width) - 1
+        stride = self.stride
+        left, top = self.left, self.top
+        y = 0
+        while bits:
+            row = bits & row_mask
+            while row:
+                low = row & -row
+                positions.add((left + low.bit_length() - 1, top + y))
+                row ^= low
+            bits >>= stride
+            y += 1
+        return positions
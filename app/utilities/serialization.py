@@ -1,8 +1,11 @@
 
 
+import hashlib
 import json
 import os
+import shutil
 from pathlib import Path
+from typing import Dict, Iterable, Tuple
 
 def load_json(path: Path):
     if not path.exists():
@@ -19,3 +22,47 @@ def save_json(path: Path, value: str):
     with open(temp_save_loc, 'w') as serialize_file:
         json.dump(value, serialize_file, indent=4)
     os.replace(temp_save_loc, path)
+
+# Path -> (size, mtime, hash) of each file as save_json_if_changed last left it
+_saved_files: Dict[str, Tuple[int, int, bytes]] = {}
+
+def save_json_if_changed(path: Path, value) -> bool:
+    """
+    Same as save_json, but does not touch the file if it already holds exactly this value.
+    Returns whether the file was written
+    """
+    text = json.dumps(value, indent=4)
+    digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    key = os.path.abspath(path)
+    if os.path.exists(path):
+        stat = os.stat(path)
+        signature = _saved_files.get(key)
+        if signature:
+            if signature == (stat.st_size, stat.st_mtime_ns, digest):
+                return False
+        else:  # Not saved by us before, so check what is actually there
+            with open(path) as source:
+                if source.read() == text:
+                    _saved_files[key] = (stat.st_size, stat.st_mtime_ns, digest)
+                    return False
+    temp_save_loc = path.parent / (path.name + ".tmp")
+    with open(temp_save_loc, 'w') as serialize_file:
+        serialize_file.write(text)
+    os.replace(temp_save_loc, path)
+    stat = os.stat(path)
+    _saved_files[key] = (stat.st_size, stat.st_mtime_ns, digest)
+    return True
+
+def remove_other_files(directory: Path, keep: Iterable[str]):
+    """
+    Deletes everything in the directory that is not named in keep
+    """
+    keep = set(keep)
+    for name in os.listdir(directory):
+        if name in keep:
+            continue
+        path = os.path.join(directory, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
@@ -1,14 +1,56 @@
 # https://en.wikipedia.org/wiki/Linear_congruential_generator
+from functools import lru_cache
+from typing import List, Tuple
+
 from app.utilities import utils
 
+MULTIPLIER = 1103515245
+INCREMENT = 12345
+MASK = 0x7FFFFFFF
+PERIOD = MASK + 1  # Full period, so every state comes round again after this many steps
+
+@lru_cache(maxsize=256)
+def _jump_coefficients(steps: int) -> Tuple[int, int]:
+    """
+    Returns (mult, inc) such that stepping the generator steps times
+    takes state to (state * mult + inc) & MASK.
+    Composes the single step with itself by repeated squaring, so O(log steps)
+    """
+    mult, inc = 1, 0
+    step_mult, step_inc = MULTIPLIER, INCREMENT
+    while steps:
+        if steps & 1:
+            mult, inc = (mult * step_mult) & MASK, (inc * step_mult + step_inc) & MASK
+        # Doing the step twice is itself a step
+        step_mult, step_inc = (step_mult * step_mult) & MASK, (step_inc * step_mult + step_inc) & MASK
+        steps >>= 1
+    return mult, inc
+
 class LCG(object):
     def __init__(self, seed=1):
         self.state = seed
 
     def _random(self):
-        self.state = (self.state * 1103515245 + 12345) & 0x7FFFFFFF
+        self.state = (self.state * MULTIPLIER + INCREMENT) & MASK
         return self.state >> 16  # Only use the top 30..16 bits, the lower bits have a periodicity on even moduli
 
+    def jump(self, steps: int):
+        """
+        Moves the generator as though it had made steps draws.
+        Negative steps move it backwards, undoing draws
+        """
+        mult, inc = _jump_coefficients(steps % PERIOD)
+        self.state = (self.state * mult + inc) & MASK
+
+    def _randoms(self, count: int) -> List[int]:
+        state = self.state
+        values = [0] * count
+        for idx in range(count):
+            state = (state * MULTIPLIER + INCREMENT) & MASK
+            values[idx] = state >> 16
+        self.state = state
+        return values
+
     def random(self):
         return self._random() / (2147483647 >> 16)  # 0x7FFFFFFF in decimal (have to use the same top 30..16 bits)
 
@@ -16,6 +58,13 @@ class LCG(object):
         rng = self._random() % (b - a + 1)
         return rng + a
 
+    def randints(self, a, b, count: int) -> List[int]:
+        """
+        The next count values of randint(a, b), in order
+        """
+        size = b - a + 1
+        return [value % size + a for value in self._randoms(count)]
+
     def randrange(self, end):
         return self.randint(0, end - 1)
 
@@ -61,6 +110,18 @@ def get_randint(a, b):
 def get_growth():
     return r.growth_random.randint(0, 99)
 
+def get_combats(count: int) -> List[int]:
+    return r.combat_random.randints(0, 99, count)
+
+def get_growths(count: int) -> List[int]:
+    return r.growth_random.randints(0, 99, count)
+
+def jump_combat(steps: int):
+    r.combat_random.jump(steps)
+
+def jump_growth(steps: int):
+    r.growth_random.jump(steps)
+
 def get_levelup(u_id, lvl):
     # Multiply by 1024 so seed + lvl can't ever recreate the 
     # same state on a different seed with a different level
@@ -89,6 +150,12 @@ def shuffle(lst):
 def get_other(a, b):
     return r.other_random.randint(a, b)
 
+def get_others(a, b, count: int) -> List[int]:
+    return r.other_random.randints(a, b, count)
+
+def jump_other(steps: int):
+    r.other_random.jump(steps)
+
 def get_other_random_state():
     return r.other_random.state
 
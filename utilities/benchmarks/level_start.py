@@ -0,0 +1,96 @@
+"""
+Benchmark for the first frames of a chapter.
+
+Starts a level of the testing project with every image cache emptied,
+once loading everything lazily and once with the asset warmup running during
+the loading screen. Reports the slowest loading screen frame, the latency
+of the first frame after the loading screen, and how long the first
+battle animation for each unit takes to build.
+Every class borrows the project's Assassin combat animation (and its
+Archer palette), since the testing project does not give its classes
+combat animations of their own.
+
+From the main lt-maker directory:
+    python -m utilities.benchmarks.level_start
+"""
+
+import argparse
+import logging
+import time
+
+from app.engine import headless
+
+def clear_image_caches(game):
+    from app.data.resources.resources import RESOURCES
+    from app.engine import battle_animation, engine
+    for res in RESOURCES.map_sprites:
+        res.standing_image = None
+        res.moving_image = None
+    for combat_anim in RESOURCES.combat_anims:
+        for weapon_anim in combat_anim.weapon_anims:
+            weapon_anim.image = None
+    game.map_sprite_registry.clear()
+    battle_animation.battle_anim_registry.clear()
+    engine.clear_staged_images()
+
+def run(project: str, level_nid: str, warmup: bool) -> dict:
+    from app.engine import asset_warmup, battle_animation
+    from app.data.database.database import DB
+    from app.data.resources.resources import RESOURCES
+    from app.engine import config as cf
+
+    runner = headless.HeadlessRunner(project)
+    game = runner.start_level(level_nid)
+    cf.SETTINGS['animation'] = 'Always'
+    for klass in DB.classes:
+        klass.combat_anim_nid = 'Assassin'
+    RESOURCES.combat_anims.get('Assassin').palettes = [['GenericBlue', 'Archer0_GenericBlue']]
+    asset_warmup.enabled = warmup
+    clear_image_caches(game)
+
+    loading_frames = []
+    while game.state.current() == 'start_level_asset_loading':
+        start = time.perf_counter()
+        runner.step(game)
+        loading_frames.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    runner.step(game)
+    first_frame = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for unit in game.get_all_units():
+        anim = battle_animation.get_battle_anim(unit, unit.get_weapon())
+        if anim:
+            anim.reset_unit()
+    first_anims = time.perf_counter() - start
+
+    asset_warmup.enabled = True
+    return {'loading frames': len(loading_frames),
+            'slowest loading frame': max(loading_frames) * 1e3,
+            'first frame': first_frame * 1e3,
+            'first battle anims': first_anims * 1e3,
+            'first frame + anims': (first_frame + first_anims) * 1e3}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the first frames of a chapter")
+    parser.add_argument('--project', default='testing_proj')
+    parser.add_argument('--level', default='0')
+    parser.add_argument('--number', type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    headless.init(args.project)
+    results = {False: [], True: []}
+    for _ in range(args.number):
+        for warmup in (False, True):
+            results[warmup].append(run(args.project, args.level, warmup))
+
+    print("%-24s %10s %10s" % ('median (ms)', 'lazy', 'warmup'))
+    for key in results[False][0]:
+        lazy = sorted(r[key] for r in results[False])[args.number // 2]
+        warm = sorted(r[key] for r in results[True])[args.number // 2]
+        print("%-24s %10.2f %10.2f" % (key, lazy, warm))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Micro-benchmark for drawing the tilemap in MapView.
+
+Builds a synthetic map with several background layers (one with autotiles)
+and a foreground layer, and compares compositing every visible layer inside
+the camera each frame against blitting the camera's window of the cached
+composite into a reused frame buffer.
+
+From the main lt-maker directory:
+    python -m utilities.benchmarks.map_draw
+"""
+
+import argparse
+import logging
+import random
+import timeit
+
+from app.constants import AUTOTILE_FRAMES, COLORKEY, TILEHEIGHT, TILEWIDTH, WINHEIGHT, WINWIDTH
+from app.engine import headless
+
+def make_layer(tilemap, nid: str, foreground: bool, coverage: float, autotiles: bool, rng):
+    from app.engine import engine
+    from app.engine.objects.tilemap import LayerObject
+    layer = LayerObject(nid, foreground, tilemap)
+    size = (tilemap.width * TILEWIDTH, tilemap.height * TILEHEIGHT)
+    images = [engine.create_surface(size) for _ in range(1 + (AUTOTILE_FRAMES if autotiles else 0))]
+    for im in images:
+        engine.fill(im, COLORKEY)
+        engine.set_colorkey(im, COLORKEY, rleaccel=True)
+    for x in range(tilemap.width):
+        for y in range(tilemap.height):
+            if rng.random() < coverage:
+                color = (rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255))
+                rect = (x * TILEWIDTH, y * TILEHEIGHT, TILEWIDTH, TILEHEIGHT)
+                for idx, im in enumerate(images):
+                    engine.fill(im, (color[0], color[1], (color[2] + idx * 32) % 256), rect)
+    layer.image = images[0]
+    layer.autotile_images = images[1:]
+    layer.pixel_bounds = [0, 0, size[0], size[1]]
+    return layer
+
+def make_tilemap(width: int, height: int):
+    from app.engine.objects.tilemap import TileMapObject
+    from app.utilities.data import Data
+    rng = random.Random(0)
+    tilemap = TileMapObject()
+    tilemap.nid = 'benchmark'
+    tilemap.width, tilemap.height = width, height
+    tilemap.autotile_fps = 29
+    tilemap.layers = Data([make_layer(tilemap, 'base', False, 1, False, rng),
+                           make_layer(tilemap, 'water', False, 0.2, True, rng),
+                           make_layer(tilemap, 'detail', False, 0.3, False, rng),
+                           make_layer(tilemap, 'roofs', True, 0.1, False, rng)])
+    return tilemap
+
+def draw_old(tilemap, cull_rect):
+    from app.engine import engine
+    surf = engine.create_surface(cull_rect[2:])
+    surf.blit(tilemap.get_full_image(cull_rect), (0, 0))
+    surf = surf.convert_alpha()
+    surf.blit(tilemap.get_foreground_image(cull_rect), (0, 0))
+    return surf
+
+def draw_new(tilemap, cull_rect, frame_surf):
+    frame_surf.fill((0, 0, 0))
+    tilemap.blit_full_image(frame_surf, cull_rect)
+    tilemap.blit_foreground_image(frame_surf, cull_rect)
+    return frame_surf
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark drawing the tilemap")
+    parser.add_argument('--size', type=int, default=100, help="Width and height of the map in tiles")
+    parser.add_argument('--number', type=int, default=500)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    headless.init()
+    from app.engine import engine
+    tilemap = make_tilemap(args.size, args.size)
+    cull_rect = (args.size * TILEWIDTH // 2, args.size * TILEHEIGHT // 2, WINWIDTH, WINHEIGHT)
+    frame_surf = engine.create_surface(cull_rect[2:], transparent=True)
+
+    old = draw_old(tilemap, cull_rect)
+    new = draw_new(tilemap, cull_rect, frame_surf)
+    for x in range(0, WINWIDTH, 7):
+        for y in range(0, WINHEIGHT, 7):
+            assert old.get_at((x, y)) == new.get_at((x, y)), (x, y)
+
+    print("%dx%d tiles, %d layers, %dx%d camera" % (args.size, args.size, len(tilemap.layers), WINWIDTH, WINHEIGHT))
+    old_time = timeit.timeit(lambda: draw_old(tilemap, cull_rect), number=args.number) / args.number * 1e3
+    new_time = timeit.timeit(lambda: draw_new(tilemap, cull_rect, frame_surf), number=args.number) / args.number * 1e3
+    print("  per layer (ms/frame): %8.3f" % old_time)
+    print("  composite (ms/frame): %8.3f" % new_time)
+    print("  speedup:              %7.1fx" % (old_time / new_time))
+
+    # Autotiles turning over every frame is the worst case for the composite
+    def draw_turnover():
+        for layer in tilemap.layers:
+            if layer.autotile_images:
+                layer.autotile_frame = (layer.autotile_frame + 1) % len(layer.autotile_images)
+        draw_new(tilemap, cull_rect, frame_surf)
+    turnover_time = timeit.timeit(draw_turnover, number=max(args.number // 10, 1)) / max(args.number // 10, 1) * 1e3
+    print("  composite rebuild (ms/frame): %8.3f" % turnover_time)
+
+if __name__ == '__main__':
+    main()
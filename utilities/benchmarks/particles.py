@@ -0,0 +1,68 @@
+"""
+Micro-benchmark for the weather particle systems.
+
+Compares a MapParticleSystem, which updates and draws one Particle object
+at a time, against an ArrayParticleSystem for the linear weathers
+(rain, snow, sand) on a large map. Both are seeded the same, so they
+must end up with the same particles.
+
+From the main lt-maker directory:
+    python -m utilities.benchmarks.particles
+"""
+
+import argparse
+import logging
+import random
+import timeit
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.constants import TILEHEIGHT, TILEWIDTH, WINHEIGHT, WINWIDTH
+from app.engine import headless
+
+WEATHER = {'rain': ('Raindrop', .1), 'snow': ('Snow', .2), 'sand': ('Sand', .075)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the weather particle systems")
+    parser.add_argument('--size', type=int, default=60, help="Width and height of the map in tiles")
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    headless.init()
+    from app.engine import engine, particles
+    from app.engine.game_state import GameState
+
+    size = args.size
+    twidth, theight = size * TILEWIDTH, size * TILEHEIGHT
+    creation_bounds = {'rain': (-theight // 4, twidth, -16, -8),
+                       'snow': (-theight, twidth, -16, -8),
+                       'sand': (-2 * theight, twidth, theight + 16, theight + 32)}
+    surf = engine.create_surface((WINWIDTH, WINHEIGHT), transparent=True)
+    offset = (twidth // 2, theight // 2)
+    tilemap = SimpleNamespace(width=size, height=size)
+
+    print("%dx%d tiles" % (size, size))
+    print("  %-13s %10s %14s %14s %8s" % ('', 'particles', 'objects (ms)', 'arrays (ms)', 'speedup'))
+    with patch.object(GameState, 'tilemap', property(lambda self: tilemap)):
+        for nid, (particle_name, abundance) in WEATHER.items():
+            particle = getattr(particles, particle_name)
+            systems = []
+            for system_type in (particles.MapParticleSystem, particles.ArrayParticleSystem):
+                random.seed(0)
+                ps = system_type(nid, particle, abundance, creation_bounds[nid], (size, size))
+                prefill_time = timeit.timeit(ps.prefill, number=1)
+                systems.append((ps, prefill_time))
+            (old, old_prefill), (new, new_prefill) = systems
+            assert [(p.x, p.y) for p in old.particles] == list(zip(new.xs, new.ys))
+
+            def frame(ps):
+                ps.update()
+                ps.draw(surf, *offset)
+            old_time = timeit.timeit(lambda: frame(old), number=args.number) / args.number * 1e3
+            new_time = timeit.timeit(lambda: frame(new), number=args.number) / args.number * 1e3
+            print("  %-13s %10d %14.3f %14.3f %7.1fx" % (nid + ' frame', len(new.xs), old_time, new_time, old_time / new_time))
+            print("  %-13s %10s %14.3f %14.3f %7.1fx" % (nid + ' prefill', '', old_prefill * 1e3, new_prefill * 1e3, old_prefill / new_prefill))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Micro-benchmark for a free roaming unit crossing from one tile to the next.
+
+Moves a unit back and forth between two tiles near the enemies of the
+testing project, comparing the full QuickLeave, QuickArrive and
+UpdateFogOfWar actions against GameState.roam_move. The enemies' ranges
+are brought up to date once per frame, as drawing the boundary would.
+
+From the main lt-maker directory:
+    python -m utilities.benchmarks.roam_move
+"""
+
+import argparse
+import logging
+import timeit
+
+from app.engine import headless
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark free roam tile crossings")
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    from app.engine import action
+    runner = headless.HeadlessRunner('testing_proj')
+    game = runner.start_level('0')
+    runner.run_until(game, 'free')
+    unit = game.get_unit('Eirika')
+    start = unit.position
+    other = (start[0] + 1, start[1])
+    assert not game.board.get_unit(other)
+
+    def old_move():
+        pos = other if unit.position == start else start
+        action.QuickLeave(unit).do()
+        action.QuickArrive(unit, pos).do()
+        action.UpdateFogOfWar(unit).do()
+
+    def new_move():
+        pos = other if unit.position == start else start
+        game.roam_move(unit, pos)
+        game.boundary._recalculate_stale_units()
+
+    old_time = timeit.timeit(old_move, number=args.number)
+    new_time = timeit.timeit(new_move, number=args.number)
+    print("%-24s %10s %10s %8s" % ('case', 'old (ms)', 'new (ms)', 'speedup'))
+    print("%-24s %10.3f %10.3f %7.1fx" % ('tile crossing', old_time / args.number * 1e3, new_time / args.number * 1e3, old_time / new_time))
+
+if __name__ == '__main__':
+    main()
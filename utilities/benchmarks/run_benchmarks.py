@@ -0,0 +1,89 @@
+"""
+Regression benchmark suite for AI, pathfinding and combat throughput.
+
+Runs each benchmark case headlessly (see app/engine/headless.py) and compares
+against the stored baselines in baselines.json.
+
+Call counts and frame counts are deterministic for a given seed, so any change
+in them means the simulation is doing different work. Times depend on the machine,
+so they only fail when they are more than --tolerance times the baseline.
+
+From the main lt-maker directory:
+    python -m utilities.benchmarks.run_benchmarks
+    python -m utilities.benchmarks.run_benchmarks --update  # Store new baselines
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+from app.engine import headless
+
+BASELINE_FN = os.path.join(os.path.dirname(__file__), 'baselines.json')
+
+# (project, level nid, number of turns)
+CASES = [
+    ('testing_proj', '0', 4),
+]
+
+def case_name(project, level_nid, num_turns) -> str:
+    return '%s/%s/%d' % (project, level_nid, num_turns)
+
+def run_case(project, level_nid, num_turns, seed=0) -> dict:
+    runner = headless.HeadlessRunner(project, seed)
+    report = runner.run_level(level_nid, num_turns)
+    print(report.summary())
+    return {'turns': report.turns,
+            'frames': report.frames,
+            'total_time': round(report.total_time, 3),
+            'enemy_phase_time': round(report.phase_time.get('enemy', 0), 3),
+            'path_system_calls': report.total_calls('PathSystem.'),
+            'target_system_calls': report.total_calls('TargetSystem.')}
+
+def compare(name: str, baseline: dict, result: dict, tolerance: float) -> bool:
+    ok = True
+    for key in ('turns', 'frames', 'path_system_calls', 'target_system_calls'):
+        if baseline.get(key) != result[key]:
+            print("%s: %s changed from %s to %s" % (name, key, baseline.get(key), result[key]))
+            ok = False
+    for key in ('total_time', 'enemy_phase_time'):
+        if baseline.get(key) and result[key] > baseline[key] * tolerance:
+            print("%s: %s regressed from %.3f s to %.3f s" % (name, key, baseline[key], result[key]))
+            ok = False
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the headless benchmark suite")
+    parser.add_argument('--update', action='store_true', help="Overwrite the stored baselines")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="Allowed slowdown factor for times")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    baselines = {}
+    if os.path.exists(BASELINE_FN):
+        with open(BASELINE_FN) as fp:
+            baselines = json.load(fp)
+
+    results = {}
+    success = True
+    for project, level_nid, num_turns in CASES:
+        name = case_name(project, level_nid, num_turns)
+        results[name] = run_case(project, level_nid, num_turns)
+        if not args.update:
+            if name in baselines:
+                success = compare(name, baselines[name], results[name], args.tolerance) and success
+            else:
+                print("%s: no baseline stored" % name)
+
+    if args.update:
+        with open(BASELINE_FN, 'w') as fp:
+            json.dump(results, fp, indent=4)
+        print("Stored baselines in %s" % BASELINE_FN)
+    elif success:
+        print("All benchmarks match their baselines")
+    return 0 if success else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Micro-benchmark for the generated skill_system hooks.
+
+Compares the hooks generated with the per-unit hook index against the
+previous codegen, which checked every component of every skill on each call.
+Both versions are compiled from compile_skill_system and run against the same
+units from testing_proj, with extra skills added to show how the cost scales.
+
+From the main lt-maker directory:
+    python -m utilities.benchmarks.skill_hooks
+"""
+
+import argparse
+import logging
+import timeit
+
+from app.engine import headless
+
+# Hooks that run many times per combat forecast
+HOOKS = ['modify_damage', 'modify_accuracy', 'modify_avoid', 'dynamic_damage',
+         'dynamic_accuracy', 'damage_multiplier', 'vantage', 'check_enemy', 'start_combat']
+
+def compile_hooks(use_hook_index: bool) -> dict:
+    from app.engine import skill_system
+    from app.engine.component_system.compile_skill_system import SKILL_HOOKS, generate_skill_hook_str
+    namespace = dict(skill_system.__dict__)
+    for hook_name in HOOKS:
+        source = 'from __future__ import annotations\n' + \
+            generate_skill_hook_str(hook_name, SKILL_HOOKS[hook_name], use_hook_index)
+        exec(source, namespace)
+    return namespace
+
+def hook_args(hook_name: str, unit, target) -> tuple:
+    from app.engine.component_system.compile_skill_system import SKILL_HOOKS
+    item = unit.get_weapon()
+    values = {'unit': unit, 'item': item, 'target': target, 'item2': target.get_weapon(),
+              'mode': 'attack', 'attack_info': (0, 0), 'base_value': 0, 'playback': []}
+    return tuple(values[arg] for arg in SKILL_HOOKS[hook_name].args)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the generated skill hooks")
+    parser.add_argument('--extra-skills', type=int, default=20, help="Skills to add to the attacker")
+    parser.add_argument('--number', type=int, default=5000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    runner = headless.HeadlessRunner('testing_proj')
+    game = runner.start_level('0')
+    from app.data.database.database import DB
+    from app.engine import item_funcs
+
+    unit = game.get_unit('Eirika')
+    target = game.get_unit('101')
+    old_hooks = compile_hooks(use_hook_index=False)
+    new_hooks = compile_hooks(use_hook_index=True)
+
+    for num_extra in (0, args.extra_skills):
+        if num_extra:
+            for skill_prefab in list(DB.skills)[:num_extra]:
+                skill = item_funcs.create_skill(unit, skill_prefab.nid)
+                if skill:
+                    unit.add_skill(skill, unit.nid)
+        print("%s with %d skills (%d components)" %
+              (unit.nid, len(unit.skills), sum(len(skill.components) for skill in unit.skills)))
+        print("  %-20s %10s %10s %8s" % ('hook', 'old (us)', 'new (us)', 'speedup'))
+        for hook_name in HOOKS:
+            hook_args_ = hook_args(hook_name, unit, target)
+            old_hook, new_hook = old_hooks[hook_name], new_hooks[hook_name]
+            assert old_hook(*hook_args_) == new_hook(*hook_args_), hook_name
+            old_time = timeit.timeit(lambda: old_hook(*hook_args_), number=args.number) / args.number * 1e6
+            new_time = timeit.timeit(lambda: new_hook(*hook_args_), number=args.number) / args.number * 1e6
+            print("  %-20s %10.2f %10.2f %7.1fx" % (hook_name, old_time, new_time, old_time / new_time))
+
+if __name__ == '__main__':
+    main()
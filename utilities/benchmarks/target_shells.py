@@ -0,0 +1,44 @@
+"""
+Micro-benchmark for TargetSystem.get_shell on a 50x50 map.
+
+Compares building attack shells (threat maps) from Python sets against
+dilating a GridBitmap, for move sets of different sizes and weapon ranges.
+
+From the main lt-maker directory:
+    python -m utilities.benchmarks.target_shells
+"""
+
+import argparse
+import random
+import timeit
+
+from app.engine.target_system import TargetSystem
+
+BOUNDS = (0, 0, 49, 49)
+
+def diamond(center, radius) -> set:
+    x, y = center
+    return {(x + dx, y + dy) for dx in range(-radius, radius + 1) for dy in range(-radius, radius + 1)
+            if abs(dx) + abs(dy) <= radius and BOUNDS[0] <= x + dx <= BOUNDS[2] and BOUNDS[1] <= y + dy <= BOUNDS[3]}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark attack shells on a 50x50 map")
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    target_system = TargetSystem(game=True)
+    rng = random.Random(0)
+    print("%-24s %10s %10s %8s" % ('case', 'sets (ms)', 'bitmap (ms)', 'speedup'))
+    for movement in (0, 1, 3, 5, 8, 12):
+        for item_range in ({1}, {1, 2}, {1, 2, 3}, {2, 3, 4, 5}):
+            moves = diamond((rng.randint(10, 39), rng.randint(10, 39)), movement)
+            old = target_system._get_shell_from_sets(moves, item_range, BOUNDS)
+            new = target_system.get_shell_bitmap(moves, item_range, BOUNDS).to_positions()
+            assert old == new
+            old_time = timeit.timeit(lambda: target_system._get_shell_from_sets(moves, item_range, BOUNDS), number=args.number)
+            new_time = timeit.timeit(lambda: target_system.get_shell_bitmap(moves, item_range, BOUNDS).to_positions(), number=args.number)
+            name = "%d moves, range %d-%d" % (len(moves), min(item_range), max(item_range))
+            print("%-24s %10.3f %10.3f %7.1fx" % (name, old_time / args.number * 1e3, new_time / args.number * 1e3, old_time / new_time))
+
+if __name__ == '__main__':
+    main()